@@ -57,7 +57,8 @@ class DocumentClassifier:
         self,
         text: str,
         filename: str,
-        confidence_threshold: float = 0.7
+        confidence_threshold: float = 0.7,
+        no_cache: bool = False,
     ) -> ClassificationResult:
         """
         문서 분류 수행
@@ -66,6 +67,7 @@ class DocumentClassifier:
             text: 파싱된 텍스트
             filename: 파일명 (힌트로 활용)
             confidence_threshold: LLM fallback 임계값
+            no_cache: LLM 응답 캐시 우회 (재시도 시 이전 응답 재사용 방지)
 
         Returns:
             ClassificationResult
@@ -93,7 +95,7 @@ class DocumentClassifier:
                 f"[DocumentClassifier] Confidence {rule_result.confidence:.2f} < "
                 f"threshold {confidence_threshold}, using LLM fallback"
             )
-            llm_result = await self._classify_by_llm(text, filename)
+            llm_result = await self._classify_by_llm(text, filename, no_cache=no_cache)
             llm_result.processing_time_ms = int((time.time() - start_time) * 1000)
             return llm_result
 
@@ -250,13 +252,16 @@ class DocumentClassifier:
                 llm_used=False,
             )
 
-    async def _classify_by_llm(self, text: str, filename: str) -> ClassificationResult:
+    async def _classify_by_llm(
+        self, text: str, filename: str, no_cache: bool = False
+    ) -> ClassificationResult:
         """
         LLM 기반 분류 (GPT-4o-mini)
 
         Args:
             text: 문서 텍스트
             filename: 파일명
+            no_cache: LLM 응답 캐시 우회
 
         Returns:
             ClassificationResult
@@ -315,6 +320,7 @@ Base your decision on explicit evidence from the text/filename only."""
                 model=settings.OPENAI_MINI_MODEL,
                 temperature=0.1,
                 max_tokens=500,
+                no_cache=no_cache,
             )
 
             if response.error:
@@ -318,6 +318,8 @@ Rules:
                         model=settings.OPENAI_MINI_MODEL,
                         temperature=0.1,
                         max_tokens=500,
+                        # 재시도는 캐시된 이전 응답 대신 새로 생성
+                        no_cache=attempt > 0,
                     ),
                     timeout=self.timeout_seconds,
                 )
@@ -42,6 +42,7 @@ class RetrySettings(BaseModel):
     llm_max: int = Field(default=3, description="LLM API 최대 재시도")
     llm_base_delay: float = Field(default=1.0, description="LLM 재시도 기본 대기(초) - exponential backoff")
     llm_max_delay: float = Field(default=8.0, description="LLM 재시도 최대 대기(초)")
+    llm_jitter: float = Field(default=0.5, description="LLM 재시도 대기 지터 비율 (대기 * (1 + U(0, jitter)))")
 
     # Embedding
     embedding_max: int = Field(default=3, description="Embedding API 최대 재시도")
@@ -71,6 +72,31 @@ class TimeoutSettings(BaseModel):
     embedding: int = Field(default=60, description="Embedding API 타임아웃(초)")
 
 
+class RateLimitSettings(BaseModel):
+    """
+    외부 API 호출 한도 설정 그룹 (0이면 비활성화)
+
+    환경변수 오버라이드:
+    - RATE_LIMIT__EMBEDDING_RPM=5000
+    - RATE_LIMIT__EMBEDDING_TPM=5000000
+    - RATE_LIMIT__LLM_CONCURRENCY_OPENAI=64
+    - RATE_LIMIT__LLM_HTTP_MAX_CONNECTIONS=1000
+    - RATE_LIMIT__LLM_RPM=500 / RATE_LIMIT__LLM_TPM=800000
+    """
+    # Embedding (OpenAI text-embedding-3-small Tier 1 기준)
+    embedding_rpm: int = Field(default=3000, description="Embedding 분당 최대 요청 수")
+    embedding_tpm: int = Field(default=1_000_000, description="Embedding 분당 최대 토큰 수")
+
+    # LLM
+    llm_concurrency_openai: int = Field(default=32, description="OpenAI 동시 요청 수 (이벤트 루프 단위)")
+    llm_concurrency_claude: int = Field(default=16, description="Claude 동시 요청 수 (이벤트 루프 단위)")
+    llm_concurrency_gemini: int = Field(default=8, description="Gemini 동시 요청 수 (이벤트 루프 단위)")
+    llm_http_max_connections: int = Field(default=500, description="LLM SDK HTTP 연결 풀 최대 연결 수")
+    llm_http_max_keepalive: int = Field(default=200, description="LLM SDK HTTP 연결 풀 keep-alive 연결 수")
+    llm_rpm: int = Field(default=0, description="LLM 프로바이더별 분당 최대 요청 수 (계정 티어에 맞게 설정)")
+    llm_tpm: int = Field(default=0, description="LLM 프로바이더별 분당 최대 토큰 수 (프롬프트 추정 + max_tokens)")
+
+
 class ChunkSettings(BaseModel):
     """
     청킹 관련 설정 그룹
@@ -117,6 +143,12 @@ class ChunkingConfig:
     - MAX_EMBEDDING_RETRIES: 최대 재시도 횟수
     - RETRY_BASE_WAIT_SECONDS: 기본 대기 시간 (지수 백오프)
     - RETRY_MAX_WAIT_SECONDS: 최대 대기 시간
+    - EMBEDDING_RETRY_CONCURRENCY: 실패 청크 개별 재시도 동시 실행 수
+
+    배치 분할 (OpenAI embeddings 요청 한도):
+    - EMBEDDING_BATCH_MAX_INPUTS: 요청당 최대 텍스트 수
+    - EMBEDDING_BATCH_MAX_TOKENS: 요청당 최대 토큰 수
+    - EMBEDDING_BATCH_CONCURRENCY: 분할 요청 동시 실행 수
     """
     # 구조화 데이터
     MAX_STRUCTURED_CHUNK_CHARS: int = 2000
@@ -137,6 +169,12 @@ class ChunkingConfig:
     MAX_EMBEDDING_RETRIES: int = 3
     RETRY_BASE_WAIT_SECONDS: float = 1.0
     RETRY_MAX_WAIT_SECONDS: float = 10.0
+    EMBEDDING_RETRY_CONCURRENCY: int = 5
+
+    # 배치 분할 설정
+    EMBEDDING_BATCH_MAX_INPUTS: int = 96
+    EMBEDDING_BATCH_MAX_TOKENS: int = 250_000
+    EMBEDDING_BATCH_CONCURRENCY: int = 3
 
 
 # 청킹 설정 싱글톤
@@ -181,6 +219,12 @@ class Settings(BaseSettings):
     ANTHROPIC_API_KEY: str = ""
     ANTHROPIC_MODEL: str = "claude-sonnet-4-20250514"
 
+    # 적응형 모델 라우팅: 복잡도(추정 토큰 + 스키마 깊이) 이하 call_json 요청은 소형 모델 사용
+    # 0이면 비활성화 (항상 기본 모델)
+    LLM_ROUTING_MAX_COMPLEXITY: int = 0
+    GEMINI_MINI_MODEL: str = "gemini-2.5-flash"
+    ANTHROPIC_MINI_MODEL: str = "claude-3-5-haiku-20241022"
+
     # Embedding
     EMBEDDING_MODEL: str = "text-embedding-3-small"
 
@@ -239,6 +283,23 @@ class Settings(BaseSettings):
         description="GPT-4o + Gemini 병렬 호출로 분석 속도 향상"
     )
 
+    # LLM 응답 메모리 캐시 (동일 요청 재사용, MAXSIZE 0이면 저장하지 않음)
+    LLM_CACHE_MAXSIZE: int = 512
+    LLM_CACHE_TTL_SECONDS: int = 3600
+    # 이 temperature 이하 요청만 캐시 (응답이 사실상 결정적인 호출)
+    LLM_CACHE_MAX_TEMPERATURE: float = 0.1
+
+    # LLM 응답 디스크 캐시 (temperature <= 0.1 요청, 작업/재시작 간 재사용)
+    # 빈 문자열이면 비활성화, ENCRYPTION_KEY로 암호화 저장 (키 미설정 시 비활성화)
+    LLM_DISK_CACHE_DIR: str = ""
+    LLM_DISK_CACHE_TTL_SECONDS: int = 86400
+
+    # 앱 시작 시 프로바이더별 경량 요청으로 TLS/HTTP2 연결 미리 수립
+    LLM_PREWARM: bool = Field(
+        default=True,
+        description="시작 시 LLM 프로바이더 연결 예열 (첫 호출 핸드셰이크 지연 제거)"
+    )
+
     # ─────────────────────────────────────────────────
     # 로깅 설정
     # ─────────────────────────────────────────────────
@@ -273,6 +334,7 @@ class Settings(BaseSettings):
     # ─────────────────────────────────────────────────
     retry: RetrySettings = Field(default_factory=RetrySettings)
     timeout: TimeoutSettings = Field(default_factory=TimeoutSettings)
+    rate_limit: RateLimitSettings = Field(default_factory=RateLimitSettings)
     chunk: ChunkSettings = Field(default_factory=ChunkSettings)
 
     class Config:
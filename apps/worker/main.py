@@ -3,6 +3,7 @@ RAI Worker - FastAPI Entry Point
 파일 처리 파이프라인 서버
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -69,8 +70,8 @@ from agents.privacy_agent import PrivacyAgent, get_privacy_agent, PrivacyResult
 from utils.hwp_parser import HWPParser, ParseMethod
 from utils.pdf_parser import PDFParser
 from utils.docx_parser import DOCXParser
-from services.llm_manager import get_llm_manager
-from services.embedding_service import EmbeddingService, get_embedding_service, EmbeddingResult
+from services.llm_manager import get_llm_manager, close_llm_manager
+from services.embedding_service import EmbeddingService, get_embedding_service, EmbeddingResult, prewarm_tokenizer
 from services.database_service import DatabaseService, get_database_service, SaveResult
 from services.queue_service import get_queue_service, QueuedJob, DLQEntry
 from services.pdf_converter import get_pdf_converter, PDFConversionResult
@@ -89,8 +90,12 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """앱 시작/종료 시 실행"""
     logger.info(f"RAI Worker starting... (Mode: {settings.ANALYSIS_MODE})")
+    if settings.LLM_PREWARM:
+        await get_llm_manager().prewarm()
+    await asyncio.to_thread(prewarm_tokenizer)
     yield
     logger.info("RAI Worker shutting down...")
+    await close_llm_manager()
 
 
 app = FastAPI(
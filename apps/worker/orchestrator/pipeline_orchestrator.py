@@ -516,9 +516,11 @@ class PipelineOrchestrator:
                     else self.feature_flags.document_classifier_confidence_threshold
                 )
 
+                # 재시도 시 캐시된 uncertain 응답 재사용 방지
                 result = await classifier.classify(
                     text, filename,
-                    confidence_threshold=confidence_threshold
+                    confidence_threshold=confidence_threshold,
+                    no_cache=attempt > 0,
                 )
 
                 # UNCERTAIN 결과면서 재시도 가능하면 재시도
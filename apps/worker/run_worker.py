@@ -82,6 +82,10 @@ def run_worker(queues: list[str] = None, burst: bool = False, mode: str = None):
 
     queue_list = [Queue(name, connection=redis_conn) for name in queues]
 
+    # fork 전에 tiktoken 인코더 로딩 → 작업마다 BPE를 다시 읽지 않음
+    from services.embedding_service import prewarm_tokenizer
+    prewarm_tokenizer()
+
     # Windows doesn't support os.fork(), use SimpleWorker instead
     if platform.system() == "Windows":
         logger.info("Using SimpleWorker (Windows mode)")
@@ -9,26 +9,171 @@ Worker에서 직접 Supabase에 데이터 저장
 - 트랜잭션 롤백 패턴 (Compensating Transaction)
 """
 
+import functools
 import hashlib
+import json
 import logging
+import operator
 import re
-from typing import Dict, Any, List, Optional, Tuple
-from dataclasses import dataclass, field
+import threading
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+from dataclasses import asdict, dataclass, field
 from enum import Enum
 from contextlib import contextmanager
 
+import httpx
+from postgrest.exceptions import APIError
+from storage3.utils import StorageException
 from supabase import create_client, Client
 
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 from config import get_settings
+from utils.async_helpers import run_async
+from utils.ttl_cache import TTLCache
+
+# Supabase 호출 에러 (PostgREST/Storage API 에러 + 네트워크 에러)
+# 그 외 예외(프로그래밍 오류)는 삼키지 않고 그대로 전파
+DB_ERRORS: Tuple[type, ...] = (APIError, StorageException, httpx.HTTPError)
 
 # 전화번호 패턴 (중복 체크용) - 루프 외부에서 컴파일
 PHONE_PREFIX_PATTERN = re.compile(r'010[- ]?(\d{4})')
 PHONE_DIGITS_PATTERN = re.compile(r'\D')
 
+# 중복 체크 결과 캐시 (재시도/Progressive Loading 재호출 시 REST 왕복 제거)
+DUPLICATE_CACHE_MAXSIZE = 1024
+DUPLICATE_CACHE_TTL_SECONDS = 30.0
+
+# 크레딧 확인 결과 캐시 (배치 업로드 시 동일 사용자 users 조회 반복 제거)
+CREDIT_CACHE_MAXSIZE = 1024
+CREDIT_CACHE_TTL_SECONDS = 10.0
+
+# 사용자 플랜 캐시 (구독 변경 시에만 바뀌므로 크레딧 조회에서 plan 컬럼 분리)
+PLAN_CACHE_MAXSIZE = 10000
+PLAN_CACHE_TTL_SECONDS = 300.0
+
+# 플랜별 기본 크레딧 (읽기 전용)
+_BASE_CREDITS: Mapping[str, int] = MappingProxyType({
+    "starter": 50,
+    "pro": 150,
+    "enterprise": 300,
+})
+_DEFAULT_BASE_CREDITS = 50
+
+# users 크레딧 컬럼 추출 (dict.get 반복 대신 단일 C 호출)
+_CREDIT_FIELDS = operator.itemgetter("credits", "credits_used_this_month")
+
+# quick_extracted 마지막 전송값 지문 (동일 데이터 재전송 시 UPDATE 생략)
+QUICK_EXTRACTED_CACHE_MAXSIZE = 1024
+QUICK_EXTRACTED_CACHE_TTL_SECONDS = 60.0
+
+# 에러 분류 키워드 (우선순위 순서) - 단일 정규식으로 컴파일
+_ERROR_KEYWORDS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("PARSE_FAILED", ("parse", "parsing failed", "file rejected", "unsupported")),
+    ("ENCRYPTED", ("encrypt", "password", "protected")),
+    ("SCANNED_IMAGE", ("scanned", "ocr", "image only")),
+    ("TEXT_TOO_SHORT", ("too short", "text length", "minimum")),
+    ("LLM_TIMEOUT", ("timeout", "timed out")),
+    ("LLM_ERROR", ("llm", "analysis", "provider failed")),
+    ("STORAGE_ERROR", ("storage", "upload", "download")),
+    ("MISSING_REQUIRED_FIELDS", ("required", "missing", "필수")),
+)
+_ERROR_PRIORITY = {code: i for i, (code, _) in enumerate(_ERROR_KEYWORDS)}
+ERROR_KEYWORD_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{code}>{'|'.join(map(re.escape, keywords))})"
+        for code, keywords in _ERROR_KEYWORDS
+    ),
+    re.IGNORECASE,
+)
+
+# 필수 필드 검증 규칙: (누락 시 라벨, 하나라도 값이 있으면 통과하는 키들)
+# 이름 + 연락처(전화 OR 이메일) + 경력 1개 이상
+_REQUIRED_FIELD_CHECKS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("name", ("name",)),
+    ("contact", ("phone", "phone_masked", "email", "email_masked")),
+    ("careers", ("careers",)),
+)
+
+# 에러 코드 → 사용자 메시지 (읽기 전용)
+ERROR_CODES: Mapping[str, str] = MappingProxyType({
+    "PARSE_FAILED": "읽을 수 없는 파일이에요. 다른 형식(PDF, Word 등)으로 다시 업로드해 주세요.",
+    "ENCRYPTED": "비밀번호로 보호된 파일이에요. 비밀번호 해제 후 다시 업로드해 주세요.",
+    "SCANNED_IMAGE": "스캔 이미지로 된 파일이에요. 텍스트 문서를 업로드해 주세요.",
+    "TEXT_TOO_SHORT": "이력서 내용이 너무 짧아요. 파일 내용을 확인해 주세요.",
+    "LLM_TIMEOUT": "분석 시간이 오래 걸려 중단되었어요. 다시 시도해 주세요.",
+    "LLM_ERROR": "분석 중 문제가 발생했어요. 잠시 후 다시 시도해 주세요.",
+    "STORAGE_ERROR": "파일 저장에 실패했어요. 다시 시도해 주세요.",
+    "MISSING_REQUIRED_FIELDS": "이력서에서 필수 정보(이름, 연락처, 경력)를 찾을 수 없어요. 파일을 확인해 주세요.",
+    "UNKNOWN": "예상치 못한 문제가 발생했어요. 다시 시도해 주세요.",
+})
+_UNKNOWN_MESSAGE = ERROR_CODES["UNKNOWN"]
+
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
+def _compile_error_keyword_db():
+    """
+    에러 키워드 전체를 hyperscan DB 하나로 컴파일 (id = _ERROR_KEYWORDS 우선순위)
+
+    hyperscan 미설치 또는 컴파일 실패 시 None → ERROR_KEYWORD_PATTERN 사용
+    """
+    if hyperscan is None:
+        return None
+
+    expressions: List[bytes] = []
+    ids: List[int] = []
+    for priority, (_, keywords) in enumerate(_ERROR_KEYWORDS):
+        for keyword in keywords:
+            expressions.append(re.escape(keyword).encode("utf-8"))
+            ids.append(priority)
+
+    try:
+        db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+        db.compile(
+            expressions=expressions,
+            ids=ids,
+            elements=len(expressions),
+            flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH,
+        )
+        return db
+    except Exception as e:
+        logger.warning("hyperscan compile failed, using regex classifier: %s", e)
+        return None
+
+
+ERROR_KEYWORD_DB = _compile_error_keyword_db()
+# scratch 공간은 동시 스캔에 공유할 수 없으므로 스레드별로 할당
+_hyperscan_local = threading.local()
+
+
+def _scan_error_keywords(text: str) -> Optional[str]:
+    """hyperscan으로 한 번 스캔해 우선순위가 가장 높은 에러 코드 반환"""
+    scratch = getattr(_hyperscan_local, "scratch", None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(ERROR_KEYWORD_DB)
+
+    hits: List[int] = []
+
+    def on_match(priority: int, start: int, end: int, flags: int, context: Any) -> bool:
+        hits.append(priority)
+        return priority == 0  # 최우선 코드면 스캔 중단
+
+    try:
+        ERROR_KEYWORD_DB.scan(
+            text.encode("utf-8"), match_event_handler=on_match, scratch=scratch
+        )
+    except hyperscan.ScanTerminated:
+        pass
+
+    return _ERROR_KEYWORDS[min(hits)][0] if hits else None
+
+
 class DuplicateMatchType(str, Enum):
     """중복 매칭 타입 (Waterfall 순서)"""
     PHONE_HASH = "phone_hash"           # 1순위: 전화번호 해시
@@ -65,6 +210,15 @@ class SaveResult:
     parent_id: Optional[str] = None  # 이전 버전 ID
 
 
+@dataclass(slots=True, frozen=True)
+class FailureResult:
+    """파이프라인 실패 처리 결과"""
+    error_code: str
+    user_message: str
+    deleted: bool
+    restored: bool
+
+
 @dataclass
 class RollbackAction:
     """롤백 액션 정보"""
@@ -120,20 +274,48 @@ class SaveContext:
         self.committed = True
 
     def rollback(self) -> None:
-        """실패 시 보상 트랜잭션 실행 (역순으로)"""
+        """
+        실패 시 보상 트랜잭션 실행 (역순으로)
+
+        rollback_actions RPC로 전체 액션을 단일 트랜잭션에서 실행하고,
+        RPC 실패 시 액션별 REST 호출로 fallback합니다.
+        """
         if self.committed:
             return
 
+        if not self.actions:
+            return
+
+        try:
+            self.client.rpc(
+                "rollback_actions",
+                {"actions": [asdict(a) for a in reversed(self.actions)]}
+            ).execute()
+            logger.info("[Rollback] Executed %s actions via RPC", len(self.actions))
+            self.actions.clear()
+            return
+        except DB_ERRORS as e:
+            logger.warning("[Rollback] RPC failed, falling back to per-action rollback: %s", e)
+
+        self._rollback_per_action()
+
+    def _rollback_per_action(self) -> None:
+        """보상 트랜잭션 Fallback (액션별 REST 호출)"""
         for action in reversed(self.actions):
             try:
                 if action.action == "delete":
                     self.client.table(action.table).delete().eq("id", action.record_id).execute()
-                    logger.info(f"[Rollback] Deleted {action.table}:{action.record_id}")
+                    logger.info("[Rollback] Deleted %s:%s", action.table, action.record_id)
                 elif action.action == "restore" and action.previous_data:
                     self.client.table(action.table).update(action.previous_data).eq("id", action.record_id).execute()
-                    logger.info(f"[Rollback] Restored {action.table}:{action.record_id}")
-            except Exception as e:
-                logger.error(f"[Rollback] Failed to rollback {action.table}:{action.record_id}: {e}")
+                    logger.info("[Rollback] Restored %s:%s", action.table, action.record_id)
+            except DB_ERRORS as e:
+                logger.error(
+                    "[Rollback] Failed to rollback %s:%s: %s",
+                    action.table,
+                    action.record_id,
+                    e
+                )
 
         self.actions.clear()
 
@@ -155,9 +337,31 @@ class DatabaseService:
                 settings.SUPABASE_URL,
                 settings.SUPABASE_SERVICE_ROLE_KEY
             )
+        # 중복 체크 결과 캐시: key = (user_id, phone_hash, email_hash, name, phone, birth_year)
+        self._duplicate_cache = TTLCache(
+            maxsize=DUPLICATE_CACHE_MAXSIZE,
+            ttl=DUPLICATE_CACHE_TTL_SECONDS,
+        )
+        # 크레딧 확인 결과 캐시: key = user_id (차감/복구 시 무효화)
+        self._credit_cache = TTLCache(
+            maxsize=CREDIT_CACHE_MAXSIZE,
+            ttl=CREDIT_CACHE_TTL_SECONDS,
+        )
+        # 사용자 플랜 캐시: key = user_id (TTL 만료로 구독 변경 반영)
+        self._plan_cache = TTLCache(
+            maxsize=PLAN_CACHE_MAXSIZE,
+            ttl=PLAN_CACHE_TTL_SECONDS,
+        )
+        # quick_extracted 지문 캐시: key = candidate_id (다른 상태로 변경 시 무효화)
+        self._last_quick = TTLCache(
+            maxsize=QUICK_EXTRACTED_CACHE_MAXSIZE,
+            ttl=QUICK_EXTRACTED_CACHE_TTL_SECONDS,
+        )
 
-    def _normalize_phone(self, phone: Optional[str]) -> Optional[str]:
-        """전화번호 정규화 (숫자만 추출)"""
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _normalize_phone(phone: Optional[str]) -> Optional[str]:
+        """전화번호 정규화 (숫자만 추출, 순수 함수이므로 결과 캐시)"""
         if not phone:
             return None
         digits = PHONE_DIGITS_PATTERN.sub('', phone)
@@ -169,9 +373,11 @@ class DatabaseService:
             return '0' + digits[2:]
         return digits if len(digits) >= 10 else None
 
-    def _get_phone_prefix(self, phone: Optional[str]) -> Optional[str]:
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _get_phone_prefix(phone: Optional[str]) -> Optional[str]:
         """전화번호 앞 4자리 추출 (이름+전화 매칭용)"""
-        normalized = self._normalize_phone(phone)
+        normalized = DatabaseService._normalize_phone(phone)
         if normalized and len(normalized) >= 7:
             # 010 제외한 뒷 8자리 중 앞 4자리
             return normalized[3:7]
@@ -215,6 +421,9 @@ class DatabaseService:
         3순위: 이름 + 전화번호 앞4자리 매칭
         4순위: 이름 + 생년 매칭
 
+        동일 인자로 TTL(30초) 내 재호출되면 캐시된 결과를 반환합니다.
+        (에러 결과는 캐시하지 않음, save_candidate 성공 시 무효화)
+
         Args:
             user_id: 사용자 ID (같은 사용자 내에서만 중복 체크)
             phone_hash: 전화번호 SHA-256 해시
@@ -233,6 +442,28 @@ class DatabaseService:
                 confidence=0.0
             )
 
+        cache_key = (user_id, phone_hash, email_hash, name, phone, birth_year)
+        cached = self._duplicate_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        result = self._check_duplicate_uncached(
+            user_id, phone_hash, email_hash, name, phone, birth_year
+        )
+        if not result.has_error:
+            self._duplicate_cache.set(cache_key, result)
+        return result
+
+    def _check_duplicate_uncached(
+        self,
+        user_id: str,
+        phone_hash: Optional[str],
+        email_hash: Optional[str],
+        name: Optional[str],
+        phone: Optional[str],
+        birth_year: Optional[int],
+    ) -> DuplicateCheckResult:
+        """Waterfall 중복 체크 본체 (캐시 미사용)"""
         try:
             # 1순위: 전화번호 해시
             if phone_hash:
@@ -244,7 +475,7 @@ class DatabaseService:
 
                 if result.data and len(result.data) > 0:
                     existing = result.data[0]
-                    logger.info(f"Duplicate found by phone_hash: {existing['id']}")
+                    logger.info("Duplicate found by phone_hash: %s", existing['id'])
                     return DuplicateCheckResult(
                         is_duplicate=True,
                         match_type=DuplicateMatchType.PHONE_HASH,
@@ -263,7 +494,7 @@ class DatabaseService:
 
                 if result.data and len(result.data) > 0:
                     existing = result.data[0]
-                    logger.info(f"Duplicate found by email_hash: {existing['id']}")
+                    logger.info("Duplicate found by email_hash: %s", existing['id'])
                     return DuplicateCheckResult(
                         is_duplicate=True,
                         match_type=DuplicateMatchType.EMAIL_HASH,
@@ -282,6 +513,7 @@ class DatabaseService:
                 ).eq("user_id", user_id).eq("is_latest", True).execute()
 
                 if result.data:
+                    my_prefix = self._get_phone_prefix(phone)
                     for candidate in result.data:
                         # 마스킹된 전화번호에서 앞부분 추출 (010-1234-****)
                         masked_phone = candidate.get('phone_masked', '')
@@ -292,12 +524,14 @@ class DatabaseService:
                             match = PHONE_PREFIX_PATTERN.search(masked_phone)
                             if match:
                                 cand_prefix = match.group(1)
-                                my_prefix = self._get_phone_prefix(phone)
                                 # 이름 비교 (정규화)
                                 if (cand_prefix == my_prefix and
                                     cand_name and name and
                                     ''.join(cand_name.split()).lower() == ''.join(name.split()).lower()):
-                                    logger.info(f"Duplicate found by name+phone prefix: {candidate['id']}")
+                                    logger.info(
+                                        "Duplicate found by name+phone prefix: %s",
+                                        candidate['id']
+                                    )
                                     return DuplicateCheckResult(
                                         is_duplicate=True,
                                         match_type=DuplicateMatchType.NAME_PHONE_PREFIX,
@@ -320,7 +554,7 @@ class DatabaseService:
                     for candidate in result.data:
                         cand_name = candidate.get('name', '')
                         if cand_name and ''.join(cand_name.split()).lower() == normalized_name:
-                            logger.info(f"Duplicate found by name+birth_year: {candidate['id']}")
+                            logger.info("Duplicate found by name+birth_year: %s", candidate['id'])
                             return DuplicateCheckResult(
                                 is_duplicate=True,
                                 match_type=DuplicateMatchType.NAME_BIRTH,
@@ -336,8 +570,8 @@ class DatabaseService:
                 confidence=0.0
             )
 
-        except Exception as e:
-            logger.error(f"Duplicate check failed: {e}", exc_info=True)
+        except DB_ERRORS as e:
+            logger.error("Duplicate check failed: %s", e, exc_info=True)
             # 오류 시 에러 정보를 포함하여 반환 (호출자가 적절히 처리)
             return DuplicateCheckResult(
                 is_duplicate=False,
@@ -371,14 +605,14 @@ class DatabaseService:
             ).eq("id", existing_candidate_id).single().execute()
 
             if not check_result.data:
-                logger.warning(f"Candidate not found: {existing_candidate_id}")
+                logger.warning("Candidate not found: %s", existing_candidate_id)
                 return False, "Candidate not found"
 
             if not check_result.data.get("is_latest"):
                 # 이미 다른 요청에서 업데이트됨 (Race Condition 감지)
                 logger.warning(
-                    f"Version stacking race condition detected: {existing_candidate_id} "
-                    f"already marked as old version"
+                    "Version stacking race condition detected: %s already marked as old version",
+                    existing_candidate_id
                 )
                 return False, "Race condition: candidate already updated"
 
@@ -395,19 +629,18 @@ class DatabaseService:
 
             if verify_result.data and verify_result.data.get("is_latest") == False:
                 logger.info(
-                    f"Version stacking: {existing_candidate_id} marked as old version "
-                    f"(match_type: {match_type.value})"
+                    "Version stacking: %s marked as old version (match_type: %s)",
+                    existing_candidate_id,
+                    match_type.value
                 )
                 return True, None
             else:
                 # 업데이트 실패 (다른 요청이 동시에 처리함)
-                logger.warning(
-                    f"Version stacking verification failed: {existing_candidate_id}"
-                )
+                logger.warning("Version stacking verification failed: %s", existing_candidate_id)
                 return False, "Version stacking verification failed"
 
-        except Exception as e:
-            logger.error(f"Version stacking failed: {e}", exc_info=True)
+        except DB_ERRORS as e:
+            logger.error("Version stacking failed: %s", e, exc_info=True)
             return False, str(e)
 
     def save_candidate(
@@ -464,18 +697,19 @@ class DatabaseService:
 
             # 중복 체크에 필요한 데이터 추출
             orig = original_data or analyzed_data
-            dup_result = self.check_duplicate(
-                user_id=user_id,
-                phone_hash=hash_store.get("phone"),
-                email_hash=hash_store.get("email"),
-                name=orig.get("name"),
-                phone=orig.get("phone"),
-                birth_year=orig.get("birth_year"),
+            dup_cache_key = (
+                user_id,
+                hash_store.get("phone"),
+                hash_store.get("email"),
+                orig.get("name"),
+                orig.get("phone"),
+                orig.get("birth_year"),
             )
+            dup_result = self.check_duplicate(*dup_cache_key)
 
             # 중복 체크 에러 시 저장 중단 (데이터 무결성 보장)
             if dup_result.has_error:
-                logger.error(f"Duplicate check error, aborting save: {dup_result.error}")
+                logger.error("Duplicate check error, aborting save: %s", dup_result.error)
                 return SaveResult(
                     success=False,
                     error=f"Duplicate check failed: {dup_result.error}"
@@ -486,8 +720,10 @@ class DatabaseService:
                 is_update = True
                 existing_candidate_id = dup_result.existing_candidate_id
                 logger.info(
-                    f"Duplicate detected: will overwrite {dup_result.existing_candidate_name} "
-                    f"(match: {dup_result.match_type.value}, confidence: {dup_result.confidence})"
+                    "Duplicate detected: will overwrite %s (match: %s, confidence: %s)",
+                    dup_result.existing_candidate_name,
+                    dup_result.match_type.value,
+                    dup_result.confidence
                 )
 
             # ─────────────────────────────────────────────────
@@ -581,18 +817,18 @@ class DatabaseService:
                         self.client.table("candidates").delete().eq(
                             "id", candidate_id
                         ).execute()
-                        logger.info(f"Deleted temporary candidate record: {candidate_id}")
+                        logger.info("Deleted temporary candidate record: %s", candidate_id)
                     except Exception as del_error:
-                        logger.warning(f"Failed to delete temporary candidate: {del_error}")
+                        logger.warning("Failed to delete temporary candidate: %s", del_error)
 
-                logger.info(f"Updated existing candidate: {final_candidate_id}")
+                logger.info("Updated existing candidate: %s", final_candidate_id)
             elif candidate_id:
                 # candidate_id가 미리 제공된 경우 (업로드 시 생성됨) UPDATE
                 result = self.client.table("candidates").update(
                     candidate_record
                 ).eq("id", candidate_id).execute()
                 final_candidate_id = candidate_id
-                logger.info(f"Updated candidate: {final_candidate_id}")
+                logger.info("Updated candidate: %s", final_candidate_id)
             else:
                 # 새 레코드 삽입
                 result = self.client.table("candidates").insert(candidate_record).execute()
@@ -600,7 +836,7 @@ class DatabaseService:
                     final_candidate_id = result.data[0].get("id")
                     # 새로 생성된 레코드 추적 (롤백 시 삭제)
                     ctx.track_insert("candidates", final_candidate_id)
-                    logger.info(f"Inserted new candidate: {final_candidate_id}")
+                    logger.info("Inserted new candidate: %s", final_candidate_id)
                 else:
                     ctx.rollback()
                     return SaveResult(
@@ -611,6 +847,9 @@ class DatabaseService:
             # 트랜잭션 성공
             ctx.commit()
 
+            # 방금 저장한 후보자가 이후 업로드의 중복 체크에 보이도록 캐시 무효화
+            self._duplicate_cache.pop(dup_cache_key)
+
             return SaveResult(
                 success=True,
                 candidate_id=final_candidate_id,
@@ -619,7 +858,7 @@ class DatabaseService:
             )
 
         except Exception as e:
-            logger.error(f"Failed to save candidate: {e}")
+            logger.error("Failed to save candidate: %s", e)
             # 실패 시 롤백
             ctx.rollback()
             return SaveResult(
@@ -649,10 +888,10 @@ class DatabaseService:
             ).execute()
 
             deleted_count = len(result.data) if result.data else 0
-            logger.info(f"[DB] Deleted {deleted_count} chunks for candidate {candidate_id}")
+            logger.info("[DB] Deleted %s chunks for candidate %s", deleted_count, candidate_id)
             return True
-        except Exception as e:
-            logger.error(f"Failed to delete candidate chunks: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to delete candidate chunks: %s", e)
             return False
 
     def save_chunks_with_embeddings(
@@ -712,18 +951,23 @@ class DatabaseService:
                         if item.get("id"):
                             saved_chunk_ids.append(item["id"])
 
-            logger.info(f"Saved {saved_count}/{len(chunks)} chunks for candidate {candidate_id}")
+            logger.info(
+                "Saved %s/%s chunks for candidate %s",
+                saved_count,
+                len(chunks),
+                candidate_id
+            )
             return saved_count
 
         except Exception as e:
-            logger.error(f"Failed to save chunks: {e}")
+            logger.error("Failed to save chunks: %s", e)
             # 실패 시 저장된 청크 롤백
             if saved_chunk_ids:
                 try:
                     self.client.table("candidate_chunks").delete().in_("id", saved_chunk_ids).execute()
-                    logger.info(f"[Rollback] Deleted {len(saved_chunk_ids)} chunks")
+                    logger.info("[Rollback] Deleted %s chunks", len(saved_chunk_ids))
                 except Exception as rollback_error:
-                    logger.error(f"[Rollback] Failed to delete chunks: {rollback_error}")
+                    logger.error("[Rollback] Failed to delete chunks: %s", rollback_error)
             return 0
 
     def update_job_status(
@@ -765,8 +1009,8 @@ class DatabaseService:
             self.client.table("processing_jobs").update(update_data).eq("id", job_id).execute()
             return True
 
-        except Exception as e:
-            logger.error(f"Failed to update job status: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to update job status: %s", e)
             return False
 
     def update_candidate_status(
@@ -790,23 +1034,20 @@ class DatabaseService:
             return False
 
         try:
+            self._last_quick.pop(candidate_id)
             update_data: Dict[str, Any] = {"status": status}
 
             if quick_extracted:
                 update_data["quick_extracted"] = quick_extracted
 
-            # 단계별 타임스탬프 설정
-            if status == "parsed":
-                update_data["parsing_completed_at"] = "now()"
-            elif status in ["analyzed", "completed"]:
-                update_data["analysis_completed_at"] = "now()"
+            # 단계별 타임스탬프(parsing/analysis_completed_at)는 DB 트리거가 기록
 
             self.client.table("candidates").update(update_data).eq("id", candidate_id).execute()
-            logger.info(f"[DB] Candidate {candidate_id} status updated to: {status}")
+            logger.info("[DB] Candidate %s status updated to: %s", candidate_id, status)
             return True
 
-        except Exception as e:
-            logger.error(f"Failed to update candidate status: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to update candidate status: %s", e)
             return False
 
     def deduct_credit(self, user_id: str, candidate_id: Optional[str] = None) -> bool:
@@ -815,7 +1056,7 @@ class DatabaseService:
 
         PRD 요구사항:
         - deduct_credit() SQL 함수 호출
-        - credit_transactions 테이블에 기록
+        - credit_transactions 테이블에 기록 (SQL 함수에서 차감과 같은 트랜잭션으로 처리)
 
         Returns:
             성공 여부
@@ -823,6 +1064,9 @@ class DatabaseService:
         if not self.client:
             return False
 
+        # 차감 결과와 무관하게 잔액이 바뀔 수 있으므로 캐시 무효화
+        self._credit_cache.pop(user_id)
+
         try:
             # SQL 함수 deduct_credit 호출 (001 migration에 정의됨)
             # 이 함수는 credits를 먼저 차감하고, 부족하면 credits_used_this_month 증가
@@ -831,126 +1075,104 @@ class DatabaseService:
             if result.data is not None:
                 success = result.data
                 if success:
-                    # 트랜잭션 로깅
-                    self._log_credit_transaction(
-                        user_id=user_id,
-                        transaction_type="usage",
-                        amount=-1,
-                        description="이력서 분석",
-                        candidate_id=candidate_id
-                    )
-                    logger.info(f"Credit deducted for user {user_id}")
+                    # credit_transactions 기록은 deduct_credit 함수 내부에서 처리됨
+                    logger.info("Credit deducted for user %s", user_id)
                     return True
                 else:
-                    logger.warning(f"Credit deduction failed for user {user_id} - insufficient credits")
+                    logger.warning(
+                        "Credit deduction failed for user %s - insufficient credits",
+                        user_id
+                    )
                     return False
 
             return False
 
-        except Exception as e:
-            logger.error(f"Failed to deduct credit: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to deduct credit: %s", e)
             # Fallback: 기존 방식으로 시도
             return self._deduct_credit_fallback(user_id, candidate_id)
 
     def _deduct_credit_fallback(self, user_id: str, candidate_id: Optional[str] = None) -> bool:
-        """크레딧 차감 Fallback (RPC 실패 시)"""
-        try:
-            result = self.client.table("users").select(
-                "credits, credits_used_this_month"
-            ).eq("id", user_id).single().execute()
-
-            if result.data:
-                credits = result.data.get("credits", 0)
-                used = result.data.get("credits_used_this_month", 0)
-
-                # 우선 추가 크레딧에서 차감
-                if credits > 0:
-                    self.client.table("users").update({
-                        "credits": credits - 1
-                    }).eq("id", user_id).execute()
-                else:
-                    # 기본 크레딧 사용량 증가
-                    self.client.table("users").update({
-                        "credits_used_this_month": used + 1
-                    }).eq("id", user_id).execute()
-
-                # 트랜잭션 로깅
-                self._log_credit_transaction(
-                    user_id=user_id,
-                    transaction_type="usage",
-                    amount=-1,
-                    description="이력서 분석 (fallback)",
-                    candidate_id=candidate_id
-                )
-                return True
-
-            return False
-        except Exception as e:
-            logger.error(f"Fallback credit deduction failed: {e}")
-            return False
+        """
+        크레딧 차감 Fallback (RPC 실패 시)
 
-    def _log_credit_transaction(
-        self,
-        user_id: str,
-        transaction_type: str,
-        amount: int,
-        description: str,
-        candidate_id: Optional[str] = None
-    ) -> None:
-        """credit_transactions 테이블에 기록"""
+        deduct_credit_and_log RPC 한 번으로 차감 + 트랜잭션 기록을 처리합니다.
+        """
         try:
-            # 현재 잔액 조회
-            result = self.client.table("users").select("credits").eq("id", user_id).single().execute()
-            balance_after = result.data.get("credits", 0) if result.data else 0
+            result = self.client.rpc(
+                "deduct_credit_and_log",
+                {
+                    "p_user_id": user_id,
+                    "p_amount": 1,
+                    "p_description": "이력서 분석 (fallback)",
+                    "p_candidate_id": candidate_id,
+                }
+            ).execute()
 
-            self.client.table("credit_transactions").insert({
-                "user_id": user_id,
-                "type": transaction_type,
-                "amount": amount,
-                "balance_after": balance_after,
-                "description": description,
-                "candidate_id": candidate_id
-            }).execute()
-        except Exception as e:
-            logger.error(f"Failed to log credit transaction: {e}")
+            # 사용자가 없으면 NULL 반환
+            return result.data is not None
+        except DB_ERRORS as e:
+            logger.error("Fallback credit deduction failed: %s", e)
+            return False
 
     def check_credit_available(self, user_id: str) -> bool:
         """
         크레딧 사용 가능 여부 확인
 
+        배치 업로드 시 동일 사용자 조회가 반복되므로 짧은 TTL(10초)로 캐시합니다.
+        (deduct_credit / release_credit 호출 시 무효화)
+
         Returns:
             True if credits available, False otherwise
         """
         if not self.client:
             return False
 
-        try:
-            result = self.client.table("users").select(
-                "credits, credits_used_this_month, plan"
-            ).eq("id", user_id).single().execute()
+        cached = self._credit_cache.get(user_id)
+        if cached is not None:
+            return cached
 
-            if result.data:
-                credits = result.data.get("credits", 0)
-                used = result.data.get("credits_used_this_month", 0)
-                plan = result.data.get("plan", "starter")
-
-                # 플랜별 기본 크레딧
-                base_credits = {
-                    "starter": 50,
-                    "pro": 150,
-                    "enterprise": 300
-                }
+        available = self._check_credit_available_uncached(user_id)
+        if available is not None:
+            self._credit_cache.set(user_id, available)
+        return bool(available)
+
+    def _check_credit_available_uncached(self, user_id: str) -> Optional[bool]:
+        """
+        크레딧 확인 본체 (조회 실패 시 None)
+
+        플랜이 캐시되어 있으면 credits, credits_used_this_month만 조회하고,
+        캐시 미스일 때만 plan을 함께 가져와 캐시를 채웁니다.
+        """
+        try:
+            plan = self._plan_cache.get(user_id)
+            columns = "credits, credits_used_this_month"
+            if plan is None:
+                columns += ", plan"
 
-                base = base_credits.get(plan, 50)
+            # maybe_single: 사용자가 없으면 406 에러 대신 None 반환
+            result = self.client.table("users").select(
+                columns
+            ).eq("id", user_id).maybe_single().execute()
+
+            if result and result.data:
+                credits, used = _CREDIT_FIELDS(result.data)
+                credits = credits or 0
+                used = used or 0
+                if plan is None:
+                    plan = result.data["plan"] or "starter"
+                    self._plan_cache.set(user_id, plan)
+
+                base = _BASE_CREDITS.get(plan, _DEFAULT_BASE_CREDITS)
                 remaining = (base - used) + credits
 
                 return remaining > 0
 
             return False
 
-        except Exception as e:
-            logger.error(f"Failed to check credit: {e}")
-            return False
+        except DB_ERRORS as e:
+            logger.error("Failed to check credit: %s", e)
+            return None
 
     def upload_converted_pdf(
         self,
@@ -984,11 +1206,15 @@ class DatabaseService:
                 file_options={"content-type": "application/pdf", "upsert": "true"}
             )
 
-            logger.info(f"[PDFUpload] Uploaded converted PDF: {file_path} ({len(pdf_bytes)} bytes)")
+            logger.info(
+                "[PDFUpload] Uploaded converted PDF: %s (%s bytes)",
+                file_path,
+                len(pdf_bytes)
+            )
             return file_path
 
-        except Exception as e:
-            logger.error(f"Failed to upload converted PDF: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to upload converted PDF: %s", e)
             return None
 
     def update_candidate_pdf_url(
@@ -1014,11 +1240,11 @@ class DatabaseService:
                 "pdf_url": pdf_url
             }).eq("id", candidate_id).execute()
 
-            logger.info(f"[DB] Updated pdf_url for candidate {candidate_id}")
+            logger.info("[DB] Updated pdf_url for candidate %s", candidate_id)
             return True
 
-        except Exception as e:
-            logger.error(f"Failed to update candidate pdf_url: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to update candidate pdf_url: %s", e)
             return False
 
     def upload_image_to_storage(
@@ -1058,11 +1284,11 @@ class DatabaseService:
 
             # Public URL 생성
             public_url = self.client.storage.from_("resumes").get_public_url(file_path)
-            logger.info(f"Uploaded {image_type} for candidate {candidate_id}")
+            logger.info("Uploaded %s for candidate %s", image_type, candidate_id)
             return public_url
 
-        except Exception as e:
-            logger.error(f"Failed to upload image: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to upload image: %s", e)
             return None
 
     def update_candidate_images(
@@ -1101,13 +1327,15 @@ class DatabaseService:
             ).execute()
 
             logger.info(
-                f"Updated images for candidate {candidate_id}: "
-                f"photo={bool(photo_url)}, thumbnail={bool(portfolio_thumbnail_url)}"
+                "Updated images for candidate %s: photo=%s, thumbnail=%s",
+                candidate_id,
+                bool(photo_url),
+                bool(portfolio_thumbnail_url)
             )
             return True
 
-        except Exception as e:
-            logger.error(f"Failed to update candidate images: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to update candidate images: %s", e)
             return False
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1136,6 +1364,8 @@ class DatabaseService:
             logger.error("[CreditRelease] Supabase client not initialized")
             return False
 
+        self._credit_cache.pop(user_id)
+
         try:
             # release_credit_reservation RPC 호출
             result = self.client.rpc(
@@ -1147,14 +1377,14 @@ class DatabaseService:
             ).execute()
 
             if result.data is True:
-                logger.info(f"[CreditRelease] Credit restored for user {user_id}, job {job_id}")
+                logger.info("[CreditRelease] Credit restored for user %s, job %s", user_id, job_id)
                 return True
             else:
-                logger.warning(f"[CreditRelease] Failed to restore credit: {result.data}")
+                logger.warning("[CreditRelease] Failed to restore credit: %s", result.data)
                 return False
 
-        except Exception as e:
-            logger.error(f"[CreditRelease] Exception: {e}", exc_info=True)
+        except DB_ERRORS as e:
+            logger.error("[CreditRelease] Exception: %s", e, exc_info=True)
             return False
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -1201,7 +1431,7 @@ class DatabaseService:
             ).eq("user_id", user_id).eq("status", "open").execute()
 
             if not positions_result.data:
-                logger.info(f"[AutoMatch] No active positions found for user {user_id}")
+                logger.info("[AutoMatch] No active positions found for user %s", user_id)
                 return {
                     "success": True,
                     "matched_positions": 0,
@@ -1231,19 +1461,24 @@ class DatabaseService:
                     if result.data is not None:
                         matched_positions += 1
                         logger.info(
-                            f"[AutoMatch] Position {position_id} re-matched: "
-                            f"{result.data} candidates"
+                            "[AutoMatch] Position %s re-matched: %s candidates",
+                            position_id,
+                            result.data
                         )
                 except Exception as pos_error:
                     logger.warning(
-                        f"[AutoMatch] Failed to match position {position_id}: {pos_error}"
+                        "[AutoMatch] Failed to match position %s: %s",
+                        position_id,
+                        pos_error
                     )
                     # 개별 Position 실패는 전체 실패로 처리하지 않음
                     continue
 
             logger.info(
-                f"[AutoMatch] Completed for candidate {candidate_id}: "
-                f"{matched_positions}/{total_positions} positions matched"
+                "[AutoMatch] Completed for candidate %s: %s/%s positions matched",
+                candidate_id,
+                matched_positions,
+                total_positions
             )
 
             return {
@@ -1254,7 +1489,7 @@ class DatabaseService:
             }
 
         except Exception as e:
-            logger.error(f"[AutoMatch] Failed: {e}", exc_info=True)
+            logger.error("[AutoMatch] Failed: %s", e, exc_info=True)
             return {
                 "success": False,
                 "matched_positions": 0,
@@ -1279,6 +1514,8 @@ class DatabaseService:
         - 정규식으로 추출한 기본 정보 저장
         - UI에서 즉시 표시 가능
 
+        파서가 같은 부분 데이터를 다시 보내면 (TTL 60초 내) UPDATE를 생략합니다.
+
         Args:
             candidate_id: 후보자 ID
             quick_data: 빠른 추출 결과 {name, phone, email, last_company, last_position}
@@ -1290,13 +1527,15 @@ class DatabaseService:
             logger.error("Supabase client not initialized")
             return False
 
-        try:
-            from datetime import datetime
+        fingerprint = hash(json.dumps(quick_data, sort_keys=True, ensure_ascii=False, default=str))
+        if self._last_quick.get(candidate_id) == fingerprint:
+            return True
 
+        try:
+            # parsing_completed_at은 status 전이 시 DB 트리거가 기록
             update_data: Dict[str, Any] = {
                 "status": "parsed",
                 "quick_extracted": quick_data,
-                "parsing_completed_at": datetime.utcnow().isoformat(),
             }
 
             # 추출된 필드가 있으면 메인 필드에도 반영 (UI 표시용)
@@ -1312,17 +1551,18 @@ class DatabaseService:
             ).eq("id", candidate_id).execute()
 
             if result.data:
+                self._last_quick.set(candidate_id, fingerprint)
                 logger.info(
-                    f"[Progressive] Candidate {candidate_id} updated to 'parsed' status "
-                    f"with quick_extracted data"
+                    "[Progressive] Candidate %s updated to 'parsed' status with quick_extracted data",
+                    candidate_id
                 )
                 return True
 
-            logger.warning(f"[Progressive] No data returned for candidate {candidate_id}")
+            logger.warning("[Progressive] No data returned for candidate %s", candidate_id)
             return False
 
-        except Exception as e:
-            logger.error(f"Failed to update quick_extracted: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to update quick_extracted: %s", e)
             return False
 
     def update_candidate_analyzed(
@@ -1347,11 +1587,10 @@ class DatabaseService:
             return False
 
         try:
-            from datetime import datetime
-
+            self._last_quick.pop(candidate_id)
+            # analysis_completed_at은 status 전이 시 DB 트리거가 기록
             update_data = {
                 "status": "analyzed",
-                "analysis_completed_at": datetime.utcnow().isoformat(),
             }
 
             result = self.client.table("candidates").update(
@@ -1359,16 +1598,14 @@ class DatabaseService:
             ).eq("id", candidate_id).execute()
 
             if result.data:
-                logger.info(
-                    f"[Progressive] Candidate {candidate_id} updated to 'analyzed' status"
-                )
+                logger.info("[Progressive] Candidate %s updated to 'analyzed' status", candidate_id)
                 return True
 
-            logger.warning(f"[Progressive] No data returned for candidate {candidate_id}")
+            logger.warning("[Progressive] No data returned for candidate %s", candidate_id)
             return False
 
-        except Exception as e:
-            logger.error(f"Failed to update analyzed status: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to update analyzed status: %s", e)
             return False
 
 
@@ -1376,45 +1613,33 @@ class DatabaseService:
     # 실패 처리 (Soft Delete, 복원, 검증)
     # ─────────────────────────────────────────────────
 
-    # 에러 코드 정의
-    ERROR_CODES = {
-        "PARSE_FAILED": "읽을 수 없는 파일이에요. 다른 형식(PDF, Word 등)으로 다시 업로드해 주세요.",
-        "ENCRYPTED": "비밀번호로 보호된 파일이에요. 비밀번호 해제 후 다시 업로드해 주세요.",
-        "SCANNED_IMAGE": "스캔 이미지로 된 파일이에요. 텍스트 문서를 업로드해 주세요.",
-        "TEXT_TOO_SHORT": "이력서 내용이 너무 짧아요. 파일 내용을 확인해 주세요.",
-        "LLM_TIMEOUT": "분석 시간이 오래 걸려 중단되었어요. 다시 시도해 주세요.",
-        "LLM_ERROR": "분석 중 문제가 발생했어요. 잠시 후 다시 시도해 주세요.",
-        "STORAGE_ERROR": "파일 저장에 실패했어요. 다시 시도해 주세요.",
-        "MISSING_REQUIRED_FIELDS": "이력서에서 필수 정보(이름, 연락처, 경력)를 찾을 수 없어요. 파일을 확인해 주세요.",
-        "UNKNOWN": "예상치 못한 문제가 발생했어요. 다시 시도해 주세요.",
-    }
+    # 에러 코드 정의 (읽기 전용, 모듈 레벨 ERROR_CODES 참조)
+    ERROR_CODES = ERROR_CODES
 
     def classify_error(self, technical_error: str) -> str:
-        """기술적 에러를 에러 코드로 분류"""
-        error_lower = technical_error.lower()
-
-        if any(kw in error_lower for kw in ["parse", "parsing failed", "file rejected", "unsupported"]):
-            return "PARSE_FAILED"
-        if any(kw in error_lower for kw in ["encrypt", "password", "protected"]):
-            return "ENCRYPTED"
-        if any(kw in error_lower for kw in ["scanned", "ocr", "image only"]):
-            return "SCANNED_IMAGE"
-        if any(kw in error_lower for kw in ["too short", "text length", "minimum"]):
-            return "TEXT_TOO_SHORT"
-        if any(kw in error_lower for kw in ["timeout", "timed out"]):
-            return "LLM_TIMEOUT"
-        if any(kw in error_lower for kw in ["llm", "analysis", "provider failed"]):
-            return "LLM_ERROR"
-        if any(kw in error_lower for kw in ["storage", "upload", "download"]):
-            return "STORAGE_ERROR"
-        if any(kw in error_lower for kw in ["required", "missing", "필수"]):
-            return "MISSING_REQUIRED_FIELDS"
-
-        return "UNKNOWN"
+        """
+        기술적 에러를 에러 코드로 분류
+
+        텍스트를 한 번만 스캔하고, 여러 키워드가 매칭되면
+        _ERROR_KEYWORDS 우선순위가 가장 높은 코드를 반환합니다.
+        hyperscan이 설치되어 있으면 DFA 스캔, 아니면 정규식을 사용합니다.
+        """
+        if ERROR_KEYWORD_DB is not None:
+            return _scan_error_keywords(technical_error) or "UNKNOWN"
+
+        best: Optional[str] = None
+        for match in ERROR_KEYWORD_PATTERN.finditer(technical_error):
+            code = match.lastgroup
+            if best is None or _ERROR_PRIORITY[code] < _ERROR_PRIORITY[best]:
+                best = code
+                if _ERROR_PRIORITY[code] == 0:
+                    break
+
+        return best or "UNKNOWN"
 
     def get_user_message(self, error_code: str) -> str:
         """에러 코드를 사용자 메시지로 변환"""
-        return self.ERROR_CODES.get(error_code, self.ERROR_CODES["UNKNOWN"])
+        return ERROR_CODES.get(error_code, _UNKNOWN_MESSAGE)
 
     def check_required_fields(self, data: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """
@@ -1425,24 +1650,12 @@ class DatabaseService:
         Returns:
             (성공 여부, 누락된 필드 목록)
         """
-        missing = []
-
-        # 이름 필수
-        if not data.get("name"):
-            missing.append("name")
-
-        # 연락처 (전화 OR 이메일 중 하나)
-        has_phone = bool(data.get("phone") or data.get("phone_masked"))
-        has_email = bool(data.get("email") or data.get("email_masked"))
-        if not has_phone and not has_email:
-            missing.append("contact")
-
-        # 경력 (careers 배열에 1개 이상)
-        careers = data.get("careers", [])
-        if not careers or len(careers) == 0:
-            missing.append("careers")
-
-        return (len(missing) == 0, missing)
+        get = data.get
+        missing = [
+            label for label, keys in _REQUIRED_FIELD_CHECKS
+            if not any(map(get, keys))
+        ]
+        return (not missing, missing)
 
     def mark_candidate_deleted(
         self,
@@ -1469,23 +1682,26 @@ class DatabaseService:
             return False
 
         try:
-            from datetime import datetime
-
+            self._last_quick.pop(candidate_id)
+            # deleted_at은 status 전이 시 DB 트리거가 기록
             result = self.client.table("candidates").update({
                 "status": "deleted",
                 "error_code": error_code,
                 "error_message": error_message,
-                "deleted_at": datetime.utcnow().isoformat(),
             }).eq("id", candidate_id).execute()
 
             if result.data:
-                logger.info(f"[SoftDelete] Candidate {candidate_id} marked as deleted: {error_code}")
+                logger.info(
+                    "[SoftDelete] Candidate %s marked as deleted: %s",
+                    candidate_id,
+                    error_code
+                )
                 return True
 
             return False
 
-        except Exception as e:
-            logger.error(f"Failed to mark candidate as deleted: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to mark candidate as deleted: %s", e)
             return False
 
     def restore_previous_version(
@@ -1516,25 +1732,67 @@ class DatabaseService:
             }).eq("id", parent_id).execute()
 
             if not restore_result.data:
-                logger.error(f"Failed to restore parent version: {parent_id}")
+                logger.error("Failed to restore parent version: %s", parent_id)
                 return False
 
-            logger.info(f"[Restore] Previous version {parent_id} restored as is_latest=True")
+            logger.info("[Restore] Previous version %s restored as is_latest=True", parent_id)
 
             # 2. 현재 후보자 Soft Delete (이미 mark_candidate_deleted에서 처리됨)
             return True
 
-        except Exception as e:
-            logger.error(f"Failed to restore previous version: {e}")
+        except DB_ERRORS as e:
+            logger.error("Failed to restore previous version: %s", e)
             return False
 
+    def restore_and_delete(
+        self,
+        current_candidate_id: str,
+        parent_id: str,
+        error_code: str,
+        error_message: str,
+    ) -> Optional[Tuple[bool, bool]]:
+        """
+        현재 후보자 Soft Delete + 이전 버전 복원 (단일 UPDATE)
+
+        restore_and_delete RPC가 WHERE id IN (current, parent) + CASE 식으로
+        두 행을 한 번에 갱신합니다.
+
+        Args:
+            current_candidate_id: 현재 후보자 ID (삭제 대상)
+            parent_id: 이전 버전 후보자 ID (복원 대상)
+            error_code: 에러 코드
+            error_message: 사용자용 에러 메시지
+
+        Returns:
+            (deleted, restored) 또는 RPC 실패 시 None
+        """
+        if not self.client:
+            return None
+
+        try:
+            result = self.client.rpc(
+                "restore_and_delete",
+                {
+                    "p_current_id": current_candidate_id,
+                    "p_parent_id": parent_id,
+                    "p_error_code": error_code,
+                    "p_error_message": error_message,
+                }
+            ).execute()
+
+            data = result.data or {}
+            return bool(data.get("deleted")), bool(data.get("restored"))
+        except DB_ERRORS as e:
+            logger.warning("[Restore] restore_and_delete RPC failed: %s", e)
+            return None
+
     def handle_pipeline_failure(
         self,
         candidate_id: str,
         job_id: str,
         technical_error: str,
         parent_id: Optional[str] = None,
-    ) -> Dict[str, Any]:
+    ) -> FailureResult:
         """
         파이프라인 실패 시 통합 처리
 
@@ -1544,6 +1802,9 @@ class DatabaseService:
         4. 이전 버전 복원 (있는 경우)
         5. processing_jobs 실패 상태 업데이트
 
+        3~5는 handle_failure RPC로 한 트랜잭션에서 처리하고,
+        RPC 실패 시 개별 UPDATE로 fallback합니다.
+
         Args:
             candidate_id: 후보자 ID
             job_id: 작업 ID
@@ -1551,53 +1812,113 @@ class DatabaseService:
             parent_id: 이전 버전 ID (업데이트의 경우)
 
         Returns:
-            {
-                "error_code": "PARSE_FAILED",
-                "user_message": "읽을 수 없는 파일이에요...",
-                "deleted": True,
-                "restored": True|False
-            }
+            FailureResult (JSON 직렬화가 필요하면 dataclasses.asdict 사용)
         """
         # 1. 에러 분류
         error_code = self.classify_error(technical_error)
         user_message = self.get_user_message(error_code)
 
-        # 2. Soft Delete
-        deleted = self.mark_candidate_deleted(candidate_id, error_code, user_message)
+        # 2~4. Soft Delete + 이전 버전 복원 + processing_jobs 실패 상태
+        rpc_result = self._handle_failure_rpc(
+            candidate_id, parent_id, job_id, error_code, user_message
+        )
+        if rpc_result is not None:
+            deleted, restored = rpc_result
+        else:
+            deleted, restored = self._handle_failure_fallback(
+                candidate_id, parent_id, job_id, error_code, user_message
+            )
+
+        logger.info(
+            "[FailureHandler] Candidate %s failed: code=%s, deleted=%s, restored=%s",
+            candidate_id,
+            error_code,
+            deleted,
+            restored
+        )
+
+        return FailureResult(
+            error_code=error_code,
+            user_message=user_message,
+            deleted=deleted,
+            restored=restored,
+        )
 
-        # 3. 이전 버전 복원
-        restored = False
+    def _handle_failure_rpc(
+        self,
+        candidate_id: str,
+        parent_id: Optional[str],
+        job_id: str,
+        error_code: str,
+        user_message: str,
+    ) -> Optional[Tuple[bool, bool]]:
+        """handle_failure RPC 호출 (실패 시 None)"""
+        if not self.client:
+            return None
+
+        try:
+            result = self.client.rpc(
+                "handle_failure",
+                {
+                    "p_candidate_id": candidate_id,
+                    "p_parent_id": parent_id,
+                    "p_job_id": job_id,
+                    "p_error_code": error_code,
+                    "p_error_message": user_message,
+                }
+            ).execute()
+
+            data = result.data or {}
+            return bool(data.get("deleted")), bool(data.get("restored"))
+        except DB_ERRORS as e:
+            logger.warning("[FailureHandler] RPC failed, falling back to per-step updates: %s", e)
+            return None
+
+    def _handle_failure_fallback(
+        self,
+        candidate_id: str,
+        parent_id: Optional[str],
+        job_id: str,
+        error_code: str,
+        user_message: str,
+    ) -> Tuple[bool, bool]:
+        """실패 처리 Fallback (개별 UPDATE)"""
+        combined = None
         if parent_id:
-            restored = self.restore_previous_version(candidate_id, parent_id)
+            combined = self.restore_and_delete(candidate_id, parent_id, error_code, user_message)
+
+        if combined is not None:
+            deleted, restored = combined
+        else:
+            deleted = self.mark_candidate_deleted(candidate_id, error_code, user_message)
+            restored = False
+            if parent_id:
+                restored = self.restore_previous_version(candidate_id, parent_id)
 
-        # 4. processing_jobs 실패 상태 업데이트
         self.update_job_status(
             job_id=job_id,
             status="failed",
             error_code=error_code,
             error_message=user_message,
         )
-
-        logger.info(
-            f"[FailureHandler] Candidate {candidate_id} failed: "
-            f"code={error_code}, deleted={deleted}, restored={restored}"
-        )
-
-        return {
-            "error_code": error_code,
-            "user_message": user_message,
-            "deleted": deleted,
-            "restored": restored,
-        }
+        return deleted, restored
 
 
 # 싱글톤 인스턴스
 _database_service: Optional[DatabaseService] = None
+_database_service_lock = threading.Lock()
 
 
 def get_database_service() -> DatabaseService:
-    """Database Service 싱글톤 인스턴스 반환"""
+    """
+    Database Service 싱글톤 인스턴스 반환
+
+    Double-checked locking: 워커 스레드 풀의 첫 요청이 몰려도
+    Supabase 클라이언트는 한 번만 생성되고, 초기화 이후에는 락을 잡지 않음
+    """
     global _database_service
     if _database_service is None:
-        _database_service = DatabaseService()
+        with _database_service_lock:
+            if _database_service is None:
+                _database_service = DatabaseService()
     return _database_service
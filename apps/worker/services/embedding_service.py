@@ -13,24 +13,25 @@ PRD v0.1 이슈 해결:
 """
 
 import asyncio
+import importlib.util
 import logging
+import os
+import re
 import traceback
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, Iterable, List, Any, Optional, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
 import random
 
-from openai import AsyncOpenAI
-
 from config import get_settings, chunking_config
+from exceptions import is_retryable
+from utils.rate_limiter import TokenBucketLimiter
 
-# tiktoken import (토큰 수 정확한 계산)
-try:
-    import tiktoken
-    TIKTOKEN_AVAILABLE = True
-except ImportError:
-    TIKTOKEN_AVAILABLE = False
+# tiktoken / openai는 실제 사용 시점에 import (청킹 전용 경로의 cold-start 단축)
+# 설치 여부만 import 없이 확인
+TIKTOKEN_AVAILABLE = importlib.util.find_spec("tiktoken") is not None
 
 # 로깅 설정 - 환경변수 기반 (PRD: Epic 2)
 settings = get_settings()
@@ -38,6 +39,97 @@ _log_level = getattr(logging, settings.LOG_LEVEL.upper(), logging.INFO)
 logging.basicConfig(level=_log_level)
 logger = logging.getLogger(__name__)
 
+# OpenAI embeddings 분당 한도 (프로세스 내 모든 요청이 공유)
+_embedding_limiter = TokenBucketLimiter(
+    rpm=settings.rate_limit.embedding_rpm,
+    tpm=settings.rate_limit.embedding_tpm,
+)
+
+
+# 한글 완성형 음절 (가-힣) - 문자 단위 Python 루프 대신 C 레벨 스캔
+_HANGUL_RE = re.compile(r'[\uac00-\ud7a3]')
+
+# 스킬 카테고리 키워드 (우선순위 순서)
+_SKILL_CATEGORIES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("프로그래밍", ("python", "java", "javascript", "typescript", "c++", "c#", "go", "rust", "kotlin", "swift", "php", "ruby")),
+    ("프레임워크", ("react", "vue", "angular", "next.js", "spring", "django", "flask", "fastapi", "express", "node.js")),
+    ("데이터베이스", ("mysql", "postgresql", "mongodb", "redis", "oracle", "sqlite", "elasticsearch")),
+    ("클라우드/인프라", ("aws", "gcp", "azure", "docker", "kubernetes", "terraform", "jenkins", "ci/cd")),
+)
+_SKILL_CATEGORY: Dict[str, str] = {
+    keyword: category
+    for category, keywords in _SKILL_CATEGORIES
+    for keyword in keywords
+}
+_SKILL_PRIORITY: Dict[str, int] = {
+    category: i for i, (category, _) in enumerate(_SKILL_CATEGORIES)
+}
+# 복합 표기(예: "Spring Boot", "AWS Lambda")용 - 긴 키워드 우선 매칭
+_SKILL_PATTERN = re.compile(
+    "|".join(map(re.escape, sorted(_SKILL_CATEGORY, key=len, reverse=True)))
+)
+
+def _is_recoverable_error(exc: Exception) -> bool:
+    """
+    재시도할 가치가 있는 일시적 오류인지 판단
+
+    - HTTP 응답 에러(OpenAI APIStatusError): 5xx / 408 / 409 / 429만 재시도
+      (400 InvalidRequest, 401/403 인증 오류 등은 재시도해도 같은 결과)
+    - 그 외: exceptions.is_retryable 화이트리스트 (연결/타임아웃 등)
+    """
+    status_code = getattr(exc, "status_code", None)
+    if isinstance(status_code, int):
+        return status_code >= 500 or status_code in (408, 409, 429)
+    return is_retryable(exc)
+
+
+def _kv(label: str, value: Any, sep: str = ": ") -> Optional[str]:
+    """값이 있을 때만 "라벨: 값" 줄 생성 (없으면 None → join 시 제외)"""
+    return f"{label}{sep}{value}" if value else None
+
+
+def _bounded_join(parts: Iterable[Optional[str]], limit: int, sep: str = "\n") -> str:
+    """
+    빈 값을 건너뛰며 sep으로 이어 붙이되 limit 글자에서 중단
+
+    "\n".join(...)[:limit]과 같은 결과를 전체 문자열 생성 없이 만듦
+    (수 KB짜리 description이 이어져도 limit 이후는 복사하지 않음)
+    """
+    pieces: List[str] = []
+    length = 0
+    for part in parts:
+        if not part:
+            continue
+        if pieces:
+            pieces.append(sep)
+            length += len(sep)
+        if length + len(part) >= limit:
+            pieces.append(part[:max(limit - length, 0)])
+            return "".join(pieces)[:limit]
+        pieces.append(part)
+        length += len(part)
+    return "".join(pieces)
+
+
+# encode_ordinary_batch 스레드 수
+_TOKENIZER_THREADS = os.cpu_count() or 4
+
+
+@lru_cache(maxsize=4)
+def _get_encoding(model: str):
+    """
+    모델별 tiktoken 인코더 반환 (프로세스 내 공유)
+
+    BPE vocab 로딩 비용(100~300ms)을 인스턴스마다 반복하지 않도록 캐시
+    모델명을 모르는 경우 cl100k_base 사용
+    """
+    import tiktoken
+
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
 
 class ChunkType(str, Enum):
     """청크 유형"""
@@ -50,9 +142,9 @@ class ChunkType(str, Enum):
     RAW_SECTION = "raw_section"  # 원본 텍스트 섹션 (PRD v0.1)
 
 
-@dataclass
+@dataclass(slots=True)
 class Chunk:
-    """청크 데이터"""
+    """청크 데이터 (이력서당 N개 생성 → __dict__ 없이 slots 사용)"""
     chunk_type: ChunkType
     chunk_index: int          # 같은 타입 내 순서
     content: str              # 청크 내용
@@ -69,7 +161,7 @@ class Chunk:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EmbeddingResult:
     """임베딩 결과"""
     success: bool
@@ -91,7 +183,7 @@ class EmbeddingResult:
         return {
             "success": self.success,
             "chunk_count": len(self.chunks),
-            "chunks": [c.to_dict() for c in self.chunks],
+            "chunks": list(map(Chunk.to_dict, self.chunks)),
             "total_tokens": self.total_tokens,
             "error": self.error,
             "total_chunks": self.total_chunks,
@@ -131,6 +223,8 @@ class EmbeddingService:
         openai_key = settings.OPENAI_API_KEY
         if openai_key:
             try:
+                from openai import AsyncOpenAI
+
                 self.client = AsyncOpenAI(api_key=openai_key)
                 logger.info(f"[EmbeddingService] ✅ OpenAI 클라이언트 초기화 성공 (key: {openai_key[:8]}...)")
             except Exception as e:
@@ -142,7 +236,7 @@ class EmbeddingService:
         # tiktoken 인코더 초기화
         if TIKTOKEN_AVAILABLE:
             try:
-                self._encoding = tiktoken.encoding_for_model(self.EMBEDDING_MODEL)
+                self._encoding = _get_encoding(self.EMBEDDING_MODEL)
                 logger.info("[EmbeddingService] ✅ tiktoken 인코더 초기화 성공")
             except Exception as e:
                 logger.warning(f"[EmbeddingService] ⚠️ tiktoken 인코더 초기화 실패: {e}")
@@ -156,14 +250,14 @@ class EmbeddingService:
         """
         텍스트의 토큰 수 계산 (P0 이슈 해결)
 
-        tiktoken 사용 시 정확한 토큰 수 계산,
+        tiktoken 사용 시 정확한 토큰 수 계산 (특수 토큰 검사 없는 encode_ordinary),
         없으면 한글/영문 혼합 추정 사용
         """
         if self._encoding:
-            return len(self._encoding.encode(text))
+            return len(self._encoding.encode_ordinary(text))
 
         # tiktoken 없을 때: 한글/영문 혼합 추정
-        korean_chars = sum(1 for c in text if '\uac00' <= c <= '\ud7a3')
+        korean_chars = len(_HANGUL_RE.findall(text))
         other_chars = len(text) - korean_chars
 
         # 한글: 1자 ≈ 2-3토큰, 영문/기타: 4자 ≈ 1토큰
@@ -172,9 +266,60 @@ class EmbeddingService:
 
         return int(korean_tokens + other_tokens)
 
+    def _count_tokens_each(self, texts: List[str]) -> List[int]:
+        """
+        텍스트별 토큰 수 계산
+
+        tiktoken 사용 시 encode_ordinary_batch로 한 번에 처리 (GIL 해제 후 멀티스레드 BPE)
+        """
+        if self._encoding:
+            encoded = self._encoding.encode_ordinary_batch(texts, num_threads=_TOKENIZER_THREADS)
+            return [len(tokens) for tokens in encoded]
+
+        return [self._count_tokens(t) for t in texts]
+
     def _count_tokens_batch(self, texts: List[str]) -> int:
         """배치 텍스트의 총 토큰 수 계산"""
-        return sum(self._count_tokens(t) for t in texts)
+        return sum(self._count_tokens_each(texts))
+
+    def _split_batches(self, texts: List[str]) -> List[Tuple[int, List[str], int]]:
+        """
+        요청 한도(입력 수, 토큰 수) 안에서 텍스트를 순서대로 묶음
+
+        Returns:
+            [(원본 리스트에서의 시작 offset, 텍스트 목록, 토큰 수), ...]
+        """
+        cfg = chunking_config
+        batches: List[Tuple[int, List[str], int]] = []
+        current: List[str] = []
+        current_tokens = 0
+        offset = 0
+
+        for text, tokens in zip(texts, self._count_tokens_each(texts)):
+            if current and (
+                len(current) >= cfg.EMBEDDING_BATCH_MAX_INPUTS
+                or current_tokens + tokens > cfg.EMBEDDING_BATCH_MAX_TOKENS
+            ):
+                batches.append((offset, current, current_tokens))
+                offset += len(current)
+                current, current_tokens = [], 0
+            current.append(text)
+            current_tokens += tokens
+
+        if current:
+            batches.append((offset, current, current_tokens))
+        return batches
+
+    def _korean_ratio(self, text: str) -> float:
+        """공백/개행을 제외한 문자 중 한글 음절 비율 (한 번의 스캔)"""
+        if not text:
+            return 0.0
+
+        total_chars = len(text) - text.count(' ') - text.count('\n')
+        if total_chars == 0:
+            return 0.0
+
+        return len(_HANGUL_RE.findall(text)) / total_chars
 
     def _is_korean_dominant(self, text: str) -> bool:
         """
@@ -186,17 +331,7 @@ class EmbeddingService:
         Returns:
             한글 비율이 KOREAN_THRESHOLD (50%) 이상이면 True
         """
-        if not text:
-            return False
-
-        korean_chars = sum(1 for c in text if '\uac00' <= c <= '\ud7a3')
-        total_chars = len(text.replace(' ', '').replace('\n', ''))
-
-        if total_chars == 0:
-            return False
-
-        korean_ratio = korean_chars / total_chars
-        return korean_ratio >= chunking_config.KOREAN_THRESHOLD
+        return self._korean_ratio(text) >= chunking_config.KOREAN_THRESHOLD
 
     async def _retry_with_exponential_backoff(
         self,
@@ -214,17 +349,18 @@ class EmbeddingService:
 
         Returns:
             함수 실행 결과 또는 None
+            (재시도 불가 오류는 재시도 없이 즉시 None)
         """
         if max_retries is None:
             max_retries = chunking_config.MAX_EMBEDDING_RETRIES
 
-        last_error = None
-
         for attempt in range(max_retries + 1):
             try:
                 return await func(*args, **kwargs)
             except Exception as e:
-                last_error = e
+                if not _is_recoverable_error(e):
+                    logger.error(f"[EmbeddingService] 재시도 불가 오류: {type(e).__name__}: {e}")
+                    return None
 
                 if attempt < max_retries:
                     # 지수 백오프 + 지터
@@ -251,10 +387,14 @@ class EmbeddingService:
         start_time = datetime.now()
         logger.info(f"[EmbeddingService] 단일 임베딩 생성 시작 - 텍스트 길이: {len(text)} chars")
 
+        truncated = text[:8000]  # 토큰 제한
+        estimated_tokens = self._count_tokens(truncated)
+
         async def _create():
+            await _embedding_limiter.acquire(estimated_tokens)
             response = await self.client.embeddings.create(
                 model=self.EMBEDDING_MODEL,
-                input=text[:8000]  # 토큰 제한
+                input=truncated
             )
             return response.data[0].embedding
 
@@ -278,46 +418,74 @@ class EmbeddingService:
             return [None] * len(texts)
 
         start_time = datetime.now()
-        logger.info(f"[EmbeddingService] 배치 임베딩 생성 시작 - {len(texts)}개 텍스트")
-        for i, t in enumerate(texts):
-            logger.debug(f"[EmbeddingService]   텍스트 {i+1}: {len(t)} chars - {t[:100]}...")
+        logger.info("[EmbeddingService] 배치 임베딩 생성 시작 - %s개 텍스트", len(texts))
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, t in enumerate(texts):
+                logger.debug("[EmbeddingService]   텍스트 %s: %s chars - %s...", i+1, len(t), t[:100])
 
         try:
             # 텍스트 길이 제한
             truncated = [t[:8000] for t in texts]
 
-            logger.info(f"[EmbeddingService] OpenAI embeddings.create 호출 중...")
+            # 요청 한도 초과 방지: 입력 수/토큰 수 기준으로 분할 후 동시 요청
+            batches = self._split_batches(truncated)
+            semaphore = asyncio.Semaphore(chunking_config.EMBEDDING_BATCH_CONCURRENCY)
 
-            async def _create_batch():
+            logger.info(
+                "[EmbeddingService] OpenAI embeddings.create 호출 중... (%s개 요청)",
+                len(batches)
+            )
+
+            async def _create_batch(batch: List[str], tokens: int):
+                # 429 후 백오프 대신 호출 전에 분당 한도 확보 (재시도도 한도에 포함)
+                await _embedding_limiter.acquire(tokens)
                 return await self.client.embeddings.create(
                     model=self.EMBEDDING_MODEL,
-                    input=truncated
+                    input=batch
                 )
 
-            response = await self._retry_with_exponential_backoff(_create_batch)
+            async def _run(batch: List[str], tokens: int):
+                async with semaphore:
+                    return await self._retry_with_exponential_backoff(_create_batch, batch, tokens)
 
-            if not response:
+            responses = await asyncio.gather(
+                *(_run(batch, tokens) for _, batch, tokens in batches)
+            )
+
+            if not any(responses):
                 logger.error("[EmbeddingService] ❌ 배치 임베딩 생성 실패 (모든 재시도 실패)")
                 return [None] * len(texts)
 
             elapsed = (datetime.now() - start_time).total_seconds()
-            logger.info(f"[EmbeddingService] ✅ 배치 임베딩 생성 완료 ({elapsed:.2f}초)")
+            logger.info("[EmbeddingService] ✅ 배치 임베딩 생성 완료 (%.2f초)", elapsed)
 
-            # 인덱스 순서대로 정렬
+            # 인덱스 순서대로 정렬 (분할 요청의 offset 반영)
             embeddings = [None] * len(texts)
-            for item in response.data:
-                embeddings[item.index] = item.embedding
-                logger.debug(f"[EmbeddingService]   임베딩 {item.index+1}: 차원 {len(item.embedding)}")
+            for (offset, _, _), response in zip(batches, responses):
+                if not response:
+                    continue
+                for item in response.data:
+                    embeddings[offset + item.index] = item.embedding
+                    logger.debug(
+                        "[EmbeddingService]   임베딩 %s: 차원 %s",
+                        offset + item.index + 1,
+                        len(item.embedding)
+                    )
 
             success_count = sum(1 for e in embeddings if e is not None)
-            logger.info(f"[EmbeddingService] ✅ 배치 결과: {success_count}/{len(texts)} 성공")
+            logger.info("[EmbeddingService] ✅ 배치 결과: %s/%s 성공", success_count, len(texts))
 
             return embeddings
 
         except Exception as e:
             elapsed = (datetime.now() - start_time).total_seconds()
-            logger.error(f"[EmbeddingService] ❌ 배치 임베딩 실패 ({elapsed:.2f}초): {type(e).__name__}: {e}")
-            logger.error(f"[EmbeddingService] 상세 오류:\n{traceback.format_exc()}")
+            logger.error(
+                "[EmbeddingService] ❌ 배치 임베딩 실패 (%.2f초): %s: %s",
+                elapsed,
+                type(e).__name__,
+                e
+            )
+            logger.error("[EmbeddingService] 상세 오류:\n%s", traceback.format_exc())
             return [None] * len(texts)
 
     async def process_candidate(
@@ -340,8 +508,8 @@ class EmbeddingService:
         start_time = datetime.now()
         logger.info("=" * 60)
         logger.info("[EmbeddingService] 후보자 데이터 처리 시작")
-        logger.info(f"[EmbeddingService] 임베딩 생성: {'예' if generate_embeddings else '아니오'}")
-        logger.info(f"[EmbeddingService] 입력 데이터 필드: {list(data.keys()) if data else 'None'}")
+        logger.info("[EmbeddingService] 임베딩 생성: %s", '예' if generate_embeddings else '아니오')
+        logger.info("[EmbeddingService] 입력 데이터 필드: %s", list(data.keys()) if data else 'None')
         logger.info("=" * 60)
 
         try:
@@ -361,9 +529,15 @@ class EmbeddingService:
                 )]
                 logger.info("[EmbeddingService] 폴백 청크 생성됨")
 
-            logger.info(f"[EmbeddingService] ✅ 청크 생성 완료: {len(chunks)}개")
-            for i, chunk in enumerate(chunks):
-                logger.debug(f"[EmbeddingService]   청크 {i+1}: {chunk.chunk_type.value} - {len(chunk.content)} chars")
+            logger.info("[EmbeddingService] ✅ 청크 생성 완료: %s개", len(chunks))
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, chunk in enumerate(chunks):
+                    logger.debug(
+                        "[EmbeddingService]   청크 %s: %s - %s chars",
+                        i+1,
+                        chunk.chunk_type.value,
+                        len(chunk.content)
+                    )
 
             # 2. 임베딩 생성 (옵션)
             total_tokens = 0
@@ -378,44 +552,87 @@ class EmbeddingService:
                 else:
                     logger.info("[EmbeddingService] Step 2: 배치 임베딩 생성")
                     texts = [c.content for c in chunks]
-                    embeddings = await self.create_embeddings_batch(texts)
+
+                    # 동일한 텍스트는 한 번만 임베딩하고 결과를 공유 (raw/요약 중복 토큰 절감)
+                    text_groups: Dict[str, List[int]] = {}
+                    for i, t in enumerate(texts):
+                        text_groups.setdefault(t, []).append(i)
+                    unique_texts = list(text_groups)
+                    if len(unique_texts) < len(texts):
+                        logger.info(
+                            "[EmbeddingService] 중복 청크 %s개 제외 (%s개 고유 텍스트 임베딩)",
+                            len(texts) - len(unique_texts),
+                            len(unique_texts)
+                        )
+
+                    embeddings = await self.create_embeddings_batch(unique_texts)
 
                     # 배치 결과 확인
-                    failed_indices = []
-                    for i, embedding in enumerate(embeddings):
-                        chunks[i].embedding = embedding
-                        if embedding is not None:
-                            embedded_count += 1
-                        else:
-                            failed_indices.append(i)
-
-                    # 실패한 청크에 대해 개별 재시도 (지수 백오프 적용)
+                    failed_indices = [
+                        k for k, embedding in enumerate(embeddings) if embedding is None
+                    ]
+
+                    # 실패한 청크에 대해 개별 재시도 (지수 백오프 적용, 동시 실행 수 제한)
                     if failed_indices:
-                        logger.info(f"[EmbeddingService] Step 2-1: 실패한 {len(failed_indices)}개 청크 개별 재시도")
-                        for idx in failed_indices:
-                            retry_embedding = await self.create_embedding(chunks[idx].content)
+                        logger.info(
+                            "[EmbeddingService] Step 2-1: 실패한 %s개 청크 개별 재시도",
+                            len(failed_indices)
+                        )
+                        semaphore = asyncio.Semaphore(chunking_config.EMBEDDING_RETRY_CONCURRENCY)
+
+                        async def _retry(k: int) -> Optional[List[float]]:
+                            async with semaphore:
+                                return await self.create_embedding(unique_texts[k])
+
+                        retry_results = await asyncio.gather(
+                            *(_retry(k) for k in failed_indices)
+                        )
+
+                        for k, retry_embedding in zip(failed_indices, retry_results):
+                            embeddings[k] = retry_embedding or None
                             if retry_embedding:
-                                chunks[idx].embedding = retry_embedding
+                                logger.info(
+                                    "[EmbeddingService] ✅ 청크 %s 재시도 성공",
+                                    text_groups[unique_texts[k]]
+                                )
+                            else:
+                                logger.warning(
+                                    "[EmbeddingService] ❌ 청크 %s 재시도 실패",
+                                    text_groups[unique_texts[k]]
+                                )
+
+                    # 고유 텍스트 결과를 원래 청크 위치로 분배
+                    for text, embedding in zip(unique_texts, embeddings):
+                        for i in text_groups[text]:
+                            chunks[i].embedding = embedding
+                            if embedding is not None:
                                 embedded_count += 1
-                                logger.info(f"[EmbeddingService] ✅ 청크 {idx} 재시도 성공")
                             else:
                                 failed_count += 1
-                                logger.warning(f"[EmbeddingService] ❌ 청크 {idx} 재시도 실패")
 
-                    logger.info(f"[EmbeddingService] ✅ 임베딩 생성 완료: {embedded_count}/{len(chunks)} 성공")
+                    logger.info(
+                        "[EmbeddingService] ✅ 임베딩 생성 완료: %s/%s 성공",
+                        embedded_count,
+                        len(chunks)
+                    )
 
                     # 부분 실패 경고 추가
                     if failed_count > 0:
                         warning_msg = f"{failed_count}개 청크 임베딩 실패 - 해당 청크는 검색에서 제외됩니다"
                         warnings.append(warning_msg)
-                        logger.warning(f"[EmbeddingService] ⚠️ {warning_msg}")
+                        logger.warning("[EmbeddingService] ⚠️ %s", warning_msg)
 
                     # 토큰 수 계산 (P0 이슈 해결: tiktoken 사용)
-                    total_tokens = self._count_tokens_batch(texts)
-                    logger.info(f"[EmbeddingService] 토큰 사용량: {total_tokens} (tiktoken: {TIKTOKEN_AVAILABLE})")
+                    # CPU 바운드 작업이므로 스레드로 넘겨 이벤트 루프 점유 방지
+                    total_tokens = await asyncio.to_thread(self._count_tokens_batch, texts)
+                    logger.info(
+                        "[EmbeddingService] 토큰 사용량: %s (tiktoken: %s)",
+                        total_tokens,
+                        TIKTOKEN_AVAILABLE
+                    )
 
             elapsed = (datetime.now() - start_time).total_seconds()
-            logger.info(f"[EmbeddingService] ✅ 처리 완료 ({elapsed:.2f}초)")
+            logger.info("[EmbeddingService] ✅ 처리 완료 (%.2f초)", elapsed)
             logger.info("=" * 60)
 
             # P2 이슈: 부분 성공 시에도 success=True이지만 명확한 상태 제공
@@ -431,8 +648,8 @@ class EmbeddingService:
 
         except Exception as e:
             elapsed = (datetime.now() - start_time).total_seconds()
-            logger.error(f"[EmbeddingService] ❌ 처리 실패 ({elapsed:.2f}초): {type(e).__name__}: {e}")
-            logger.error(f"[EmbeddingService] 상세 오류:\n{traceback.format_exc()}")
+            logger.error("[EmbeddingService] ❌ 처리 실패 (%.2f초): %s: %s", elapsed, type(e).__name__, e)
+            logger.error("[EmbeddingService] 상세 오류:\n%s", traceback.format_exc())
             logger.info("=" * 60)
             return EmbeddingResult(
                 success=False,
@@ -476,38 +693,23 @@ class EmbeddingService:
 
     def _build_summary_chunk(self, data: Dict[str, Any]) -> Optional[Chunk]:
         """Summary 청크 생성"""
-        parts = []
-
-        # 이름과 경력
-        if data.get("name"):
-            parts.append(f"이름: {data['name']}")
-
-        if data.get("exp_years"):
-            parts.append(f"총 경력: {data['exp_years']}년")
-
-        if data.get("last_company"):
-            parts.append(f"최근 직장: {data['last_company']}")
-
-        if data.get("last_position"):
-            parts.append(f"최근 직책: {data['last_position']}")
-
-        # 요약
-        if data.get("summary"):
-            parts.append(f"\n요약: {data['summary']}")
-
-        # 강점
-        if data.get("strengths"):
-            strengths = data["strengths"]
-            if isinstance(strengths, list):
-                parts.append(f"\n강점: {', '.join(strengths)}")
-
-        # 핵심 스킬 (상위 5개)
-        if data.get("skills"):
-            skills = data["skills"][:5] if isinstance(data["skills"], list) else []
-            if skills:
-                parts.append(f"\n핵심 기술: {', '.join(skills)}")
-
-        content = "\n".join(parts)
+        exp_years = data.get("exp_years")
+        strengths = data.get("strengths")
+        skills = data.get("skills")
+
+        content = _bounded_join((
+            # 이름과 경력
+            _kv("이름", data.get("name")),
+            f"총 경력: {exp_years}년" if exp_years else None,
+            _kv("최근 직장", data.get("last_company")),
+            _kv("최근 직책", data.get("last_position")),
+            # 요약
+            _kv("\n요약", data.get("summary")),
+            # 강점
+            _kv("\n강점", ", ".join(strengths) if isinstance(strengths, list) else None),
+            # 핵심 스킬 (상위 5개)
+            _kv("\n핵심 기술", ", ".join(skills[:5]) if isinstance(skills, list) else None),
+        ), self.MAX_CHUNK_CHARS)
 
         if not content.strip():
             return None
@@ -515,7 +717,7 @@ class EmbeddingService:
         return Chunk(
             chunk_type=ChunkType.SUMMARY,
             chunk_index=0,
-            content=content[:self.MAX_CHUNK_CHARS],
+            content=content,
             metadata={
                 "name": data.get("name"),
                 "exp_years": data.get("exp_years"),
@@ -535,38 +737,26 @@ class EmbeddingService:
             if not isinstance(career, dict):
                 continue
 
-            parts = []
-
             company = career.get("company", "")
-            if company:
-                parts.append(f"회사: {company}")
-
             position = career.get("position")
-            if position:
-                parts.append(f"직책: {position}")
-
-            department = career.get("department")
-            if department:
-                parts.append(f"부서: {department}")
-
-            # 기간
             start = career.get("start_date", "")
             end = career.get("end_date", "현재" if career.get("is_current") else "")
-            if start or end:
-                parts.append(f"기간: {start} ~ {end}")
 
-            # 업무 내용
-            description = career.get("description")
-            if description:
-                parts.append(f"\n업무 내용:\n{description}")
-
-            content = "\n".join(parts)
+            content = _bounded_join((
+                _kv("회사", company),
+                _kv("직책", position),
+                _kv("부서", career.get("department")),
+                # 기간
+                f"기간: {start} ~ {end}" if start or end else None,
+                # 업무 내용
+                _kv("\n업무 내용", career.get("description"), ":\n"),
+            ), self.MAX_CHUNK_CHARS)
 
             if content.strip():
                 chunks.append(Chunk(
                     chunk_type=ChunkType.CAREER,
                     chunk_index=i,
-                    content=content[:self.MAX_CHUNK_CHARS],
+                    content=content,
                     metadata={
                         "company": company,
                         "position": position,
@@ -590,37 +780,25 @@ class EmbeddingService:
             if not isinstance(project, dict):
                 continue
 
-            parts = []
-
             name = project.get("name", "")
-            if name:
-                parts.append(f"프로젝트: {name}")
-
             role = project.get("role")
-            if role:
-                parts.append(f"역할: {role}")
-
-            period = project.get("period")
-            if period:
-                parts.append(f"기간: {period}")
-
-            # 사용 기술
             technologies = project.get("technologies", [])
-            if technologies and isinstance(technologies, list):
-                parts.append(f"기술: {', '.join(technologies)}")
-
-            # 설명
-            description = project.get("description")
-            if description:
-                parts.append(f"\n설명:\n{description}")
 
-            content = "\n".join(parts)
+            content = _bounded_join((
+                _kv("프로젝트", name),
+                _kv("역할", role),
+                _kv("기간", project.get("period")),
+                # 사용 기술
+                _kv("기술", ", ".join(technologies) if isinstance(technologies, list) else None),
+                # 설명
+                _kv("\n설명", project.get("description"), ":\n"),
+            ), self.MAX_CHUNK_CHARS)
 
             if content.strip():
                 chunks.append(Chunk(
                     chunk_type=ChunkType.PROJECT,
                     chunk_index=i,
-                    content=content[:self.MAX_CHUNK_CHARS],
+                    content=content,
                     metadata={
                         "project_name": name,
                         "role": role,
@@ -646,12 +824,12 @@ class EmbeddingService:
             if category_skills:
                 parts.append(f"\n{category}: {', '.join(category_skills)}")
 
-        content = "\n".join(parts)
+        content = _bounded_join(parts, self.MAX_CHUNK_CHARS)
 
         return Chunk(
             chunk_type=ChunkType.SKILL,
             chunk_index=0,
-            content=content[:self.MAX_CHUNK_CHARS],
+            content=content,
             metadata={
                 "skill_count": len(skills),
                 "skills": skills[:20],  # 상위 20개만 메타데이터에
@@ -659,43 +837,35 @@ class EmbeddingService:
         )
 
     def _categorize_skills(self, skills: List[str]) -> Dict[str, List[str]]:
-        """스킬 카테고리화"""
-        categories = {
-            "프로그래밍": [],
-            "프레임워크": [],
-            "데이터베이스": [],
-            "클라우드/인프라": [],
-            "기타": [],
-        }
+        """
+        스킬 카테고리화
 
-        programming = {"python", "java", "javascript", "typescript", "c++", "c#", "go", "rust", "kotlin", "swift", "php", "ruby"}
-        frameworks = {"react", "vue", "angular", "next.js", "spring", "django", "flask", "fastapi", "express", "node.js"}
-        databases = {"mysql", "postgresql", "mongodb", "redis", "oracle", "sqlite", "elasticsearch"}
-        cloud = {"aws", "gcp", "azure", "docker", "kubernetes", "terraform", "jenkins", "ci/cd"}
+        키워드와 정확히 일치하면 dict 조회로 바로 분류하고,
+        복합 표기만 정규식 한 번으로 스캔해 우선순위가 가장 높은 카테고리 선택
+        """
+        categories: Dict[str, List[str]] = {
+            category: [] for category, _ in _SKILL_CATEGORIES
+        }
+        categories["기타"] = []
 
         for skill in skills:
             skill_lower = skill.lower()
 
-            if any(p in skill_lower for p in programming):
-                categories["프로그래밍"].append(skill)
-            elif any(f in skill_lower for f in frameworks):
-                categories["프레임워크"].append(skill)
-            elif any(d in skill_lower for d in databases):
-                categories["데이터베이스"].append(skill)
-            elif any(c in skill_lower for c in cloud):
-                categories["클라우드/인프라"].append(skill)
-            else:
-                categories["기타"].append(skill)
+            category = _SKILL_CATEGORY.get(skill_lower)
+            if category is None:
+                matched = {_SKILL_CATEGORY[m.group()] for m in _SKILL_PATTERN.finditer(skill_lower)}
+                category = min(matched, key=_SKILL_PRIORITY.__getitem__) if matched else "기타"
+
+            categories[category].append(skill)
 
         # 빈 카테고리 제거
         return {k: v for k, v in categories.items() if v}
 
     def _build_education_chunk(self, data: Dict[str, Any]) -> Optional[Chunk]:
         """Education 청크 생성"""
-        parts = []
-
         # 최종 학력
-        if data.get("education_level"):
+        level = data.get("education_level")
+        if level:
             level_map = {
                 "high_school": "고졸",
                 "associate": "전문학사",
@@ -703,35 +873,30 @@ class EmbeddingService:
                 "master": "석사",
                 "doctor": "박사"
             }
-            level = level_map.get(data["education_level"], data["education_level"])
-            parts.append(f"최종 학력: {level}")
+            level = level_map.get(level, level)
 
-        if data.get("education_school"):
-            parts.append(f"학교: {data['education_school']}")
-
-        if data.get("education_major"):
-            parts.append(f"전공: {data['education_major']}")
+        lines = [
+            _kv("최종 학력", level),
+            _kv("학교", data.get("education_school")),
+            _kv("전공", data.get("education_major")),
+        ]
 
         # 상세 학력
         educations = data.get("educations", [])
         if educations and isinstance(educations, list):
-            parts.append("\n학력 상세:")
+            lines.append("\n학력 상세:")
             for edu in educations:
                 if isinstance(edu, dict):
-                    edu_line = []
-                    if edu.get("school"):
-                        edu_line.append(edu["school"])
-                    if edu.get("major"):
-                        edu_line.append(edu["major"])
-                    if edu.get("degree"):
-                        edu_line.append(edu["degree"])
-                    if edu.get("graduation_year"):
-                        edu_line.append(f"({edu['graduation_year']})")
-
-                    if edu_line:
-                        parts.append(f"- {' / '.join(edu_line)}")
+                    graduation_year = edu.get("graduation_year")
+                    edu_line = " / ".join(filter(None, (
+                        edu.get("school"),
+                        edu.get("major"),
+                        edu.get("degree"),
+                        f"({graduation_year})" if graduation_year else None,
+                    )))
+                    lines.append(_kv("-", edu_line, " "))
 
-        content = "\n".join(parts)
+        content = _bounded_join(lines, self.MAX_CHUNK_CHARS)
 
         if not content.strip():
             return None
@@ -739,7 +904,7 @@ class EmbeddingService:
         return Chunk(
             chunk_type=ChunkType.EDUCATION,
             chunk_index=0,
-            content=content[:self.MAX_CHUNK_CHARS],
+            content=content,
             metadata={
                 "education_level": data.get("education_level"),
                 "school": data.get("education_school"),
@@ -802,13 +967,17 @@ class EmbeddingService:
         #    - P1 이슈 해결: 한글 최적화
         # ─────────────────────────────────────────────────
 
-        # 한글 우세 여부 확인
-        is_korean = self._is_korean_dominant(raw_text)
+        # 한글 우세 여부 확인 (비율은 한 번만 계산해 판단/로그에 재사용)
+        korean_ratio = self._korean_ratio(raw_text)
+        is_korean = korean_ratio >= cfg.KOREAN_THRESHOLD
 
         if is_korean:
             chunk_size = cfg.KOREAN_CHUNK_SIZE
             overlap = cfg.KOREAN_OVERLAP
-            logger.debug(f"[EmbeddingService] 한글 최적화 적용: CHUNK_SIZE={chunk_size}, OVERLAP={overlap}")
+            logger.debug(
+                f"[EmbeddingService] 한글 최적화 적용 (한글 {korean_ratio:.0%}): "
+                f"CHUNK_SIZE={chunk_size}, OVERLAP={overlap}"
+            )
         else:
             chunk_size = cfg.RAW_SECTION_CHUNK_SIZE
             overlap = cfg.RAW_SECTION_OVERLAP
@@ -816,29 +985,32 @@ class EmbeddingService:
         min_chunk_length = cfg.RAW_SECTION_MIN_LENGTH
 
         # chunk_size 이상일 때만 섹션 분할
-        if len(raw_text) > chunk_size:
-            section_index = 0
+        text_length = len(raw_text)
+        if text_length > chunk_size:
             stride = chunk_size - overlap
 
-            for start in range(0, len(raw_text), stride):
-                section = raw_text[start:start + chunk_size]
+            # 최소 길이 체크: 윈도우 길이는 오프셋으로 계산해 부족하면 슬라이스 없이 제외
+            sections = [
+                (start, section)
+                for start in range(0, text_length, stride)
+                if min(chunk_size, text_length - start) >= min_chunk_length
+                and len((section := raw_text[start:start + chunk_size]).strip()) >= min_chunk_length
+            ]
 
-                # 최소 길이 체크
-                if len(section.strip()) < min_chunk_length:
-                    continue
-
-                chunks.append(Chunk(
+            chunks.extend(
+                Chunk(
                     chunk_type=ChunkType.RAW_SECTION,
                     chunk_index=section_index,
                     content=section,
                     metadata={
                         "start_pos": start,
-                        "end_pos": min(start + chunk_size, len(raw_text)),
+                        "end_pos": min(start + chunk_size, text_length),
                         "section_length": len(section),
                         "is_korean_optimized": is_korean
                     }
-                ))
-                section_index += 1
+                )
+                for section_index, (start, section) in enumerate(sections)
+            )
 
         logger.debug(
             f"[EmbeddingService] Raw 청킹 완료: "
@@ -849,6 +1021,21 @@ class EmbeddingService:
         return chunks
 
 
+def prewarm_tokenizer() -> None:
+    """
+    tiktoken 인코더 사전 로딩 (첫 요청의 BPE 로딩 지연 제거)
+
+    import 시점이 아니라 워커/앱 시작 시 호출 (PREWARM_TIKTOKEN=0으로 비활성화)
+    RQ 워커는 fork 전에 로딩해 두면 work-horse가 캐시된 인코더를 그대로 물려받음
+    """
+    if not TIKTOKEN_AVAILABLE or os.getenv("PREWARM_TIKTOKEN", "1") != "1":
+        return
+    try:
+        _get_encoding(EmbeddingService.EMBEDDING_MODEL)
+    except Exception as e:
+        logger.warning(f"[EmbeddingService] ⚠️ tiktoken 인코더 사전 로딩 실패: {e}")
+
+
 # 싱글톤 인스턴스
 _embedding_service: Optional[EmbeddingService] = None
 
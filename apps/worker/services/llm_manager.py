@@ -3,24 +3,48 @@ LLM Manager - Multi-Provider AI Client
 
 GPT-4o, Gemini, Claude 클라이언트 통합 관리
 Structured Outputs 및 JSON 응답 지원
+스트리밍 JSON 응답 지원 (최상위 필드 단위)
 """
 
+import contextlib
+import copy
+import hashlib
+import importlib.util
 import json
+import os
+import random
 import re
 import asyncio
+import statistics
+import threading
+import time
 import traceback
-from typing import Dict, Any, Optional, List, Type
+import weakref
+from collections import deque
+from typing import TYPE_CHECKING, Dict, Any, AsyncIterator, Iterator, Optional, List, Tuple, Type
 from enum import Enum
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
 import logging
-from datetime import datetime
 
-from openai import AsyncOpenAI
-from google import genai
-from google.genai import types as genai_types
-from anthropic import AsyncAnthropic
+import httpx
+
+# 프로바이더 SDK는 API 키가 설정된 경우에만 __init__에서 import (미사용 SDK 로딩 비용 제거)
+if TYPE_CHECKING:
+    from anthropic import AsyncAnthropic
+    from google import genai
+    from google.genai import types as genai_types
+    from openai import AsyncOpenAI
 
 from config import get_settings
+from utils.disk_cache import DiskCache, derive_key
+from utils.rate_limiter import TokenBucketLimiter
+from utils.ttl_cache import TTLCache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Phase 1: 로깅 설정을 config.py의 LOG_LEVEL에서 가져옴
 settings = get_settings()
@@ -34,6 +58,69 @@ LLM_CONNECT_TIMEOUT = settings.timeout.llm_connect  # 기본 10초
 LLM_MAX_RETRIES = settings.retry.llm_max  # 기본 3회
 LLM_BASE_DELAY = settings.retry.llm_base_delay  # 기본 1초
 LLM_MAX_DELAY = settings.retry.llm_max_delay  # 기본 8초
+LLM_RETRY_JITTER = settings.retry.llm_jitter  # 동시 재시도가 같은 시각에 몰리지 않도록
+# Retry-After 헤더 최대 반영 시간(초)
+LLM_MAX_RETRY_AFTER = 60.0
+
+# LLM 응답 JSON 파싱: orjson 우선, 미설치 시 표준 json
+# (orjson.JSONDecodeError는 json.JSONDecodeError 하위 클래스 → 기존 except 그대로 사용)
+_json_loads = orjson.loads if orjson is not None else json.loads
+# 이 길이 이상 응답은 스레드에서 파싱 (이벤트 루프의 다른 호출이 멈추지 않도록)
+LLM_PARSE_OFFLOAD_CHARS = 32_768
+
+# OpenAI/Claude HTTP 연결 풀 한도 (대량 동시 호출 시 연결/TLS 핸드셰이크 재사용)
+LLM_HTTP_MAX_CONNECTIONS = settings.rate_limit.llm_http_max_connections
+LLM_HTTP_MAX_KEEPALIVE = settings.rate_limit.llm_http_max_keepalive
+# h2 설치 시 HTTP/2 멀티플렉싱 사용
+LLM_HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# 프로바이더별 동시 요청 수 (0이면 제한 없음) - 계정 티어 한도가 높은 순으로 크게
+LLM_PROVIDER_CONCURRENCY = {
+    "openai": settings.rate_limit.llm_concurrency_openai,
+    "claude": settings.rate_limit.llm_concurrency_claude,
+    "gemini": settings.rate_limit.llm_concurrency_gemini,
+}
+
+# 프로바이더별 분당 요청/토큰 한도 (0이면 비활성화) - 429 전에 호출 측에서 대기
+LLM_RPM = settings.rate_limit.llm_rpm
+LLM_TPM = settings.rate_limit.llm_tpm
+# TPM 예약용 프롬프트 토큰 추정: 문자 수 / 2 (한글 위주 이력서 기준 보수적)
+LLM_CHARS_PER_TOKEN = 2
+
+# Claude 프롬프트 캐싱: 이 길이 이상의 system 프롬프트에 cache_control 지정
+# (최소 캐시 단위 미만이면 API가 무시하므로 보수적으로 낮게 설정)
+CLAUDE_PROMPT_CACHE_MIN_CHARS = 2048
+
+# 적응형 모델 라우팅 (0이면 비활성화)
+LLM_ROUTING_MAX_COMPLEXITY = settings.LLM_ROUTING_MAX_COMPLEXITY
+# 스키마 중첩 1단계당 복잡도 가중치
+LLM_ROUTING_SCHEMA_DEPTH_WEIGHT = 50
+
+# LLM 응답 캐시 (동일 요청 재호출 시 API 왕복/토큰 비용 제거)
+# 응답이 사실상 결정적인 낮은 temperature 호출만 캐시
+LLM_CACHE_MAXSIZE = settings.LLM_CACHE_MAXSIZE
+LLM_CACHE_TTL_SECONDS = float(settings.LLM_CACHE_TTL_SECONDS)
+LLM_CACHE_MAX_TEMPERATURE = settings.LLM_CACHE_MAX_TEMPERATURE
+# 스키마 해시 캐시 최대 항목 수 (스키마는 대부분 모듈 상수라 소수)
+LLM_SCHEMA_DIGEST_MAXSIZE = 64
+
+# call_json_batch: 한 요청에 묶을 최대 입력 수 / 묶음 요청의 출력 토큰 상한
+LLM_BATCH_SIZE = 8
+LLM_BATCH_MAX_OUTPUT_TOKENS = 8000
+
+# call_json_hedged: 지연 기록이 부족할 때 다음 프로바이더 추가 요청까지 대기(초)
+LLM_HEDGE_DEFAULT_DELAY = 15.0
+# 최근 성공 지연 기록 수 / p95 계산에 필요한 최소 기록 수
+LLM_HEDGE_LATENCY_WINDOW = 100
+LLM_HEDGE_MIN_SAMPLES = 20
+
+# _extract_json 패턴 (호출마다 re 캐시 조회하지 않도록 모듈 로드 시 컴파일)
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+# OpenAI role → Gemini Content role (system은 system_instruction으로 분리)
+_GEMINI_ROLE = {"user": "user", "assistant": "model"}
+
+# 괄호 스캐너가 확인할 문자 (중괄호, 따옴표, 이스케이프)
+_JSON_SCAN_RE = re.compile(r'[{}"\\]')
 
 # 재시도 대상 에러 패턴 (대소문자 무시)
 RETRYABLE_ERROR_PATTERNS = [
@@ -51,6 +138,289 @@ RETRYABLE_ERROR_PATTERNS = [
     "connection",
     "network",
 ]
+# 재시도 대상 HTTP 상태 코드 (그 외 4xx는 재시도해도 같은 결과)
+_RETRYABLE_STATUS_CODES = frozenset({408, 409, 429})
+# SDK 연결/타임아웃 예외 기반 클래스 이름 (openai/anthropic 공통, SDK는 지연 import라 이름으로 확인)
+_CONNECTION_ERROR_NAMES = frozenset({"APIConnectionError", "APITimeoutError"})
+
+# 재시도 패턴 단일 정규식 (패턴별 부분 문자열 검색/lower() 복사 없이 한 번에 검사)
+_RETRY_RE = re.compile("|".join(map(re.escape, RETRYABLE_ERROR_PATTERNS)), re.IGNORECASE)
+
+
+async def _parse_json(raw: str) -> Any:
+    """응답 JSON 파싱 (큰 응답은 스레드로 오프로딩)"""
+    if len(raw) < LLM_PARSE_OFFLOAD_CHARS:
+        return _json_loads(raw)
+    return await asyncio.to_thread(_json_loads, raw)
+
+
+def _json_dumps(obj: Any) -> str:
+    """JSON 직렬화 (비ASCII 문자 그대로 유지)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False)
+
+
+def _json_dumps_sorted(obj: Any) -> bytes:
+    """키 정렬 JSON 직렬화 (캐시 키용)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(obj, sort_keys=True, ensure_ascii=False).encode()
+
+
+def _iter_json_candidates(text: str) -> Iterator[str]:
+    """
+    텍스트에서 최상위 { ... } 구간을 순서대로 반환
+
+    괄호 깊이와 문자열/이스케이프 상태를 추적하는 단일 스캔 (역추적 없이 O(n))
+    여러 JSON 객체가 섞여 있어도 객체별로 분리, 문자열 안의 괄호는 무시
+    """
+    depth = 0
+    start = 0
+    in_string = False
+    escaped_pos = -1
+
+    for match in _JSON_SCAN_RE.finditer(text):
+        i = match.start()
+        if i == escaped_pos:
+            continue
+        ch = text[i]
+
+        if in_string:
+            if ch == "\\":
+                escaped_pos = i + 1
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            # 객체 밖 따옴표(설명 문구)는 문자열로 취급하지 않음
+            in_string = depth > 0
+        elif ch == "{":
+            if depth == 0:
+                start = i
+            depth += 1
+        elif ch == "}" and depth:
+            depth -= 1
+            if depth == 0:
+                yield text[start:i + 1]
+
+
+def _build_http_client(client_cls: Type[httpx.AsyncClient]) -> httpx.AsyncClient:
+    """
+    SDK 기본 HTTP 클라이언트에 연결 풀 한도/HTTP2/타임아웃 지정
+
+    SDK마다 httpx 구현/기본값(리다이렉트, TCP keepalive)이 다를 수 있어
+    각 SDK의 DefaultAsyncHttpxClient를 사용
+    """
+    return client_cls(
+        http2=LLM_HTTP2_ENABLED,
+        limits=httpx.Limits(
+            max_connections=LLM_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=LLM_HTTP_MAX_KEEPALIVE,
+            # keepalive_expiry는 httpx 기본값(5초) 유지: 풀 연결은 연 이벤트 루프에 묶이는데
+            # run_async는 작업마다 루프를 새로 만들고 닫으므로 오래 유지하면 닫힌 루프의 연결을 재사용
+        ),
+        timeout=httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT),
+    )
+
+
+def _estimate_tokens(messages: List[Dict[str, str]], max_tokens: int) -> int:
+    """TPM 예약용 요청 토큰 추정 (프롬프트 문자 수 기반 + 최대 출력 토큰)"""
+    prompt_chars = sum(len(m.get("content", "")) for m in messages)
+    return prompt_chars // LLM_CHARS_PER_TOKEN + max_tokens
+
+
+def _status_code(exc: Optional[BaseException]) -> Optional[int]:
+    """SDK 예외의 HTTP 상태 코드 (openai/anthropic status_code, google-genai code)"""
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(exc, "code", None)
+    return status if isinstance(status, int) and 100 <= status < 600 else None
+
+
+def _classify_retryable(exc: Optional[BaseException]) -> Optional[bool]:
+    """
+    예외 타입/상태 코드로 재시도 여부 판단 (True/False, 판단 불가 시 None)
+
+    - JSON 파싱 실패: 재시도 불가
+    - HTTP 상태 코드 (openai/anthropic status_code, google-genai code): 408/409/429/5xx만 재시도
+    - 타임아웃/연결 오류: 재시도
+    """
+    if exc is None:
+        return None
+    if isinstance(exc, json.JSONDecodeError):
+        return False
+
+    status = _status_code(exc)
+    if status is not None:
+        return status >= 500 or status in _RETRYABLE_STATUS_CODES
+
+    if isinstance(exc, (asyncio.TimeoutError, ConnectionError, httpx.TransportError)):
+        return True
+    if any(cls.__name__ in _CONNECTION_ERROR_NAMES for cls in type(exc).__mro__):
+        return True
+    return None
+
+
+def _retry_after_seconds(exc: Optional[BaseException]) -> Optional[float]:
+    """SDK 예외의 HTTP 응답에서 Retry-After(초) 추출 (없거나 날짜 형식이면 None)"""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        retry_after_ms = headers.get("retry-after-ms")
+        if retry_after_ms is not None:
+            return float(retry_after_ms) / 1000
+        retry_after = headers.get("retry-after")
+        return float(retry_after) if retry_after is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _schema_depth(schema: Any) -> int:
+    """JSON 스키마(dict/list) 최대 중첩 깊이"""
+    if isinstance(schema, dict):
+        return 1 + max((_schema_depth(v) for v in schema.values()), default=0)
+    if isinstance(schema, list):
+        return max((_schema_depth(v) for v in schema), default=0)
+    return 0
+
+
+def _gemini_usage(response: Any) -> Optional[Dict[str, int]]:
+    """Gemini 응답의 usage_metadata → 토큰 사용량 dict (없으면 None)"""
+    um = getattr(response, "usage_metadata", None)
+    if not um:
+        return None
+    return {
+        "prompt_tokens": um.prompt_token_count or 0,
+        "completion_tokens": um.candidates_token_count or 0,
+        "total_tokens": um.total_token_count or 0,
+    }
+
+
+def _split_claude_messages(
+    messages: List[Dict[str, str]]
+) -> Tuple[Optional[Any], List[Dict[str, str]]]:
+    """
+    OpenAI 메시지 형식을 Claude system + messages로 분리
+
+    긴 system 프롬프트는 ephemeral cache_control 블록으로 전달해
+    반복 호출 시 프리필 토큰을 캐시에서 읽도록 함
+    """
+    system_message = ""
+    user_messages = []
+    for msg in messages:
+        if msg["role"] == "system":
+            system_message = msg["content"]
+        else:
+            user_messages.append(msg)
+
+    if not system_message:
+        return None, user_messages
+    if len(system_message) >= CLAUDE_PROMPT_CACHE_MIN_CHARS:
+        return [{
+            "type": "text",
+            "text": system_message,
+            "cache_control": {"type": "ephemeral"},
+        }], user_messages
+    return system_message, user_messages
+
+
+def _split_gemini_messages(
+    messages: List[Dict[str, str]]
+) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+    """
+    OpenAI 메시지 형식을 Gemini system_instruction + Content 목록으로 분리
+
+    role 접두어 없이 네이티브 대화 형식으로 전달 (알 수 없는 role은 제외)
+    """
+    system = "\n\n".join(m["content"] for m in messages if m["role"] == "system") or None
+    contents = [
+        {"role": _GEMINI_ROLE[m["role"]], "parts": [{"text": m["content"]}]}
+        for m in messages
+        if m["role"] in _GEMINI_ROLE
+    ]
+    if not contents and system:
+        # 대화 턴 없이 system만 있으면 사용자 입력으로 전달 (contents는 비울 수 없음)
+        return None, [{"role": "user", "parts": [{"text": system}]}]
+    return system, contents
+
+
+@lru_cache(maxsize=128)
+def _gemini_config(
+    temperature: float, max_tokens: int, json_mode: bool, system_instruction: Optional[str] = None
+) -> "genai_types.GenerateContentConfig":
+    """
+    Gemini 생성 설정 (동일 인자 조합은 하나의 객체 공유)
+
+    google-genai는 config를 읽기만 하므로 요청 간 공유해도 안전
+    system 프롬프트는 에이전트별 상수라 조합 수가 적음
+    """
+    from google.genai import types as genai_types
+
+    return genai_types.GenerateContentConfig(
+        temperature=temperature,
+        max_output_tokens=max_tokens,
+        response_mime_type="application/json" if json_mode else None,
+        system_instruction=system_instruction,
+    )
+
+
+class _JsonMemberStream:
+    """
+    스트리밍으로 들어오는 JSON 객체의 최상위 필드를 완성되는 대로 파싱
+
+    깊이 1의 쉼표 또는 닫는 중괄호에서 멤버 하나가 끝났다고 보고
+    해당 멤버만 파싱해 (key, value) 반환 → 전체 응답을 기다리지 않음
+    여는 중괄호 전의 설명 문구/코드 펜스는 무시
+    """
+
+    def __init__(self):
+        self._member: List[str] = []
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self.done = False
+
+    def feed(self, text: str) -> List[Tuple[str, Any]]:
+        """텍스트 조각 입력 → 이번 조각에서 완성된 멤버 목록 반환"""
+        members: List[Tuple[str, Any]] = []
+        for ch in text:
+            if self.done:
+                break
+            if self._depth == 0:
+                if ch == "{":
+                    self._depth = 1
+                continue
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch in "{[":
+                self._depth += 1
+            elif ch in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    self._flush(members)
+                    self.done = True
+                    continue
+            elif ch == "," and self._depth == 1:
+                self._flush(members)
+                continue
+
+            self._member.append(ch)
+        return members
+
+    def _flush(self, members: List[Tuple[str, Any]]) -> None:
+        member = "".join(self._member).strip()
+        self._member.clear()
+        if member:
+            members.extend(_json_loads("{" + member + "}").items())
 
 
 class LLMProvider(str, Enum):
@@ -60,7 +430,7 @@ class LLMProvider(str, Enum):
     CLAUDE = "claude"
 
 
-@dataclass
+@dataclass(slots=True)
 class LLMResponse:
     """LLM 응답 결과"""
     provider: LLMProvider
@@ -69,6 +439,8 @@ class LLMResponse:
     model: str
     usage: Optional[Dict[str, int]] = None
     error: Optional[str] = None
+    cached: bool = False  # 응답 캐시 적중 여부 (토큰 사용 없음)
+    exception: Optional[BaseException] = field(default=None, repr=False, compare=False)  # 실패 원인 (재시도 판단용)
 
     @property
     def success(self) -> bool:
@@ -92,14 +464,17 @@ class LLMManager:
         logger.info("=" * 60)
 
         # OpenAI 클라이언트 (타임아웃 설정 포함)
-        self.openai_client: Optional[AsyncOpenAI] = None
+        self.openai_client: Optional["AsyncOpenAI"] = None
         openai_key = settings.OPENAI_API_KEY
         if openai_key:
             try:
-                from httpx import Timeout
+                from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
                 self.openai_client = AsyncOpenAI(
                     api_key=openai_key,
-                    timeout=Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT)
+                    timeout=httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT),
+                    http_client=_build_http_client(DefaultAsyncHttpxClient),
+                    max_retries=0,  # 재시도는 _call_with_retry에서만 (중복 과금 방지)
                 )
                 logger.info(f"[LLMManager] ✅ OpenAI 클라이언트 초기화 성공 (key: {openai_key[:8]}..., timeout: {LLM_TIMEOUT_SECONDS}s)")
             except Exception as e:
@@ -109,10 +484,12 @@ class LLMManager:
             logger.warning("[LLMManager] ⚠️ OPENAI_API_KEY 없음")
 
         # Gemini 클라이언트 (새 google-genai 패키지)
-        self.gemini_client: Optional[genai.Client] = None
+        self.gemini_client: Optional["genai.Client"] = None
         gemini_key = settings.GEMINI_API_KEY
         if gemini_key:
             try:
+                from google import genai
+
                 self.gemini_client = genai.Client(api_key=gemini_key)
                 logger.info(f"[LLMManager] ✅ Gemini 클라이언트 초기화 성공 (key: {gemini_key[:8]}...)")
             except Exception as e:
@@ -122,14 +499,17 @@ class LLMManager:
             logger.warning("[LLMManager] ⚠️ GEMINI_API_KEY 없음")
 
         # Claude 클라이언트 (타임아웃 설정 포함)
-        self.anthropic_client: Optional[AsyncAnthropic] = None
+        self.anthropic_client: Optional["AsyncAnthropic"] = None
         anthropic_key = settings.ANTHROPIC_API_KEY
         if anthropic_key:
             try:
-                from httpx import Timeout
+                from anthropic import AsyncAnthropic, DefaultAsyncHttpxClient
+
                 self.anthropic_client = AsyncAnthropic(
                     api_key=anthropic_key,
-                    timeout=Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT)
+                    timeout=httpx.Timeout(LLM_TIMEOUT_SECONDS, connect=LLM_CONNECT_TIMEOUT),
+                    http_client=_build_http_client(DefaultAsyncHttpxClient),
+                    max_retries=0,  # 재시도는 _call_with_retry에서만 (중복 과금 방지)
                 )
                 logger.info(f"[LLMManager] ✅ Claude 클라이언트 초기화 성공 (key: {anthropic_key[:8]}..., timeout: {LLM_TIMEOUT_SECONDS}s)")
             except Exception as e:
@@ -145,10 +525,125 @@ class LLMManager:
             LLMProvider.CLAUDE: settings.ANTHROPIC_MODEL,
         }
 
+        # API 키 미설정 응답 (프로바이더별로 한 번만 생성)
+        key_names = {LLMProvider.OPENAI: "OpenAI", LLMProvider.GEMINI: "Gemini", LLMProvider.CLAUDE: "Anthropic"}
+        self._unconfigured = {
+            p: LLMResponse(
+                provider=p,
+                content=None,
+                raw_response="",
+                model=self.models[p],
+                error=f"{key_names[p]} API key not configured"
+            )
+            for p in LLMProvider
+        }
+
+        # 적응형 라우팅용 소형 모델 (복잡도가 낮은 요청)
+        self.small_models = {
+            LLMProvider.OPENAI: settings.OPENAI_MINI_MODEL,
+            LLMProvider.GEMINI: settings.GEMINI_MINI_MODEL,
+            LLMProvider.CLAUDE: settings.ANTHROPIC_MINI_MODEL,
+        }
+
+        # 프로바이더별 동시 요청 세마포어 (이벤트 루프 → {provider: Semaphore})
+        # RQ Worker는 스레드마다 별도 이벤트 루프를 쓰므로 루프 단위로 생성
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[LLMProvider, asyncio.Semaphore]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # 프로바이더별 RPM/TPM 한도 (프로세스 내 모든 요청이 공유)
+        self._limiters = {
+            provider: TokenBucketLimiter(rpm=LLM_RPM, tpm=LLM_TPM)
+            for provider in LLMProvider
+        }
+
+        # 프로바이더별 최근 응답 지연(초) - 헤지 대기 시간(p95) 계산용
+        self._latencies: Dict[LLMProvider, deque] = {
+            provider: deque(maxlen=LLM_HEDGE_LATENCY_WINDOW) for provider in LLMProvider
+        }
+
+        # 진행 중인 동일 요청 (이벤트 루프 → {요청 해시: Task}) - 동시 중복 호출 합치기
+        self._inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        # 응답 캐시 (요청 해시 → LLMResponse)
+        self._response_cache = TTLCache(
+            maxsize=LLM_CACHE_MAXSIZE, ttl=LLM_CACHE_TTL_SECONDS
+        )
+
+        # 디스크 응답 캐시 (fork된 작업/재시작 사이 공유, 설정 시에만)
+        # 응답에 이력서 PII가 포함되므로 ENCRYPTION_KEY로 암호화할 수 있을 때만 사용
+        self._disk_cache: Optional[DiskCache] = None
+        if settings.LLM_DISK_CACHE_DIR and not settings.ENCRYPTION_KEY:
+            logger.warning("[LLMManager] ENCRYPTION_KEY 미설정 - 디스크 캐시 비활성화 (PII 평문 저장 방지)")
+        elif settings.LLM_DISK_CACHE_DIR:
+            try:
+                self._disk_cache = DiskCache(
+                    os.path.join(settings.LLM_DISK_CACHE_DIR, "llm_responses.sqlite3"),
+                    ttl=settings.LLM_DISK_CACHE_TTL_SECONDS,
+                    key=derive_key(settings.ENCRYPTION_KEY, b"llm-disk-cache"),
+                )
+            except Exception as e:
+                logger.warning("[LLMManager] 디스크 캐시 초기화 실패: %s", e)
+
+        # 스키마 해시 (id(schema) → (schema, 해시)) - 같은 스키마 객체는 직렬화 생략
+        self._schema_digests: Dict[int, Tuple[Dict[str, Any], str]] = {}
+
         available = self.get_available_providers()
         logger.info(f"[LLMManager] 사용 가능한 프로바이더: {[p.value for p in available]}")
         logger.info("=" * 60)
 
+    async def prewarm(self) -> None:
+        """
+        프로바이더별 경량 요청(모델 목록 1건)으로 TLS/HTTP2 연결을 미리 수립
+
+        연결 풀은 이벤트 루프에 묶이므로 호출을 처리할 장수명 루프(앱 lifespan)에서 실행.
+        실패는 무시 (실제 호출 시 다시 연결)
+        """
+        warmups = []
+        if self.openai_client:
+            warmups.append(("OpenAI", self.openai_client.models.list()))
+        if self.gemini_client:
+            warmups.append(("Gemini", self.gemini_client.aio.models.list(config={"page_size": 1})))
+        if self.anthropic_client:
+            warmups.append(("Claude", self.anthropic_client.models.list(limit=1)))
+        if not warmups:
+            return
+
+        start_time = time.perf_counter()
+        results = await asyncio.gather(
+            *(asyncio.wait_for(coro, timeout=LLM_CONNECT_TIMEOUT) for _, coro in warmups),
+            return_exceptions=True,
+        )
+        for (name, _), result in zip(warmups, results):
+            if isinstance(result, BaseException):
+                logger.warning("[LLMManager] %s 연결 예열 실패: %s", name, result)
+
+        elapsed = time.perf_counter() - start_time
+        logger.info("[LLMManager] 연결 예열 완료 (%.2fs)", elapsed)
+
+    async def aclose(self) -> None:
+        """SDK 클라이언트의 HTTP 연결 풀 정리 (종료 시 호출)"""
+        clients = [
+            ("OpenAI", self.openai_client),
+            ("Gemini", self.gemini_client.aio if self.gemini_client else None),
+            ("Claude", self.anthropic_client),
+        ]
+        for name, client in clients:
+            if client is None:
+                continue
+            try:
+                close = client.aclose if hasattr(client, "aclose") else client.close
+                await close()
+            except Exception as e:
+                logger.warning("[LLMManager] %s 클라이언트 종료 실패: %s", name, e)
+
+    def _unconfigured_response(self, provider: LLMProvider, model: Optional[str]) -> LLMResponse:
+        """API 키 미설정 응답 (기본 모델이면 미리 만든 객체 재사용)"""
+        response = self._unconfigured[provider]
+        return response if model is None else replace(response, model=model)
+
     def _is_retryable_error(self, error_message: str) -> bool:
         """
         T3-1: 재시도 가능한 에러인지 판단
@@ -164,11 +659,20 @@ class LLMManager:
         - Validation 에러 (400)
         - JSON 파싱 에러
         """
-        if not error_message:
-            return False
+        return bool(error_message) and _RETRY_RE.search(error_message) is not None
 
-        error_lower = error_message.lower()
-        return any(pattern in error_lower for pattern in RETRYABLE_ERROR_PATTERNS)
+    def _provider_semaphore(self, provider: LLMProvider) -> Optional[asyncio.Semaphore]:
+        """현재 이벤트 루프의 프로바이더 세마포어 반환 (동시 요청 제한 비활성화 시 None)"""
+        limit = LLM_PROVIDER_CONCURRENCY.get(provider.value, 0)
+        if limit <= 0:
+            return None
+
+        loop = asyncio.get_running_loop()
+        semaphores = self._semaphores.setdefault(loop, {})
+        semaphore = semaphores.get(provider)
+        if semaphore is None:
+            semaphore = semaphores[provider] = asyncio.Semaphore(limit)
+        return semaphore
 
     async def _call_with_retry(
         self,
@@ -181,21 +685,33 @@ class LLMManager:
         T3-1: Exponential backoff 재시도 래퍼
 
         - 최대 재시도: LLM_MAX_RETRIES (기본 3회)
-        - 백오프: 1s, 2s, 4s (base_delay * 2^attempt)
-        - 최대 대기: LLM_MAX_DELAY (기본 8초)
+        - 백오프: 1s, 2s, 4s (base_delay * 2^attempt) * (1 + 0~jitter)
+        - 최대 대기: LLM_MAX_DELAY (기본 8초), 단 Retry-After 헤더가 더 길면 따름 (최대 60초)
+        - 각 시도는 프로바이더 세마포어 안에서 실행 (백오프 대기는 세마포어 밖)
+        - 각 시도 전 RPM/TPM 한도 대기 (재시도도 한도에 포함)
+        - 429 응답 시 백오프 동안 같은 프로바이더의 다른 호출도 멈춤 (limiter.pause)
 
         Args:
             provider: LLM 제공자
             call_func: 실제 API 호출 함수
-            *args, **kwargs: call_func에 전달할 인자
+            *args, **kwargs: call_func에 전달할 인자 (messages, ..., max_tokens 순)
 
         Returns:
             LLMResponse (성공 또는 마지막 실패)
         """
         last_response: Optional[LLMResponse] = None
+        semaphore = self._provider_semaphore(provider)
+        limiter = self._limiters.get(provider)
+        estimated_tokens = _estimate_tokens(args[0], args[-1]) if limiter.enabled else 0
 
         for attempt in range(LLM_MAX_RETRIES + 1):  # 초기 시도 + 재시도
-            response = await call_func(*args, **kwargs)
+            await limiter.acquire(estimated_tokens)
+
+            if semaphore is None:
+                response = await call_func(*args, **kwargs)
+            else:
+                async with semaphore:
+                    response = await call_func(*args, **kwargs)
 
             # 성공하면 바로 반환
             if response.success:
@@ -205,9 +721,12 @@ class LLMManager:
 
             last_response = response
 
-            # 재시도 가능한 에러가 아니면 바로 반환
-            if not self._is_retryable_error(response.error or ""):
-                logger.debug(f"[LLMManager] {provider.value} 에러는 재시도 불가: {response.error}")
+            # 재시도 가능한 에러가 아니면 바로 반환 (예외 타입 우선, 판단 불가 시 메시지 패턴)
+            retryable = _classify_retryable(response.exception)
+            if retryable is None:
+                retryable = self._is_retryable_error(response.error or "")
+            if not retryable:
+                logger.debug("[LLMManager] %s 에러는 재시도 불가: %s", provider.value, response.error)
                 return response
 
             # 마지막 시도였으면 반환
@@ -217,8 +736,14 @@ class LLMManager:
                 )
                 return response
 
-            # Exponential backoff 대기
+            # Exponential backoff + jitter 대기 (Retry-After가 더 길면 따름)
             delay = min(LLM_BASE_DELAY * (2 ** attempt), LLM_MAX_DELAY)
+            delay *= 1 + random.uniform(0, LLM_RETRY_JITTER)
+            retry_after = _retry_after_seconds(response.exception)
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, LLM_MAX_RETRY_AFTER))
+            if _status_code(response.exception) == 429:
+                limiter.pause(delay)
             logger.warning(
                 f"[LLMManager] ⚠️ {provider.value} 재시도 가능한 에러 감지, "
                 f"{delay:.1f}초 후 재시도 ({attempt + 1}/{LLM_MAX_RETRIES}): {response.error}"
@@ -234,6 +759,153 @@ class LLMManager:
             error="Unexpected retry loop exit"
         )
 
+    def _response_cache_key(
+        self,
+        kind: str,
+        provider: LLMProvider,
+        messages: List[Dict[str, str]],
+        json_schema: Optional[Dict[str, Any]],
+        model: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        no_cache: bool,
+    ) -> Optional[str]:
+        """
+        응답 캐시 키 계산
+
+        no_cache 요청, temperature가 높은 호출, 알 수 없는 프로바이더는 캐시하지 않음 (None)
+        """
+        if no_cache or temperature > LLM_CACHE_MAX_TEMPERATURE or provider not in self.models:
+            return None
+
+        payload = [
+            kind, provider.value, model or self.models[provider],
+            messages, self._schema_digest(json_schema), temperature, max_tokens,
+        ]
+        return hashlib.sha256(_json_dumps_sorted(payload)).hexdigest()
+
+    def _schema_digest(self, json_schema: Optional[Dict[str, Any]]) -> Optional[str]:
+        """
+        JSON 스키마 해시 (객체 id 기준 캐시)
+
+        스키마는 모듈 상수로 재사용되므로 같은 객체면 정렬 직렬화를 건너뜀.
+        항목에 스키마 참조를 보관해 id 재사용으로 다른 스키마와 섞이지 않음.
+        주의: 스키마 객체를 제자리 수정하면 이전 해시가 그대로 사용됨
+        """
+        if json_schema is None:
+            return None
+
+        entry = self._schema_digests.get(id(json_schema))
+        if entry is not None and entry[0] is json_schema:
+            return entry[1]
+
+        digest = hashlib.sha256(_json_dumps_sorted(json_schema)).hexdigest()
+        if len(self._schema_digests) >= LLM_SCHEMA_DIGEST_MAXSIZE:
+            self._schema_digests.clear()
+        self._schema_digests[id(json_schema)] = (json_schema, digest)
+        return digest
+
+    async def _call_cached(
+        self,
+        cache_key: Optional[str],
+        provider: LLMProvider,
+        call_func,
+        *args
+    ) -> LLMResponse:
+        """
+        응답 캐시 → 진행 중 요청 → 실제 호출 순으로 처리, 성공 응답만 캐시에 저장
+
+        - content가 None인 응답(Claude JSON 추출 실패 등)은 캐시하지 않음 → 다음 요청에서 다시 생성
+
+        - 동일 요청이 이미 진행 중이면 새로 호출하지 않고 그 결과를 공유
+          (실제 호출은 Task로 실행 → 먼저 요청한 쪽이 취소되어도 나머지는 계속 대기)
+        - 캐시/공유 결과는 토큰 사용 0, cached=True
+        - content는 호출자가 수정할 수 있으므로 항상 복사본 반환
+        """
+        if cache_key is None:
+            return await self._call_with_retry(provider, call_func, *args)
+
+        cached = self._response_cache.get(cache_key)
+        if cached is None:
+            cached = self._disk_cache_get(cache_key)
+        if cached is not None:
+            logger.info("[LLMManager] ✅ %s 응답 캐시 적중", provider.value)
+            return self._shared_response(cached)
+
+        loop = asyncio.get_running_loop()
+        inflight = self._inflight.get(loop)
+        if inflight is None:
+            inflight = self._inflight[loop] = {}
+
+        task = inflight.get(cache_key)
+        if task is not None:
+            logger.info("[LLMManager] %s 동일 요청 진행 중 - 결과 공유", provider.value)
+            return self._shared_response(await asyncio.shield(task))
+
+        task = loop.create_task(self._call_with_retry(provider, call_func, *args))
+        inflight[cache_key] = task
+
+        def _on_done(done: asyncio.Task) -> None:
+            inflight.pop(cache_key, None)
+            if done.cancelled() or done.exception() is not None:
+                return
+            result = done.result()
+            if result.success and result.content is not None:
+                self._response_cache.set(cache_key, result)
+                self._disk_cache_set(cache_key, result)
+
+        task.add_done_callback(_on_done)
+
+        response = await asyncio.shield(task)
+        return replace(response, content=copy.deepcopy(response.content))
+
+    def _disk_cache_get(self, cache_key: str) -> Optional[LLMResponse]:
+        """디스크 캐시 조회 (적중 시 메모리 캐시에도 저장)"""
+        if self._disk_cache is None:
+            return None
+        data = self._disk_cache.get(cache_key)
+        if data is None:
+            return None
+        try:
+            entry = _json_loads(data)
+            response = LLMResponse(
+                provider=LLMProvider(entry["provider"]),
+                content=entry["content"],
+                raw_response=entry["raw_response"],
+                model=entry["model"],
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning("[LLMManager] 디스크 캐시 항목 손상: %s", e)
+            return None
+        self._response_cache.set(cache_key, response)
+        return response
+
+    def _disk_cache_set(self, cache_key: str, response: LLMResponse) -> None:
+        """디스크 캐시 저장 (직렬화할 수 없는 응답은 건너뜀)"""
+        if self._disk_cache is None:
+            return
+        try:
+            data = _json_dumps({
+                "provider": response.provider.value,
+                "content": response.content,
+                "raw_response": response.raw_response,
+                "model": response.model,
+            }).encode()
+        except (TypeError, ValueError) as e:
+            logger.warning("[LLMManager] 디스크 캐시 직렬화 실패: %s", e)
+            return
+        self._disk_cache.set(cache_key, data)
+
+    @staticmethod
+    def _shared_response(response: LLMResponse) -> LLMResponse:
+        """캐시/진행 중 요청에서 받은 응답 복사본 (토큰 사용 없음)"""
+        return replace(
+            response,
+            content=copy.deepcopy(response.content),
+            usage={"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+            cached=True,
+        )
+
     async def call_with_structured_output(
         self,
         provider: LLMProvider,
@@ -242,6 +914,7 @@ class LLMManager:
         model: Optional[str] = None,
         temperature: float = 0.1,
         max_tokens: int = 8192,
+        no_cache: bool = False,
     ) -> LLMResponse:
         """
         Structured Output으로 JSON 응답 요청 (OpenAI 전용)
@@ -253,6 +926,7 @@ class LLMManager:
             model: 사용할 모델 (기본: gpt-4o)
             temperature: 생성 온도
             max_tokens: 최대 토큰 수
+            no_cache: True면 응답 캐시 사용 안 함 (민감한 프롬프트 등)
 
         Returns:
             LLMResponse with parsed JSON content
@@ -270,20 +944,19 @@ class LLMManager:
                 model=model,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                no_cache=no_cache,
             )
 
         if not self.openai_client:
             logger.error("[LLMManager] ❌ OpenAI 클라이언트 없음 - API 키 미설정")
-            return LLMResponse(
-                provider=provider,
-                content=None,
-                raw_response="",
-                model=model or self.models[provider],
-                error="OpenAI API key not configured"
-            )
+            return self._unconfigured_response(provider, model)
 
         # T3-1: 재시도 래퍼 적용
-        return await self._call_with_retry(
+        cache_key = self._response_cache_key(
+            "structured", provider, messages, json_schema, model, temperature, max_tokens, no_cache
+        )
+        return await self._call_cached(
+            cache_key,
             provider,
             self._call_openai_structured_output,
             messages, json_schema, model, temperature, max_tokens
@@ -298,13 +971,14 @@ class LLMManager:
         max_tokens: int,
     ) -> LLMResponse:
         """OpenAI Structured Output 내부 호출 (재시도 래퍼용)"""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         provider = LLMProvider.OPENAI
 
         try:
             model_name = model or self.models[provider]
             logger.info(f"[LLMManager] OpenAI API 호출 시작 - model: {model_name}")
-            logger.debug(f"[LLMManager] 메시지 길이: {sum(len(m.get('content', '')) for m in messages)} chars")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[LLMManager] 메시지 길이: %d chars", sum(len(m.get("content", "")) for m in messages))
 
             response = await self.openai_client.chat.completions.create(
                 model=model_name,
@@ -317,12 +991,13 @@ class LLMManager:
                 }
             )
 
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             raw_content = response.choices[0].message.content or ""
             logger.info(f"[LLMManager] ✅ OpenAI API 응답 수신 - {elapsed:.2f}초, {len(raw_content)} chars")
-            logger.debug(f"[LLMManager] OpenAI 응답 미리보기: {raw_content[:500]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[LLMManager] OpenAI 응답 미리보기: %s...", raw_content[:500])
 
-            parsed_content = json.loads(raw_content)
+            parsed_content = await _parse_json(raw_content)
             logger.info(f"[LLMManager] ✅ OpenAI JSON 파싱 성공 - 필드 수: {len(parsed_content) if isinstance(parsed_content, dict) else 'N/A'}")
 
             return LLMResponse(
@@ -338,7 +1013,7 @@ class LLMManager:
             )
 
         except json.JSONDecodeError as e:
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             logger.error(f"[LLMManager] ❌ OpenAI JSON 파싱 실패 ({elapsed:.2f}초): {e}")
             logger.error(f"[LLMManager] 원본 응답: {raw_content[:1000] if 'raw_content' in locals() else 'N/A'}")
             return LLMResponse(
@@ -346,10 +1021,11 @@ class LLMManager:
                 content=None,
                 raw_response=raw_content if 'raw_content' in locals() else "",
                 model=model or self.models[provider],
-                error=f"JSON parse error: {str(e)}"
+                error=f"JSON parse error: {str(e)}",
+                exception=e,
             )
         except Exception as e:
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             logger.error(f"[LLMManager] ❌ OpenAI API 오류 ({elapsed:.2f}초): {type(e).__name__}: {e}")
             logger.error(f"[LLMManager] 상세 오류:\n{traceback.format_exc()}")
             return LLMResponse(
@@ -357,7 +1033,8 @@ class LLMManager:
                 content=None,
                 raw_response="",
                 model=model or self.models[provider],
-                error=str(e)
+                error=str(e),
+                exception=e,
             )
 
     async def call_json(
@@ -368,29 +1045,90 @@ class LLMManager:
         model: Optional[str] = None,
         temperature: float = 0.1,
         max_tokens: int = 8192,
+        no_cache: bool = False,
     ) -> LLMResponse:
         """
         JSON 응답 요청 (모든 프로바이더 지원)
 
         스키마를 프롬프트에 포함시켜 JSON 응답 유도
         T3-1: Exponential backoff 재시도 적용
+        동일 요청은 응답 캐시 재사용 (no_cache=True로 비활성화)
+        모델 미지정 + 복잡도가 낮으면 소형 모델 사용, 실패 시 기본 모델로 한 번 재요청
         """
         logger.info(f"[LLMManager] call_json 시작 - provider: {provider.value}")
 
+        small_model = self._route_small_model(provider, messages, json_schema) if model is None else None
+        if small_model:
+            response = await self._call_json_with(
+                provider, messages, json_schema, small_model, temperature, max_tokens, no_cache
+            )
+            if response.success and response.content is not None:
+                return response
+            logger.info(
+                "[LLMManager] 라우팅 승격: %s 소형 모델(%s) 실패 → 기본 모델 재요청",
+                provider.value, small_model
+            )
+
+        return await self._call_json_with(
+            provider, messages, json_schema, model, temperature, max_tokens, no_cache
+        )
+
+    def _route_small_model(
+        self,
+        provider: LLMProvider,
+        messages: List[Dict[str, str]],
+        json_schema: Optional[Dict[str, Any]],
+    ) -> Optional[str]:
+        """
+        적응형 라우팅: 복잡도가 임계값 이하이면 소형 모델명, 아니면 None
+
+        복잡도 = 추정 프롬프트 토큰(문자 수 / 4) + 스키마 깊이 * 가중치
+        """
+        if LLM_ROUTING_MAX_COMPLEXITY <= 0 or provider not in self.small_models:
+            return None
+
+        prompt_tokens = sum(len(m.get("content", "")) for m in messages) // 4
+        complexity = prompt_tokens + LLM_ROUTING_SCHEMA_DEPTH_WEIGHT * _schema_depth(json_schema)
+        small = complexity <= LLM_ROUTING_MAX_COMPLEXITY
+
+        logger.info(
+            "[LLMManager] 라우팅: provider=%s complexity=%d threshold=%d route=%s",
+            provider.value, complexity, LLM_ROUTING_MAX_COMPLEXITY, "small" if small else "default"
+        )
+        return self.small_models[provider] if small else None
+
+    async def _call_json_with(
+        self,
+        provider: LLMProvider,
+        messages: List[Dict[str, str]],
+        json_schema: Optional[Dict[str, Any]],
+        model: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        no_cache: bool,
+    ) -> LLMResponse:
+        """지정 모델로 프로바이더별 JSON 호출 (캐시/재시도 적용)"""
+        cache_key = self._response_cache_key(
+            "json", provider, messages, json_schema, model, temperature, max_tokens, no_cache
+        )
+
         if provider == LLMProvider.OPENAI:
-            return await self._call_with_retry(
+            return await self._call_cached(
+                cache_key,
                 provider,
                 self._call_openai_json,
                 messages, json_schema, model, temperature, max_tokens
             )
         elif provider == LLMProvider.GEMINI:
-            return await self._call_with_retry(
+            return await self._call_cached(
+                cache_key,
                 provider,
                 self._call_gemini_json,
                 messages, json_schema, model, temperature, max_tokens
             )
         elif provider == LLMProvider.CLAUDE:
-            return await self._call_with_retry(
+            return await self._call_cached(
+                cache_key,
                 provider,
                 self._call_claude_json,
                 messages, json_schema, model, temperature, max_tokens
@@ -405,6 +1143,256 @@ class LLMManager:
                 error=f"Unknown provider: {provider}"
             )
 
+    async def call_all(
+        self,
+        messages: List[Dict[str, str]],
+        json_schema: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.1,
+        max_tokens: int = 8192,
+        providers: Optional[List[LLMProvider]] = None,
+    ) -> Dict[LLMProvider, LLMResponse]:
+        """
+        여러 프로바이더에 JSON 응답을 동시에 요청 (교차 검증/폴백용)
+
+        전체 지연 = 가장 느린 프로바이더 (순차 호출 시 합계)
+        프로바이더별 동시 요청 수는 세마포어로 제한
+
+        Args:
+            providers: 호출할 프로바이더 (기본: 사용 가능한 전체)
+
+        Returns:
+            {provider: LLMResponse} - 예외는 실패 응답으로 변환
+        """
+        providers = providers if providers is not None else self.get_available_providers()
+
+        results = await asyncio.gather(
+            *(
+                self.call_json(
+                    provider=p,
+                    messages=messages,
+                    json_schema=json_schema,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+                for p in providers
+            ),
+            return_exceptions=True,
+        )
+
+        responses: Dict[LLMProvider, LLMResponse] = {}
+        for provider, result in zip(providers, results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, BaseException):
+                logger.error("[LLMManager] ❌ %s 호출 실패: %s", provider.value, result)
+                result = LLMResponse(
+                    provider=provider,
+                    content=None,
+                    raw_response="",
+                    model=self.models.get(provider, "unknown"),
+                    error=str(result)
+                )
+            responses[provider] = result
+        return responses
+
+    async def call_json_hedged(
+        self,
+        messages: List[Dict[str, str]],
+        json_schema: Optional[Dict[str, Any]] = None,
+        temperature: float = 0.1,
+        max_tokens: int = 8192,
+        providers: Optional[List[LLMProvider]] = None,
+        hedge_delay: Optional[float] = None,
+        no_cache: bool = False,
+    ) -> LLMResponse:
+        """
+        헤지 요청: 첫 프로바이더가 늦거나 실패하면 다음 프로바이더에 추가 요청, 먼저 성공한 응답 반환
+
+        - 대기 시간 = hedge_delay 또는 직전 프로바이더의 최근 지연 p95 (기록 부족 시 기본값)
+        - 실패 응답이 오면 대기 없이 다음 프로바이더 요청
+        - 성공 응답이 오면 나머지 요청은 취소, 모두 실패하면 마지막 실패 응답 반환
+          (캐시 대상 요청은 대기만 취소되고 API 호출은 끝까지 진행되어 캐시에 저장)
+
+        Args:
+            providers: 시도 순서 (기본: 사용 가능한 전체)
+
+        Raises:
+            ValueError: 사용 가능한 프로바이더 없음
+        """
+        remaining = list(providers if providers is not None else self.get_available_providers())
+        if not remaining:
+            raise ValueError("No LLM provider configured")
+
+        tasks: Dict[asyncio.Task, Tuple[LLMProvider, float]] = {}
+        last_provider = remaining[0]
+        last_response: Optional[LLMResponse] = None
+
+        def launch() -> None:
+            nonlocal last_provider
+            last_provider = remaining.pop(0)
+            task = asyncio.ensure_future(self.call_json(
+                provider=last_provider,
+                messages=messages,
+                json_schema=json_schema,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                no_cache=no_cache,
+            ))
+            tasks[task] = (last_provider, time.perf_counter())
+
+        launch()
+        try:
+            while tasks:
+                timeout = None
+                if remaining:
+                    timeout = hedge_delay if hedge_delay is not None else self._hedge_delay(last_provider)
+
+                done, _ = await asyncio.wait(tasks, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    logger.info(
+                        "[LLMManager] 헤지: %s 응답 %.1f초 초과 → %s 추가 요청",
+                        last_provider.value, timeout, remaining[0].value
+                    )
+                    launch()
+                    continue
+
+                for task in done:
+                    provider, started = tasks.pop(task)
+                    try:
+                        response = task.result()
+                    except Exception as e:
+                        logger.error("[LLMManager] ❌ %s 헤지 요청 실패: %s", provider.value, e)
+                        response = LLMResponse(
+                            provider=provider,
+                            content=None,
+                            raw_response="",
+                            model=self.models.get(provider, "unknown"),
+                            error=str(e),
+                            exception=e,
+                        )
+
+                    if response.success:
+                        if not response.cached:
+                            self._latencies[provider].append(time.perf_counter() - started)
+                        return response
+                    last_response = response
+
+                if remaining:
+                    launch()
+
+            return last_response
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _hedge_delay(self, provider: LLMProvider) -> float:
+        """프로바이더의 최근 성공 지연 p95 (기록 부족 시 기본값)"""
+        samples = self._latencies[provider]
+        if len(samples) < LLM_HEDGE_MIN_SAMPLES:
+            return LLM_HEDGE_DEFAULT_DELAY
+        return statistics.quantiles(samples, n=20)[-1]
+
+    async def call_json_batch(
+        self,
+        provider: LLMProvider,
+        system_prompt: str,
+        prompts: List[str],
+        json_schema: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        temperature: float = 0.1,
+        max_tokens_per_item: int = 1000,
+        batch_size: int = LLM_BATCH_SIZE,
+    ) -> List[LLMResponse]:
+        """
+        같은 system 프롬프트/스키마의 여러 입력을 묶어서 JSON 요청 (RPM/프롬프트 토큰 절감)
+
+        - 묶음 크기 = min(batch_size, 출력 토큰 상한 / 항목당 출력 토큰)
+        - 묶음 응답은 {"results": [...]} (JSON 모드는 최상위 객체만 허용)
+        - 결과 수가 다르거나 실패한 묶음은 항목별 call_json으로 다시 요청
+        - 묶음의 토큰 사용량은 첫 항목에만 기록 (합계 유지)
+
+        Returns:
+            prompts 순서대로 LLMResponse
+        """
+        size = max(1, min(batch_size, LLM_BATCH_MAX_OUTPUT_TOKENS // max(max_tokens_per_item, 1)))
+        groups = [prompts[i:i + size] for i in range(0, len(prompts), size)]
+
+        results = await asyncio.gather(*(
+            self._call_json_group(
+                provider, system_prompt, group, json_schema, model, temperature, max_tokens_per_item
+            )
+            for group in groups
+        ))
+        return [response for group in results for response in group]
+
+    async def _call_json_group(
+        self,
+        provider: LLMProvider,
+        system_prompt: str,
+        prompts: List[str],
+        json_schema: Optional[Dict[str, Any]],
+        model: Optional[str],
+        temperature: float,
+        max_tokens_per_item: int,
+    ) -> List[LLMResponse]:
+        """call_json_batch 묶음 하나 처리"""
+        def single_messages(prompt: str) -> List[Dict[str, str]]:
+            return [
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ]
+
+        if len(prompts) > 1:
+            inputs = "\n\n".join(f"### Input {i}\n{p}" for i, p in enumerate(prompts, 1))
+            batch_prompt = (
+                f"Process these {len(prompts)} inputs independently.\n"
+                f'Respond with ONLY a JSON object {{"results": [...]}} containing exactly '
+                f"{len(prompts)} results in the same order as the inputs.\n\n{inputs}"
+            )
+            batch_schema = (
+                {"type": "object", "properties": {"results": {"type": "array", "items": json_schema}}}
+                if json_schema else None
+            )
+            response = await self.call_json(
+                provider=provider,
+                messages=single_messages(batch_prompt),
+                json_schema=batch_schema,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens_per_item * len(prompts),
+            )
+
+            items = response.content.get("results") if isinstance(response.content, dict) else None
+            if response.success and isinstance(items, list) and len(items) == len(prompts):
+                return [
+                    LLMResponse(
+                        provider=provider,
+                        content=item,
+                        raw_response=_json_dumps(item),
+                        model=response.model,
+                        usage=response.usage if i == 0 else None,
+                        cached=response.cached,
+                    )
+                    for i, item in enumerate(items)
+                ]
+
+            logger.warning(
+                "[LLMManager] 묶음 응답 불일치 (%d건 요청, 결과 %s) → 개별 요청",
+                len(prompts), len(items) if isinstance(items, list) else response.error
+            )
+
+        return list(await asyncio.gather(*(
+            self.call_json(
+                provider=provider,
+                messages=single_messages(prompt),
+                json_schema=json_schema,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens_per_item,
+            )
+            for prompt in prompts
+        )))
+
     async def _call_openai_json(
         self,
         messages: List[Dict[str, str]],
@@ -415,13 +1403,7 @@ class LLMManager:
     ) -> LLMResponse:
         """OpenAI JSON 모드 호출"""
         if not self.openai_client:
-            return LLMResponse(
-                provider=LLMProvider.OPENAI,
-                content=None,
-                raw_response="",
-                model=model or self.models[LLMProvider.OPENAI],
-                error="OpenAI API key not configured"
-            )
+            return self._unconfigured_response(LLMProvider.OPENAI, model)
 
         try:
             model_name = model or self.models[LLMProvider.OPENAI]
@@ -435,7 +1417,7 @@ class LLMManager:
             )
 
             raw_content = response.choices[0].message.content or ""
-            parsed_content = json.loads(raw_content)
+            parsed_content = await _parse_json(raw_content)
 
             return LLMResponse(
                 provider=LLMProvider.OPENAI,
@@ -456,7 +1438,8 @@ class LLMManager:
                 content=None,
                 raw_response="",
                 model=model or self.models[LLMProvider.OPENAI],
-                error=str(e)
+                error=str(e),
+                exception=e,
             )
 
     async def _call_gemini_json(
@@ -468,90 +1451,72 @@ class LLMManager:
         max_tokens: int,
     ) -> LLMResponse:
         """Gemini JSON 모드 호출 (새 google-genai 패키지)"""
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         logger.info("[LLMManager] Gemini JSON 호출 시작")
 
         if not self.gemini_client:
             logger.error("[LLMManager] ❌ Gemini 클라이언트 없음 - API 키 미설정")
-            return LLMResponse(
-                provider=LLMProvider.GEMINI,
-                content=None,
-                raw_response="",
-                model=model or self.models[LLMProvider.GEMINI],
-                error="Gemini API key not configured"
-            )
+            return self._unconfigured_response(LLMProvider.GEMINI, model)
 
         try:
             model_name = model or self.models[LLMProvider.GEMINI]
             logger.info(f"[LLMManager] Gemini API 호출 - model: {model_name}")
 
             # OpenAI 메시지 형식을 Gemini 형식으로 변환
-            prompt = self._convert_messages_to_prompt(messages)
-            logger.debug(f"[LLMManager] Gemini 프롬프트 길이: {len(prompt)} chars")
+            system, contents = _split_gemini_messages(messages)
 
             # 새 google-genai API 사용
-            config = genai_types.GenerateContentConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-                response_mime_type="application/json",
-            )
+            config = _gemini_config(temperature, max_tokens, True, system)
 
             logger.info("[LLMManager] Gemini generate_content 호출 중...")
 
-            # google-genai는 동기 API이므로 asyncio.to_thread 사용 (타임아웃 적용)
+            # google-genai 네이티브 비동기 클라이언트 사용 (스레드풀 점유 없음, 타임아웃 시 요청 취소)
             try:
                 response = await asyncio.wait_for(
-                    asyncio.to_thread(
-                        self.gemini_client.models.generate_content,
+                    self.gemini_client.aio.models.generate_content(
                         model=model_name,
-                        contents=prompt,
+                        contents=contents,
                         config=config
                     ),
                     timeout=LLM_TIMEOUT_SECONDS
                 )
-            except asyncio.TimeoutError:
-                elapsed = (datetime.now() - start_time).total_seconds()
+            except asyncio.TimeoutError as e:
+                elapsed = time.perf_counter() - start_time
                 logger.error(
-                    f"[LLMManager] ❌ Gemini API 타임아웃 ({LLM_TIMEOUT_SECONDS}초 초과, 실제 {elapsed:.1f}초)\n"
-                    f"⚠️ 주의: API 요청이 이미 전송되어 과금될 수 있습니다.\n"
-                    f"   모델: {model_name}, 프롬프트 길이: {len(prompt)} chars"
+                    f"[LLMManager] ❌ Gemini API 타임아웃 ({LLM_TIMEOUT_SECONDS}초 초과, 실제 {elapsed:.1f}초) - 요청 취소\n"
+                    f"   모델: {model_name}, 프롬프트 길이: {sum(len(m['content']) for m in messages)} chars"
                 )
                 return LLMResponse(
                     provider=LLMProvider.GEMINI,
                     content=None,
                     raw_response="",
                     model=model_name,
-                    error=f"Gemini API timeout after {LLM_TIMEOUT_SECONDS} seconds (request may still be billed)"
+                    error=f"Gemini API timeout after {LLM_TIMEOUT_SECONDS} seconds (request cancelled)",
+                    exception=e,
                 )
 
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             raw_content = response.text
             logger.info(f"[LLMManager] ✅ Gemini API 응답 수신 - {elapsed:.2f}초, {len(raw_content)} chars")
-            logger.debug(f"[LLMManager] Gemini 응답 미리보기: {raw_content[:500]}...")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[LLMManager] Gemini 응답 미리보기: %s...", raw_content[:500])
 
-            parsed_content = json.loads(raw_content)
+            parsed_content = await _parse_json(raw_content)
             logger.info(f"[LLMManager] ✅ Gemini JSON 파싱 성공 - 필드 수: {len(parsed_content) if isinstance(parsed_content, dict) else 'N/A'}")
 
-            # usage_metadata 접근
-            usage = {}
-            if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                usage = {
-                    "prompt_tokens": getattr(response.usage_metadata, 'prompt_token_count', 0),
-                    "completion_tokens": getattr(response.usage_metadata, 'candidates_token_count', 0),
-                    "total_tokens": getattr(response.usage_metadata, 'total_token_count', 0),
-                }
-                logger.debug(f"[LLMManager] Gemini 토큰 사용: {usage}")
+            usage = _gemini_usage(response)
+            logger.debug("[LLMManager] Gemini 토큰 사용: %s", usage)
 
             return LLMResponse(
                 provider=LLMProvider.GEMINI,
                 content=parsed_content,
                 raw_response=raw_content,
                 model=model_name,
-                usage=usage if usage else None
+                usage=usage
             )
 
         except json.JSONDecodeError as e:
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             logger.error(f"[LLMManager] ❌ Gemini JSON 파싱 실패 ({elapsed:.2f}초): {e}")
             logger.error(f"[LLMManager] 원본 응답: {raw_content[:1000] if 'raw_content' in locals() else 'N/A'}")
             return LLMResponse(
@@ -559,10 +1524,11 @@ class LLMManager:
                 content=None,
                 raw_response=raw_content if 'raw_content' in locals() else "",
                 model=model or self.models[LLMProvider.GEMINI],
-                error=f"JSON parse error: {str(e)}"
+                error=f"JSON parse error: {str(e)}",
+                exception=e,
             )
         except Exception as e:
-            elapsed = (datetime.now() - start_time).total_seconds()
+            elapsed = time.perf_counter() - start_time
             logger.error(f"[LLMManager] ❌ Gemini API 오류 ({elapsed:.2f}초): {type(e).__name__}: {e}")
             logger.error(f"[LLMManager] 상세 오류:\n{traceback.format_exc()}")
             return LLMResponse(
@@ -570,7 +1536,8 @@ class LLMManager:
                 content=None,
                 raw_response="",
                 model=model or self.models[LLMProvider.GEMINI],
-                error=str(e)
+                error=str(e),
+                exception=e,
             )
 
     async def _call_claude_json(
@@ -583,39 +1550,29 @@ class LLMManager:
     ) -> LLMResponse:
         """Claude JSON 응답 호출"""
         if not self.anthropic_client:
-            return LLMResponse(
-                provider=LLMProvider.CLAUDE,
-                content=None,
-                raw_response="",
-                model=model or self.models[LLMProvider.CLAUDE],
-                error="Anthropic API key not configured"
-            )
+            return self._unconfigured_response(LLMProvider.CLAUDE, model)
 
         try:
             model_name = model or self.models[LLMProvider.CLAUDE]
 
-            # system 메시지 분리
-            system_message = ""
-            user_messages = []
-
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_message = msg["content"]
-                else:
-                    user_messages.append(msg)
+            # system 메시지 분리 (긴 프롬프트는 프롬프트 캐싱)
+            system, user_messages = _split_claude_messages(messages)
 
             response = await self.anthropic_client.messages.create(
                 model=model_name,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                system=system_message if system_message else None,
+                system=system,
                 messages=user_messages
             )
 
             raw_content = response.content[0].text if response.content else ""
 
             # JSON 추출 (코드 블록 포함 가능)
-            parsed_content = self._extract_json(raw_content)
+            if len(raw_content) < LLM_PARSE_OFFLOAD_CHARS:
+                parsed_content = self._extract_json(raw_content)
+            else:
+                parsed_content = await asyncio.to_thread(self._extract_json, raw_content)
 
             return LLMResponse(
                 provider=LLMProvider.CLAUDE,
@@ -636,7 +1593,8 @@ class LLMManager:
                 content=None,
                 raw_response="",
                 model=model or self.models[LLMProvider.CLAUDE],
-                error=str(e)
+                error=str(e),
+                exception=e,
             )
 
     async def call_text(
@@ -646,28 +1604,36 @@ class LLMManager:
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 2048,
+        no_cache: bool = False,
     ) -> LLMResponse:
         """
         일반 텍스트 응답 요청
 
         T3-1: Exponential backoff 재시도 적용
+        낮은 temperature 호출은 응답 캐시 재사용 (no_cache=True로 비활성화)
         """
         logger.info(f"[LLMManager] call_text 시작 - provider: {provider.value}")
+        cache_key = self._response_cache_key(
+            "text", provider, messages, None, model, temperature, max_tokens, no_cache
+        )
 
         if provider == LLMProvider.OPENAI:
-            return await self._call_with_retry(
+            return await self._call_cached(
+                cache_key,
                 provider,
                 self._call_openai_text,
                 messages, model, temperature, max_tokens
             )
         elif provider == LLMProvider.GEMINI:
-            return await self._call_with_retry(
+            return await self._call_cached(
+                cache_key,
                 provider,
                 self._call_gemini_text,
                 messages, model, temperature, max_tokens
             )
         elif provider == LLMProvider.CLAUDE:
-            return await self._call_with_retry(
+            return await self._call_cached(
+                cache_key,
                 provider,
                 self._call_claude_text,
                 messages, model, temperature, max_tokens
@@ -690,13 +1656,7 @@ class LLMManager:
     ) -> LLMResponse:
         """OpenAI 텍스트 응답"""
         if not self.openai_client:
-            return LLMResponse(
-                provider=LLMProvider.OPENAI,
-                content=None,
-                raw_response="",
-                model=model or self.models[LLMProvider.OPENAI],
-                error="OpenAI API key not configured"
-            )
+            return self._unconfigured_response(LLMProvider.OPENAI, model)
 
         try:
             model_name = model or self.models[LLMProvider.OPENAI]
@@ -727,7 +1687,8 @@ class LLMManager:
                 content=None,
                 raw_response="",
                 model=model or self.models[LLMProvider.OPENAI],
-                error=str(e)
+                error=str(e),
+                exception=e,
             )
 
     async def _call_gemini_text(
@@ -739,64 +1700,47 @@ class LLMManager:
     ) -> LLMResponse:
         """Gemini 텍스트 응답 (새 google-genai 패키지)"""
         if not self.gemini_client:
-            return LLMResponse(
-                provider=LLMProvider.GEMINI,
-                content=None,
-                raw_response="",
-                model=model or self.models[LLMProvider.GEMINI],
-                error="Gemini API key not configured"
-            )
+            return self._unconfigured_response(LLMProvider.GEMINI, model)
 
         try:
             model_name = model or self.models[LLMProvider.GEMINI]
 
             # 새 google-genai API 사용
-            config = genai_types.GenerateContentConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-            )
+            system, contents = _split_gemini_messages(messages)
+            config = _gemini_config(temperature, max_tokens, False, system)
 
-            prompt = self._convert_messages_to_prompt(messages)
             try:
                 response = await asyncio.wait_for(
-                    asyncio.to_thread(
-                        self.gemini_client.models.generate_content,
+                    self.gemini_client.aio.models.generate_content(
                         model=model_name,
-                        contents=prompt,
+                        contents=contents,
                         config=config
                     ),
                     timeout=LLM_TIMEOUT_SECONDS
                 )
-            except asyncio.TimeoutError:
+            except asyncio.TimeoutError as e:
                 logger.error(
-                    f"[LLMManager] ❌ Gemini Text API 타임아웃 ({LLM_TIMEOUT_SECONDS}초)\n"
-                    f"⚠️ 주의: API 요청이 이미 전송되어 과금될 수 있습니다."
+                    f"[LLMManager] ❌ Gemini Text API 타임아웃 ({LLM_TIMEOUT_SECONDS}초) - 요청 취소"
                 )
                 return LLMResponse(
                     provider=LLMProvider.GEMINI,
                     content=None,
                     raw_response="",
                     model=model_name,
-                    error=f"Gemini API timeout after {LLM_TIMEOUT_SECONDS} seconds (request may still be billed)"
+                    error=f"Gemini API timeout after {LLM_TIMEOUT_SECONDS} seconds (request cancelled)",
+                    exception=e,
                 )
 
             content = response.text
 
-            # usage_metadata 접근
-            usage = {}
-            if hasattr(response, 'usage_metadata') and response.usage_metadata:
-                usage = {
-                    "prompt_tokens": getattr(response.usage_metadata, 'prompt_token_count', 0),
-                    "completion_tokens": getattr(response.usage_metadata, 'candidates_token_count', 0),
-                    "total_tokens": getattr(response.usage_metadata, 'total_token_count', 0),
-                }
+            usage = _gemini_usage(response)
 
             return LLMResponse(
                 provider=LLMProvider.GEMINI,
                 content=content,
                 raw_response=content,
                 model=model_name,
-                usage=usage if usage else None
+                usage=usage
             )
         except Exception as e:
             return LLMResponse(
@@ -804,7 +1748,8 @@ class LLMManager:
                 content=None,
                 raw_response="",
                 model=model or self.models[LLMProvider.GEMINI],
-                error=str(e)
+                error=str(e),
+                exception=e,
             )
 
     async def _call_claude_text(
@@ -816,31 +1761,18 @@ class LLMManager:
     ) -> LLMResponse:
         """Claude 텍스트 응답"""
         if not self.anthropic_client:
-            return LLMResponse(
-                provider=LLMProvider.CLAUDE,
-                content=None,
-                raw_response="",
-                model=model or self.models[LLMProvider.CLAUDE],
-                error="Anthropic API key not configured"
-            )
+            return self._unconfigured_response(LLMProvider.CLAUDE, model)
 
         try:
             model_name = model or self.models[LLMProvider.CLAUDE]
 
-            system_message = ""
-            user_messages = []
-
-            for msg in messages:
-                if msg["role"] == "system":
-                    system_message = msg["content"]
-                else:
-                    user_messages.append(msg)
+            system, user_messages = _split_claude_messages(messages)
 
             response = await self.anthropic_client.messages.create(
                 model=model_name,
                 max_tokens=max_tokens,
                 temperature=temperature,
-                system=system_message if system_message else None,
+                system=system,
                 messages=user_messages
             )
 
@@ -863,48 +1795,127 @@ class LLMManager:
                 content=None,
                 raw_response="",
                 model=model or self.models[LLMProvider.CLAUDE],
-                error=str(e)
-            )
-
-    def _convert_messages_to_prompt(self, messages: List[Dict[str, str]]) -> str:
-        """OpenAI 메시지 형식을 단일 프롬프트로 변환 (Gemini용)"""
-        parts = []
-        for msg in messages:
-            role = msg["role"]
-            content = msg["content"]
-            if role == "system":
-                parts.append(f"System: {content}")
-            elif role == "user":
-                parts.append(f"User: {content}")
-            elif role == "assistant":
-                parts.append(f"Assistant: {content}")
-        return "\n\n".join(parts)
+                error=str(e),
+                exception=e,
+            )
 
-    def _extract_json(self, text: str) -> Optional[Dict[str, Any]]:
-        """텍스트에서 JSON 추출 (코드 블록 포함 처리)"""
-        # 먼저 순수 JSON 파싱 시도
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
+    async def stream_json(
+        self,
+        provider: LLMProvider,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.1,
+        max_tokens: int = 8192,
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        JSON 응답을 스트리밍으로 받아 최상위 필드 (key, value)를 완성되는 대로 반환
 
-        # 코드 블록에서 JSON 추출
-        json_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-        matches = re.findall(json_pattern, text)
+        전체 응답 생성 + 파싱을 기다리지 않고 앞쪽 필드부터 후속 처리 가능
+        이미 일부를 반환한 뒤에는 재시도할 수 없으므로 재시도/캐시 미적용
 
-        for match in matches:
-            try:
-                return json.loads(match)
-            except json.JSONDecodeError:
-                continue
+        Raises:
+            RuntimeError: 클라이언트 미설정
+            json.JSONDecodeError: 필드 파싱 실패
+            ValueError: 스트림이 JSON 객체 완성 전에 종료
+        """
+        logger.info("[LLMManager] stream_json 시작 - provider: %s", provider.value)
+        model_name = model or self.models[provider]
+        parser = _JsonMemberStream()
+
+        limiter = self._limiters[provider]
+        await limiter.acquire(_estimate_tokens(messages, max_tokens) if limiter.enabled else 0)
+
+        async with self._provider_semaphore(provider) or contextlib.nullcontext():
+            async with contextlib.aclosing(self._stream_text(
+                provider, messages, model_name, temperature, max_tokens
+            )) as deltas:
+                async for delta in deltas:
+                    for member in parser.feed(delta):
+                        yield member
+                    if parser.done:
+                        break
+
+        if not parser.done:
+            raise ValueError(f"{provider.value} JSON stream ended before the object was complete")
+
+    async def _stream_text(
+        self,
+        provider: LLMProvider,
+        messages: List[Dict[str, str]],
+        model_name: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> AsyncIterator[str]:
+        """프로바이더별 JSON 모드 스트리밍 텍스트 조각 반환"""
+        if provider == LLMProvider.OPENAI:
+            if not self.openai_client:
+                raise RuntimeError("OpenAI API key not configured")
+            stream = await self.openai_client.chat.completions.create(
+                model=model_name,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                response_format={"type": "json_object"},
+                stream=True,
+            )
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
 
-        # { } 사이 내용 추출 시도
-        brace_pattern = r'\{[\s\S]*\}'
-        brace_matches = re.findall(brace_pattern, text)
+        elif provider == LLMProvider.GEMINI:
+            if not self.gemini_client:
+                raise RuntimeError("Gemini API key not configured")
+            system, contents = _split_gemini_messages(messages)
+            config = _gemini_config(temperature, max_tokens, True, system)
+            stream = await self.gemini_client.aio.models.generate_content_stream(
+                model=model_name,
+                contents=contents,
+                config=config,
+            )
+            async for chunk in stream:
+                if chunk.text:
+                    yield chunk.text
+
+        elif provider == LLMProvider.CLAUDE:
+            if not self.anthropic_client:
+                raise RuntimeError("Anthropic API key not configured")
+            system, user_messages = _split_claude_messages(messages)
+
+            async with self.anthropic_client.messages.stream(
+                model=model_name,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                system=system,
+                messages=user_messages,
+            ) as stream:
+                async for text in stream.text_stream:
+                    yield text
+
+        else:
+            raise RuntimeError(f"Unknown provider: {provider}")
 
-        for match in brace_matches:
+    def _extract_json(self, text: str) -> Optional[Dict[str, Any]]:
+        """텍스트에서 JSON 추출 (코드 블록 포함 처리)"""
+        # 먼저 순수 JSON 파싱 시도 (JSON으로 시작할 때만 → 설명 문구로 시작하면 파싱 생략)
+        stripped = text.strip()
+        if stripped[:1] in ("{", "["):
             try:
-                return json.loads(match)
+                return _json_loads(stripped)
+            except json.JSONDecodeError:
+                pass
+
+        # 코드 블록에서 JSON 추출 (펜스가 있을 때만 정규식 실행)
+        if "```" in text:
+            for match in _JSON_BLOCK_RE.findall(text):
+                try:
+                    return _json_loads(match)
+                except json.JSONDecodeError:
+                    continue
+
+        # { } 사이 내용 추출 시도 (괄호 스캐너로 최상위 객체 후보 순회)
+        for candidate in _iter_json_candidates(text):
+            try:
+                return _json_loads(candidate)
             except json.JSONDecodeError:
                 continue
 
@@ -924,11 +1935,27 @@ class LLMManager:
 
 # 싱글톤 인스턴스
 _llm_manager: Optional[LLMManager] = None
+_llm_manager_lock = threading.Lock()
 
 
 def get_llm_manager() -> LLMManager:
-    """LLM Manager 싱글톤 인스턴스 반환"""
+    """
+    LLM Manager 싱글톤 인스턴스 반환
+
+    Double-checked locking: 여러 스레드가 동시에 처음 호출해도
+    SDK 클라이언트/연결 풀은 한 번만 생성되고, 초기화 이후에는 락을 잡지 않음
+    """
     global _llm_manager
     if _llm_manager is None:
-        _llm_manager = LLMManager()
+        with _llm_manager_lock:
+            if _llm_manager is None:
+                _llm_manager = LLMManager()
     return _llm_manager
+
+
+async def close_llm_manager() -> None:
+    """싱글톤 인스턴스의 연결 풀 정리 후 초기화 (앱 종료 시)"""
+    global _llm_manager
+    if _llm_manager is not None:
+        await _llm_manager.aclose()
+        _llm_manager = None
@@ -0,0 +1,511 @@
+"""
+DatabaseService 테스트
+
+테스트 대상:
+- 중복 체크 결과 TTL 캐시
+- SaveContext 보상 트랜잭션 RPC
+- 크레딧 차감 RPC
+- 크레딧 확인 TTL 캐시
+- 에러 분류
+- 파이프라인 실패 처리 RPC
+- quick_extracted 중복 전송 생략
+- 필수 필드 검증
+- 싱글톤 스레드 안전 초기화
+"""
+
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+
+from postgrest.exceptions import APIError
+
+from services.database_service import (
+    ERROR_CODES,
+    DatabaseService,
+    DuplicateCheckResult,
+    DuplicateMatchType,
+    SaveContext,
+    _ERROR_KEYWORDS,
+    get_database_service,
+)
+from utils.ttl_cache import TTLCache
+
+
+@pytest.fixture
+def db_service():
+    """Supabase 클라이언트를 Mock으로 교체한 DatabaseService"""
+    service = DatabaseService()
+    service.client = MagicMock()
+    return service
+
+
+def _api_error(message: str) -> APIError:
+    return APIError({"message": message, "code": "PGRST000"})
+
+
+def _no_duplicate() -> DuplicateCheckResult:
+    return DuplicateCheckResult(
+        is_duplicate=False,
+        match_type=DuplicateMatchType.NONE,
+    )
+
+
+class TestTTLCache:
+    """TTLCache 동작 테스트"""
+
+    def test_get_returns_stored_value(self):
+        cache = TTLCache(maxsize=4, ttl=30)
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+
+    def test_expired_entry_returns_none(self):
+        cache = TTLCache(maxsize=4, ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+    def test_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2, ttl=30)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_pop_invalidates(self):
+        cache = TTLCache(maxsize=4, ttl=30)
+        cache.set("a", 1)
+        cache.pop("a")
+        cache.pop("missing")
+        assert cache.get("a") is None
+
+
+class TestDuplicateCheckCache:
+    """check_duplicate 캐시 테스트"""
+
+    def test_repeat_check_served_from_cache(self, db_service):
+        db_service._check_duplicate_uncached = MagicMock(return_value=_no_duplicate())
+
+        first = db_service.check_duplicate("user-1", phone_hash="ph")
+        second = db_service.check_duplicate("user-1", phone_hash="ph")
+
+        assert first is second
+        db_service._check_duplicate_uncached.assert_called_once()
+
+    def test_different_args_not_shared(self, db_service):
+        db_service._check_duplicate_uncached = MagicMock(return_value=_no_duplicate())
+
+        db_service.check_duplicate("user-1", phone_hash="ph")
+        db_service.check_duplicate("user-2", phone_hash="ph")
+
+        assert db_service._check_duplicate_uncached.call_count == 2
+
+    def test_error_result_not_cached(self, db_service):
+        error_result = DuplicateCheckResult(
+            is_duplicate=False,
+            match_type=DuplicateMatchType.NONE,
+            error="boom",
+        )
+        db_service._check_duplicate_uncached = MagicMock(return_value=error_result)
+
+        db_service.check_duplicate("user-1", phone_hash="ph")
+        db_service.check_duplicate("user-1", phone_hash="ph")
+
+        assert db_service._check_duplicate_uncached.call_count == 2
+
+    def test_save_candidate_invalidates_cache(self, db_service):
+        db_service._check_duplicate_uncached = MagicMock(return_value=_no_duplicate())
+        db_service.client.table.return_value.insert.return_value.execute.return_value = (
+            MagicMock(data=[{"id": "cand-1"}])
+        )
+
+        result = db_service.save_candidate(
+            user_id="user-1",
+            job_id="job-1",
+            analyzed_data={"name": "홍길동"},
+            confidence_score=0.9,
+            field_confidence={},
+            warnings=[],
+            encrypted_store={},
+            hash_store={"phone": "ph"},
+            source_file="a.pdf",
+            file_type="pdf",
+            analysis_mode="phase_1",
+        )
+        assert result.success
+
+        db_service.check_duplicate("user-1", "ph", None, "홍길동", None, None)
+        assert db_service._check_duplicate_uncached.call_count == 2
+
+
+class TestSaveContextRollback:
+    """SaveContext.rollback 테스트"""
+
+    def test_rollback_uses_single_rpc_in_reverse_order(self):
+        client = MagicMock()
+        ctx = SaveContext(client)
+        ctx.track_insert("candidates", "c-1")
+        ctx.track_update("candidates", "c-0", {"is_latest": True})
+
+        ctx.rollback()
+
+        client.rpc.assert_called_once()
+        name, params = client.rpc.call_args[0]
+        assert name == "rollback_actions"
+        assert [a["record_id"] for a in params["actions"]] == ["c-0", "c-1"]
+        assert params["actions"][0]["previous_data"] == {"is_latest": True}
+        client.table.assert_not_called()
+        assert ctx.actions == []
+
+    def test_rollback_falls_back_when_rpc_fails(self):
+        client = MagicMock()
+        client.rpc.return_value.execute.side_effect = _api_error("function not found")
+        ctx = SaveContext(client)
+        ctx.track_insert("candidates", "c-1")
+
+        ctx.rollback()
+
+        client.table.assert_called_with("candidates")
+        client.table.return_value.delete.return_value.eq.assert_called_with("id", "c-1")
+        assert ctx.actions == []
+
+    def test_rollback_noop_after_commit(self):
+        client = MagicMock()
+        ctx = SaveContext(client)
+        ctx.track_insert("candidates", "c-1")
+        ctx.commit()
+
+        ctx.rollback()
+
+        client.rpc.assert_not_called()
+
+
+class TestPhoneNormalization:
+    """전화번호 정규화 캐시 테스트"""
+
+    def test_normalize_phone_formats(self):
+        assert DatabaseService._normalize_phone("010-1234-5678") == "01012345678"
+        assert DatabaseService._normalize_phone("+82 10-1234-5678") == "01012345678"
+        assert DatabaseService._normalize_phone("123") is None
+        assert DatabaseService._normalize_phone(None) is None
+
+    def test_phone_prefix_cached(self):
+        DatabaseService._get_phone_prefix.cache_clear()
+        DatabaseService._get_phone_prefix("010-1234-5678")
+        DatabaseService._get_phone_prefix("010-1234-5678")
+        assert DatabaseService._get_phone_prefix.cache_info().hits == 1
+        assert DatabaseService._get_phone_prefix("010-1234-5678") == "1234"
+
+    def test_name_phone_hash_via_instance(self, db_service):
+        h1 = db_service._create_name_phone_hash("홍 길동", "010-1234-5678")
+        h2 = db_service._create_name_phone_hash("홍길동", "01012345678")
+        assert h1 is not None and h1 == h2
+
+
+class TestCreditDeduction:
+    """크레딧 차감 테스트"""
+
+    def test_fallback_uses_single_rpc(self, db_service):
+        db_service.client.rpc.return_value.execute.return_value = MagicMock(data=4)
+
+        assert db_service._deduct_credit_fallback("user-1", "cand-1") is True
+
+        db_service.client.rpc.assert_called_once()
+        name, params = db_service.client.rpc.call_args[0]
+        assert name == "deduct_credit_and_log"
+        assert params["p_user_id"] == "user-1"
+        assert params["p_candidate_id"] == "cand-1"
+        db_service.client.table.assert_not_called()
+
+    def test_fallback_user_missing(self, db_service):
+        db_service.client.rpc.return_value.execute.return_value = MagicMock(data=None)
+        assert db_service._deduct_credit_fallback("user-1") is False
+
+    def test_fallback_rpc_error(self, db_service):
+        db_service.client.rpc.return_value.execute.side_effect = _api_error("boom")
+        assert db_service._deduct_credit_fallback("user-1") is False
+
+    def test_rpc_success_does_not_log_separately(self, db_service):
+        db_service.client.rpc.return_value.execute.return_value = MagicMock(data=True)
+
+        assert db_service.deduct_credit("user-1", "cand-1") is True
+
+        db_service.client.rpc.assert_called_once()
+        db_service.client.table.assert_not_called()
+
+
+class TestCreditAvailabilityCache:
+    """check_credit_available 캐시 테스트"""
+
+    def _mock_user(self, db_service, credits=0, used=0, plan="starter"):
+        query = db_service.client.table.return_value.select.return_value.eq.return_value
+        query.maybe_single.return_value.execute.return_value = MagicMock(
+            data={"credits": credits, "credits_used_this_month": used, "plan": plan}
+        )
+        return query
+
+    def test_repeat_check_served_from_cache(self, db_service):
+        self._mock_user(db_service, used=10)
+
+        assert db_service.check_credit_available("user-1") is True
+        assert db_service.check_credit_available("user-1") is True
+
+        assert db_service.client.table.call_count == 1
+
+    def test_deduct_credit_invalidates_cache(self, db_service):
+        self._mock_user(db_service, used=10)
+        db_service.client.rpc.return_value.execute.return_value = MagicMock(data=False)
+
+        db_service.check_credit_available("user-1")
+        db_service.deduct_credit("user-1")
+        db_service.check_credit_available("user-1")
+
+        assert db_service.client.table.call_count == 2
+
+    def test_query_error_not_cached(self, db_service):
+        query = self._mock_user(db_service)
+        query.maybe_single.return_value.execute.side_effect = _api_error("boom")
+
+        assert db_service.check_credit_available("user-1") is False
+        db_service.check_credit_available("user-1")
+
+        assert db_service.client.table.call_count == 2
+
+    def test_null_columns_treated_as_zero(self, db_service):
+        self._mock_user(db_service, credits=None, used=None, plan=None)
+
+        assert db_service.check_credit_available("user-1") is True
+
+    def test_programming_error_propagates(self, db_service):
+        query = self._mock_user(db_service)
+        query.maybe_single.return_value.execute.side_effect = TypeError("bad")
+
+        with pytest.raises(TypeError):
+            db_service.check_credit_available("user-1")
+
+    def test_missing_user_returns_false(self, db_service):
+        query = self._mock_user(db_service)
+        query.maybe_single.return_value.execute.return_value = None
+
+        assert db_service.check_credit_available("user-1") is False
+
+    def test_plan_cached_across_credit_refresh(self, db_service):
+        self._mock_user(db_service, used=10, plan="pro")
+        select = db_service.client.table.return_value.select
+
+        db_service.check_credit_available("user-1")
+        db_service._credit_cache.clear()
+        db_service.check_credit_available("user-1")
+
+        assert select.call_args_list[0].args == ("credits, credits_used_this_month, plan",)
+        assert select.call_args_list[1].args == ("credits, credits_used_this_month",)
+
+    def test_cached_plan_sets_base_credits(self, db_service):
+        self._mock_user(db_service, used=100, plan="pro")
+
+        db_service.check_credit_available("user-1")
+        db_service._credit_cache.clear()
+
+        assert db_service.check_credit_available("user-1") is True
+
+
+class TestClassifyError:
+    """classify_error 테스트 (정규식 / hyperscan 경로 모두)"""
+
+    @pytest.fixture(autouse=True, params=["regex", "hyperscan"])
+    def backend(self, request, monkeypatch):
+        module_globals = DatabaseService.classify_error.__globals__
+        if request.param == "regex":
+            monkeypatch.setitem(module_globals, "ERROR_KEYWORD_DB", None)
+        elif module_globals["ERROR_KEYWORD_DB"] is None:
+            pytest.skip("hyperscan not installed")
+
+    @pytest.mark.parametrize("message,expected", [
+        ("Parsing failed: bad header", "PARSE_FAILED"),
+        ("PDF is password protected", "ENCRYPTED"),
+        ("Scanned document, OCR required", "SCANNED_IMAGE"),
+        ("Text too short", "TEXT_TOO_SHORT"),
+        ("Request timed out", "LLM_TIMEOUT"),
+        ("All LLM providers failed", "LLM_ERROR"),
+        ("Storage download error", "STORAGE_ERROR"),
+        ("필수 필드 누락", "MISSING_REQUIRED_FIELDS"),
+        ("something odd", "UNKNOWN"),
+        ("", "UNKNOWN"),
+    ])
+    def test_classify(self, db_service, message, expected):
+        assert db_service.classify_error(message) == expected
+
+    def test_user_message_for_every_code(self, db_service):
+        for code, _ in _ERROR_KEYWORDS:
+            assert db_service.get_user_message(code) == ERROR_CODES[code]
+        assert db_service.get_user_message("NOPE") == ERROR_CODES["UNKNOWN"]
+
+    def test_error_codes_read_only(self):
+        with pytest.raises(TypeError):
+            ERROR_CODES["UNKNOWN"] = "changed"
+
+    def test_priority_not_position(self, db_service):
+        # "llm"이 먼저 나오지만 LLM_TIMEOUT이 우선순위가 높음
+        assert db_service.classify_error("LLM analysis timeout") == "LLM_TIMEOUT"
+        assert db_service.classify_error("upload missing, parse error") == "PARSE_FAILED"
+
+
+class TestHandlePipelineFailure:
+    """handle_pipeline_failure 테스트"""
+
+    def test_single_rpc(self, db_service):
+        db_service.client.rpc.return_value.execute.return_value = MagicMock(
+            data={"deleted": True, "restored": True}
+        )
+
+        result = db_service.handle_pipeline_failure(
+            candidate_id="cand-1",
+            job_id="job-1",
+            technical_error="Parsing failed",
+            parent_id="cand-0",
+        )
+
+        name, params = db_service.client.rpc.call_args[0]
+        assert name == "handle_failure"
+        assert params["p_parent_id"] == "cand-0"
+        assert params["p_error_code"] == "PARSE_FAILED"
+        db_service.client.table.assert_not_called()
+        assert result.error_code == "PARSE_FAILED"
+        assert result.deleted is True
+        assert result.restored is True
+
+    def test_fallback_when_rpc_fails(self, db_service):
+        db_service.client.rpc.return_value.execute.side_effect = _api_error("missing function")
+        db_service.client.table.return_value.update.return_value.eq.return_value.execute.return_value = (
+            MagicMock(data=[{"id": "cand-1"}])
+        )
+
+        result = db_service.handle_pipeline_failure(
+            candidate_id="cand-1",
+            job_id="job-1",
+            technical_error="Request timed out",
+        )
+
+        assert result.error_code == "LLM_TIMEOUT"
+        assert result.deleted is True
+        assert result.restored is False
+        tables = [c.args[0] for c in db_service.client.table.call_args_list]
+        assert tables == ["candidates", "processing_jobs"]
+
+    def test_fallback_uses_restore_and_delete_with_parent(self, db_service):
+        def rpc(name, params):
+            call = MagicMock()
+            if name == "handle_failure":
+                call.execute.side_effect = _api_error("missing function")
+            else:
+                call.execute.return_value = MagicMock(data={"deleted": True, "restored": True})
+            return call
+
+        db_service.client.rpc.side_effect = rpc
+
+        result = db_service.handle_pipeline_failure(
+            candidate_id="cand-1",
+            job_id="job-1",
+            technical_error="Request timed out",
+            parent_id="cand-0",
+        )
+
+        assert result.deleted is True
+        assert result.restored is True
+        names = [c.args[0] for c in db_service.client.rpc.call_args_list]
+        assert names == ["handle_failure", "restore_and_delete"]
+        tables = [c.args[0] for c in db_service.client.table.call_args_list]
+        assert tables == ["processing_jobs"]
+
+
+class TestQuickExtractedDedup:
+    """update_candidate_quick_extracted 중복 전송 생략 테스트"""
+
+    def _mock_update(self, db_service):
+        update = db_service.client.table.return_value.update
+        update.return_value.eq.return_value.execute.return_value = MagicMock(
+            data=[{"id": "cand-1"}]
+        )
+        return update
+
+    def test_same_data_skips_second_update(self, db_service):
+        update = self._mock_update(db_service)
+
+        assert db_service.update_candidate_quick_extracted("cand-1", {"name": "홍길동", "email": "a@b.c"})
+        assert db_service.update_candidate_quick_extracted("cand-1", {"email": "a@b.c", "name": "홍길동"})
+
+        assert update.call_count == 1
+
+    def test_changed_data_is_sent(self, db_service):
+        update = self._mock_update(db_service)
+
+        db_service.update_candidate_quick_extracted("cand-1", {"name": "홍길동"})
+        db_service.update_candidate_quick_extracted("cand-1", {"name": "김철수"})
+
+        assert update.call_count == 2
+
+    def test_status_change_invalidates(self, db_service):
+        update = self._mock_update(db_service)
+
+        db_service.update_candidate_quick_extracted("cand-1", {"name": "홍길동"})
+        db_service.update_candidate_status("cand-1", "processing")
+        db_service.update_candidate_quick_extracted("cand-1", {"name": "홍길동"})
+
+        assert update.call_count == 3
+
+
+class TestCheckRequiredFields:
+    """check_required_fields 테스트"""
+
+    def test_all_present(self, db_service):
+        ok, missing = db_service.check_required_fields({
+            "name": "홍길동",
+            "email_masked": "h***@a.com",
+            "careers": [{"company": "ABC"}],
+        })
+        assert ok is True
+        assert missing == []
+
+    def test_all_missing(self, db_service):
+        ok, missing = db_service.check_required_fields({"careers": []})
+        assert ok is False
+        assert missing == ["name", "contact", "careers"]
+
+    def test_contact_accepts_any_source(self, db_service):
+        for key in ("phone", "phone_masked", "email", "email_masked"):
+            _, missing = db_service.check_required_fields({key: "x"})
+            assert "contact" not in missing
+
+
+class TestGetDatabaseService:
+    """get_database_service 스레드 안전 초기화"""
+
+    def test_concurrent_first_calls_create_single_instance(self, monkeypatch):
+        # 다른 테스트가 sys.modules를 교체할 수 있으므로 함수의 전역 네임스페이스를 직접 패치
+        module_globals = get_database_service.__globals__
+        created = []
+        barrier = threading.Barrier(8)
+
+        class FakeService:
+            def __init__(self):
+                created.append(self)
+
+        monkeypatch.setitem(module_globals, "_database_service", None)
+        monkeypatch.setitem(module_globals, "DatabaseService", FakeService)
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(get_database_service())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(created) == 1
+        assert all(r is created[0] for r in results)
@@ -0,0 +1,123 @@
+"""
+DiskCache 테스트
+
+테스트 대상:
+- 저장/조회, 덮어쓰기
+- TTL 만료 및 저장 시 정리
+- 인스턴스(프로세스) 간 공유
+- 장애 시 미스 처리
+- 암호화 저장
+"""
+
+import sqlite3
+
+import pytest
+
+from utils.disk_cache import DiskCache, derive_key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "cache" / "responses.sqlite3")
+
+
+class TestDiskCache:
+    """DiskCache 동작 테스트"""
+
+    def test_set_and_get(self, path, clock):
+        cache = DiskCache(path, ttl=60, clock=clock)
+        cache.set("k", b"value")
+
+        assert cache.get("k") == b"value"
+        assert cache.get("missing") is None
+
+    def test_overwrite(self, path, clock):
+        cache = DiskCache(path, ttl=60, clock=clock)
+        cache.set("k", b"old")
+        cache.set("k", b"new")
+
+        assert cache.get("k") == b"new"
+
+    def test_expired_entry_is_miss_and_purged(self, path, clock):
+        cache = DiskCache(path, ttl=60, clock=clock)
+        cache.set("old", b"1")
+        clock.now += 61
+
+        assert cache.get("old") is None
+
+        cache.set("new", b"2")
+        with sqlite3.connect(path) as conn:
+            keys = [row[0] for row in conn.execute("SELECT key FROM cache")]
+        assert keys == ["new"]
+
+    def test_shared_between_instances(self, path, clock):
+        """같은 파일을 여는 다른 인스턴스(fork된 작업)와 공유"""
+        DiskCache(path, ttl=60, clock=clock).set("k", b"value")
+
+        assert DiskCache(path, ttl=60, clock=clock).get("k") == b"value"
+
+    def test_clear(self, path, clock):
+        cache = DiskCache(path, ttl=60, clock=clock)
+        cache.set("k", b"value")
+        cache.clear()
+
+        assert cache.get("k") is None
+
+    def test_storage_error_is_miss(self, path, clock):
+        """sqlite 오류는 미스로 처리하고 예외를 올리지 않음"""
+        cache = DiskCache(path, ttl=60, clock=clock)
+        with sqlite3.connect(path) as conn:
+            conn.execute("DROP TABLE cache")
+
+        cache.set("k", b"value")
+        assert cache.get("k") is None
+
+
+class TestDiskCacheEncryption:
+    """key 지정 시 암호화 저장"""
+
+    @pytest.fixture
+    def key(self):
+        return derive_key("0" * 64, b"test")
+
+    def test_value_not_stored_in_plaintext(self, path, clock, key):
+        cache = DiskCache(path, ttl=60, clock=clock, key=key)
+        cache.set("k", "홍길동 010-1234-5678".encode())
+
+        with sqlite3.connect(path) as conn:
+            stored = conn.execute("SELECT value FROM cache").fetchone()[0]
+        assert "010-1234-5678".encode() not in stored
+        assert cache.get("k") == "홍길동 010-1234-5678".encode()
+
+    def test_wrong_key_is_miss(self, path, clock, key):
+        DiskCache(path, ttl=60, clock=clock, key=key).set("k", b"value")
+
+        other = DiskCache(path, ttl=60, clock=clock, key=derive_key("1" * 64, b"test"))
+        assert other.get("k") is None
+
+    def test_value_bound_to_cache_key(self, path, clock, key):
+        """다른 키의 암호문으로 바꿔치기하면 미스"""
+        cache = DiskCache(path, ttl=60, clock=clock, key=key)
+        cache.set("a", b"value-a")
+        cache.set("b", b"value-b")
+        with sqlite3.connect(path) as conn:
+            conn.execute("UPDATE cache SET value = (SELECT value FROM cache WHERE key = 'a') WHERE key = 'b'")
+
+        assert cache.get("b") is None
+
+    def test_derive_key_separates_purposes(self):
+        assert derive_key("0" * 64, b"a") != derive_key("0" * 64, b"b")
+        assert len(derive_key("0" * 64, b"a")) == 32
@@ -189,6 +189,9 @@ class TestGapFillerAgent:
         assert "phone" in result.filled_fields
         # 재시도 기록 확인
         assert result.total_retries >= 1
+        # 재시도는 응답 캐시 우회
+        no_cache_flags = [c.kwargs["no_cache"] for c in mock_llm_manager.call_json.call_args_list]
+        assert no_cache_flags == [False, True]
 
     @pytest.mark.asyncio
     async def test_multiple_fields(self, agent, mock_llm_manager):
@@ -0,0 +1,1109 @@
+"""
+LLMManager 테스트
+
+테스트 대상:
+- JSON 추출 (_extract_json)
+- 응답 캐시 + 진행 중 동일 요청 합치기
+- 프로바이더 동시 호출 (call_all) + 프로바이더별 동시 요청 제한
+- Gemini 비동기 클라이언트 호출
+- 스트리밍 JSON (최상위 필드 단위 파싱)
+- Claude system 프롬프트 캐싱
+- Gemini 프롬프트 변환
+- HTTP 클라이언트 연결 풀 설정
+- 프로바이더 SDK 지연 로딩
+- 적응형 모델 라우팅
+"""
+
+import asyncio
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from services.llm_manager import (
+    LLMManager,
+    LLMProvider,
+    LLMResponse,
+    _JsonMemberStream,
+    _gemini_config,
+    _iter_json_candidates,
+    _schema_depth,
+    _split_claude_messages,
+    _split_gemini_messages,
+)
+from services import llm_manager as llm_module
+
+MESSAGES = [
+    {"role": "system", "content": "이력서에서 정보를 추출하세요."},
+    {"role": "user", "content": "홍길동 / Python 5년"},
+]
+
+
+def _ok(content=None):
+    return LLMResponse(
+        provider=LLMProvider.OPENAI,
+        content=content if content is not None else {"name": "홍길동"},
+        raw_response='{"name": "홍길동"}',
+        model="gpt-4o",
+        usage={"prompt_tokens": 100, "completion_tokens": 20, "total_tokens": 120},
+    )
+
+
+@pytest.fixture
+def manager():
+    """API 키 없이 생성한 LLMManager"""
+    return LLMManager()
+
+
+class TestHttpClient:
+    """OpenAI/Claude HTTP 클라이언트 연결 풀 설정 테스트"""
+
+    def test_sdks_use_tuned_clients(self):
+        """두 SDK 모두 연결 풀 한도를 지정한 클라이언트 사용"""
+        with patch.object(llm_module.settings, "OPENAI_API_KEY", "sk-test"), \
+             patch.object(llm_module.settings, "ANTHROPIC_API_KEY", "sk-ant-test"), \
+             patch.object(llm_module, "_build_http_client", wraps=llm_module._build_http_client) as build:
+            manager = LLMManager()
+
+        import anthropic
+        import openai
+
+        built = [call.args[0] for call in build.call_args_list]
+        assert built == [openai.DefaultAsyncHttpxClient, anthropic.DefaultAsyncHttpxClient]
+        assert isinstance(manager.openai_client._client, openai.DefaultAsyncHttpxClient)
+        assert manager.openai_client.max_retries == 0
+
+    def test_pool_limits_keep_default_keepalive_expiry(self):
+        """연결 수 한도만 조정, 유휴 연결 유지 시간은 httpx 기본값(5초)
+
+        run_async가 작업마다 이벤트 루프를 닫으므로 오래 유지된 연결은 닫힌 루프에 묶임
+        """
+        import openai
+
+        client = llm_module._build_http_client(openai.DefaultAsyncHttpxClient)
+
+        pool = client._transport._pool
+        assert pool._keepalive_expiry == 5.0
+        assert pool._max_connections == llm_module.LLM_HTTP_MAX_CONNECTIONS
+
+    def test_no_client_without_keys(self):
+        """키가 없으면 HTTP 클라이언트 미생성"""
+        with patch.object(llm_module.settings, "OPENAI_API_KEY", None), \
+             patch.object(llm_module.settings, "ANTHROPIC_API_KEY", None), \
+             patch.object(llm_module, "_build_http_client") as build:
+            LLMManager()
+
+        build.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_sdk_clients(self, manager):
+        """aclose는 모든 SDK 클라이언트를 닫고, 한 곳이 실패해도 계속 진행"""
+        openai_client = MagicMock(spec=["close"])
+        openai_client.close = AsyncMock(side_effect=RuntimeError("loop closed"))
+        gemini_client = MagicMock()
+        gemini_client.aio.aclose = AsyncMock()
+        anthropic_client = MagicMock(spec=["close"])
+        anthropic_client.close = AsyncMock()
+
+        manager.openai_client = openai_client
+        manager.gemini_client = gemini_client
+        manager.anthropic_client = anthropic_client
+
+        await manager.aclose()
+
+        openai_client.close.assert_awaited_once()
+        gemini_client.aio.aclose.assert_awaited_once()
+        anthropic_client.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_prewarm_ignores_failures(self, manager):
+        """예열 요청 실패는 무시하고 나머지 프로바이더는 계속 예열"""
+        manager.openai_client = MagicMock()
+        manager.openai_client.models.list = AsyncMock(side_effect=RuntimeError("connect failed"))
+        manager.gemini_client = MagicMock()
+        manager.gemini_client.aio.models.list = AsyncMock()
+        manager.anthropic_client = None
+
+        await manager.prewarm()
+
+        manager.openai_client.models.list.assert_awaited_once()
+        manager.gemini_client.aio.models.list.assert_awaited_once_with(config={"page_size": 1})
+
+    @pytest.mark.asyncio
+    async def test_unconfigured_response_reused(self, manager):
+        """키 미설정 응답은 미리 만든 객체 재사용, 모델 지정 시에만 복사"""
+        manager.gemini_client = None
+
+        first = await manager._call_gemini_text(MESSAGES, None, 0.7, 1024)
+        second = await manager._call_gemini_text(MESSAGES, None, 0.7, 1024)
+        custom = await manager._call_gemini_text(MESSAGES, "gemini-2.5-flash", 0.7, 1024)
+
+        assert first is second
+        assert first.error == "Gemini API key not configured"
+        assert custom.model == "gemini-2.5-flash"
+        assert custom is not first
+
+    def test_singleton_created_once_across_threads(self):
+        """여러 스레드가 동시에 처음 호출해도 인스턴스는 하나"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with patch.object(llm_module, "_llm_manager", None), \
+             patch.object(llm_module, "LLMManager", side_effect=lambda: object()) as ctor:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                instances = list(pool.map(lambda _: llm_module.get_llm_manager(), range(16)))
+
+        assert ctor.call_count == 1
+        assert all(i is instances[0] for i in instances)
+
+class TestLazySdkImports:
+    """프로바이더 SDK 지연 로딩 테스트"""
+
+    def test_unconfigured_sdk_not_imported(self):
+        """API 키가 없는 프로바이더 SDK는 import하지 않음"""
+        import builtins
+
+        real_import = builtins.__import__
+        imported = []
+
+        def tracking_import(name, *args, **kwargs):
+            imported.append(name)
+            return real_import(name, *args, **kwargs)
+
+        with patch.object(llm_module.settings, "OPENAI_API_KEY", None), \
+             patch.object(llm_module.settings, "GEMINI_API_KEY", None), \
+             patch.object(llm_module.settings, "ANTHROPIC_API_KEY", None), \
+             patch.object(builtins, "__import__", tracking_import):
+            manager = LLMManager()
+
+        assert manager.get_available_providers() == []
+        assert not {"openai", "anthropic", "google"} & set(imported)
+
+
+class TestExtractJson:
+    """응답 텍스트 JSON 추출 테스트"""
+
+    def test_plain_json(self, manager):
+        """순수 JSON은 바로 파싱"""
+        assert manager._extract_json('{"name": "홍길동", "age": 30}') == {"name": "홍길동", "age": 30}
+
+    def test_surrounding_whitespace(self, manager):
+        """앞뒤 공백이 있는 JSON도 바로 파싱"""
+        assert manager._extract_json('\n  {"a": [1, 2]}\n') == {"a": [1, 2]}
+
+    def test_preamble_skips_direct_parse(self, manager):
+        """설명 문구로 시작하면 전체 파싱 시도 없이 후보 추출"""
+        with patch.object(llm_module, "_json_loads", wraps=llm_module._json_loads) as loads:
+            assert manager._extract_json('결과: {"a": 1}') == {"a": 1}
+
+        loads.assert_called_once_with('{"a": 1}')
+
+    def test_code_block(self, manager):
+        """코드 블록 안의 JSON 추출"""
+        text = '결과입니다:\n```json\n{"skills": ["Python"]}\n```\n'
+        assert manager._extract_json(text) == {"skills": ["Python"]}
+
+    def test_braces_with_preamble(self, manager):
+        """설명 문구 뒤의 JSON 객체 추출"""
+        text = 'Here is the JSON: {"a": {"b": 1}} 끝'
+        assert manager._extract_json(text) == {"a": {"b": 1}}
+
+    def test_invalid_returns_none(self, manager):
+        """JSON이 없으면 None"""
+        assert manager._extract_json("JSON 없음") is None
+        assert manager._extract_json("") is None
+
+    def test_multiple_objects_returns_first_valid(self, manager):
+        """객체가 여러 개면 첫 번째 유효 객체 반환 (전체 구간을 합치지 않음)"""
+        text = '형식은 {name} 입니다. 결과: {"a": 1} 참고: {"b": 2}'
+        assert manager._extract_json(text) == {"a": 1}
+
+
+class TestParseOffload:
+    """큰 응답 JSON 파싱 스레드 오프로딩 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_small_payload_parsed_inline(self):
+        """작은 응답은 이벤트 루프에서 바로 파싱"""
+        with patch.object(llm_module.asyncio, "to_thread") as to_thread:
+            result = await llm_module._parse_json('{"name": "홍길동"}')
+
+        assert result == {"name": "홍길동"}
+        to_thread.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_payload_offloaded(self):
+        """임계값 이상 응답은 스레드에서 파싱"""
+        raw = '{"summary": "' + "가" * 100 + '"}'
+        with patch.object(llm_module, "LLM_PARSE_OFFLOAD_CHARS", 50), \
+             patch.object(llm_module.asyncio, "to_thread", wraps=asyncio.to_thread) as to_thread:
+            result = await llm_module._parse_json(raw)
+
+        assert result == {"summary": "가" * 100}
+        to_thread.assert_called_once()
+
+
+class TestIterJsonCandidates:
+    """괄호 스캐너 테스트"""
+
+    def test_nested_object(self):
+        """중첩 객체는 최상위 하나로 반환"""
+        assert list(_iter_json_candidates('x {"a": {"b": {}}} y')) == ['{"a": {"b": {}}}']
+
+    def test_separate_objects(self):
+        """분리된 객체는 각각 반환"""
+        assert list(_iter_json_candidates('{"a": 1} 그리고 {"b": 2}')) == ['{"a": 1}', '{"b": 2}']
+
+    def test_braces_inside_strings_ignored(self):
+        """문자열 안의 괄호/이스케이프 따옴표는 깊이에 영향 없음"""
+        text = '{"summary": "괄호 } 와 \\"따옴표\\" {", "n": 1}'
+        assert list(_iter_json_candidates(text)) == [text]
+
+    def test_quote_outside_object_ignored(self):
+        """객체 밖 따옴표는 문자열 상태를 바꾸지 않음"""
+        assert list(_iter_json_candidates('Here\'s "the" JSON: {"a": 1}')) == ['{"a": 1}']
+
+    def test_unbalanced(self):
+        """닫히지 않은 객체는 반환하지 않음"""
+        assert list(_iter_json_candidates('{"a": {"b": 1}')) == []
+
+
+class TestResponseCache:
+    """동일 요청 응답 캐시 테스트"""
+
+    @pytest.fixture
+    def call(self, manager):
+        mock = AsyncMock(return_value=_ok())
+        manager._call_openai_json = mock
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_identical_request_served_from_cache(self, manager, call):
+        """동일 요청은 API를 한 번만 호출"""
+        first = await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+        second = await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+
+        assert call.await_count == 1
+        assert second.cached is True
+        assert second.content == first.content
+        assert second.usage["total_tokens"] == 0
+
+    @pytest.mark.asyncio
+    async def test_unparseable_claude_response_not_cached(self, manager):
+        """Claude JSON 추출 실패(content None)는 캐시하지 않고 다시 호출"""
+        unparseable = MagicMock(
+            content=[MagicMock(text="죄송합니다, JSON을 만들 수 없습니다.")],
+            usage=MagicMock(input_tokens=10, output_tokens=5),
+        )
+        client = MagicMock()
+        client.messages.create = AsyncMock(return_value=unparseable)
+        manager.anthropic_client = client
+
+        first = await manager.call_json(LLMProvider.CLAUDE, MESSAGES)
+        second = await manager.call_json(LLMProvider.CLAUDE, MESSAGES)
+
+        assert first.content is None
+        assert second.cached is False
+        assert client.messages.create.await_count == 2
+
+    def test_schema_digest_reused_for_same_object(self, manager):
+        """같은 스키마 객체는 해시를 다시 계산하지 않음"""
+        schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+        with patch.object(llm_module, "_json_dumps_sorted", wraps=llm_module._json_dumps_sorted) as dumps:
+            first = manager._schema_digest(schema)
+            second = manager._schema_digest(schema)
+
+        assert first == second
+        assert dumps.call_count == 1
+
+    def test_schema_digest_equal_schemas_match(self, manager):
+        """내용이 같은 다른 객체도 같은 해시 → 같은 캐시 키"""
+        schema = {"type": "object", "required": ["a", "b"]}
+        key1 = manager._response_cache_key(
+            "json", LLMProvider.OPENAI, MESSAGES, schema, None, 0.1, 100, False
+        )
+        key2 = manager._response_cache_key(
+            "json", LLMProvider.OPENAI, MESSAGES, dict(schema), None, 0.1, 100, False
+        )
+
+        assert key1 == key2
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_shared_across_instances(self, manager, call, tmp_path):
+        """디스크 캐시는 다른 인스턴스(새 작업 프로세스)에서도 적중"""
+        from utils.disk_cache import DiskCache, derive_key
+
+        disk = DiskCache(str(tmp_path / "llm.sqlite3"), ttl=60, key=derive_key("0" * 64, b"test"))
+        manager._disk_cache = disk
+        await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+
+        other = LLMManager()
+        other._disk_cache = disk
+        other._call_openai_json = AsyncMock(return_value=_ok())
+        hit = await other.call_json(LLMProvider.OPENAI, MESSAGES)
+
+        other._call_openai_json.assert_not_awaited()
+        assert hit.cached is True
+        assert hit.content == {"name": "홍길동"}
+        assert hit.provider == LLMProvider.OPENAI
+
+    def test_disk_cache_requires_encryption_key(self, tmp_path):
+        """ENCRYPTION_KEY가 없으면 디스크 캐시 비활성화 (PII 평문 저장 방지)"""
+        with patch.object(llm_module.settings, "LLM_DISK_CACHE_DIR", str(tmp_path)), \
+             patch.object(llm_module.settings, "ENCRYPTION_KEY", ""):
+            assert LLMManager()._disk_cache is None
+
+        with patch.object(llm_module.settings, "LLM_DISK_CACHE_DIR", str(tmp_path)), \
+             patch.object(llm_module.settings, "ENCRYPTION_KEY", "0" * 64):
+            assert LLMManager()._disk_cache is not None
+
+    @pytest.mark.asyncio
+    async def test_cached_content_is_a_copy(self, manager, call):
+        """캐시 적중 응답을 수정해도 캐시 원본은 유지"""
+        await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+        hit = await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+        hit.content["name"] = "변경"
+
+        again = await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+        assert again.content == {"name": "홍길동"}
+
+    @pytest.mark.asyncio
+    async def test_different_arguments_miss(self, manager, call):
+        """메시지/스키마가 다르면 캐시 미스"""
+        await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+        await manager.call_json(LLMProvider.OPENAI, MESSAGES[:1])
+        await manager.call_json(LLMProvider.OPENAI, MESSAGES, json_schema={"type": "object"})
+
+        assert call.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_no_cache_bypasses(self, manager, call):
+        """no_cache=True면 항상 API 호출"""
+        await manager.call_json(LLMProvider.OPENAI, MESSAGES, no_cache=True)
+        await manager.call_json(LLMProvider.OPENAI, MESSAGES, no_cache=True)
+
+        assert call.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_high_temperature_not_cached(self, manager):
+        """temperature가 높은 텍스트 호출은 캐시하지 않음"""
+        mock = AsyncMock(return_value=_ok("안녕하세요"))
+        manager._call_openai_text = mock
+
+        await manager.call_text(LLMProvider.OPENAI, MESSAGES)
+        await manager.call_text(LLMProvider.OPENAI, MESSAGES)
+
+        assert mock.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_coalesced(self, manager):
+        """동시에 들어온 동일 요청은 API 한 번만 호출하고 결과 공유"""
+        calls = 0
+
+        async def slow(*args):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return _ok()
+
+        manager._call_openai_json = slow
+
+        first, second = await asyncio.gather(
+            manager.call_json(LLMProvider.OPENAI, MESSAGES),
+            manager.call_json(LLMProvider.OPENAI, MESSAGES),
+        )
+
+        assert calls == 1
+        assert first.content == second.content == {"name": "홍길동"}
+        assert first.content is not second.content
+        assert [first.cached, second.cached] == [False, True]
+        assert first.usage["total_tokens"] == 120
+        assert second.usage["total_tokens"] == 0
+
+    @pytest.mark.asyncio
+    async def test_leader_cancellation_does_not_cancel_followers(self, manager):
+        """먼저 요청한 쪽이 취소되어도 대기 중인 요청은 결과 수신"""
+        async def slow(*args):
+            await asyncio.sleep(0.05)
+            return _ok()
+
+        manager._call_openai_json = slow
+
+        leader = asyncio.ensure_future(manager.call_json(LLMProvider.OPENAI, MESSAGES))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(manager.call_json(LLMProvider.OPENAI, MESSAGES))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        result = await follower
+        assert result.success is True
+        assert leader.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_failure_not_cached(self, manager):
+        """실패 응답은 캐시하지 않음"""
+        failed = LLMResponse(
+            provider=LLMProvider.OPENAI,
+            content=None,
+            raw_response="",
+            model="gpt-4o",
+            error="Invalid request",
+        )
+        mock = AsyncMock(side_effect=[failed, _ok()])
+        manager._call_openai_json = mock
+
+        first = await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+        second = await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+
+        assert first.success is False
+        assert second.success is True
+        assert second.cached is False
+
+
+class TestRetryBackoff:
+    """재시도 대기 (jitter, Retry-After) 테스트"""
+
+    @staticmethod
+    def _rate_limited(headers):
+        exc = Exception("Rate limit exceeded (429)")
+        exc.response = MagicMock(headers=headers)
+        return LLMResponse(
+            provider=LLMProvider.OPENAI, content=None, raw_response="",
+            model="gpt-4o", error=str(exc), exception=exc,
+        )
+
+    async def _retry_delays(self, manager, failure):
+        manager._call_openai_json = AsyncMock(side_effect=[failure, _ok()])
+        with patch.object(llm_module.asyncio, "sleep", new=AsyncMock()) as sleep:
+            result = await manager.call_json(LLMProvider.OPENAI, MESSAGES, no_cache=True)
+        assert result.success is True
+        return [c.args[0] for c in sleep.await_args_list]
+
+    @pytest.mark.asyncio
+    async def test_backoff_has_jitter(self, manager):
+        """대기 시간 = base * (1 + U(0, jitter))"""
+        with patch.object(llm_module.random, "uniform", return_value=0.25) as uniform:
+            delays = await self._retry_delays(manager, self._rate_limited({}))
+
+        uniform.assert_called_once_with(0, llm_module.LLM_RETRY_JITTER)
+        assert delays == [pytest.approx(llm_module.LLM_BASE_DELAY * 1.25)]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_header_honored(self, manager):
+        """Retry-After가 백오프보다 길면 그만큼 대기"""
+        delays = await self._retry_delays(manager, self._rate_limited({"retry-after": "7"}))
+
+        assert delays == [7.0]
+
+    @pytest.mark.asyncio
+    async def test_retry_after_ms_and_cap(self, manager):
+        """retry-after-ms 우선, 최대 LLM_MAX_RETRY_AFTER"""
+        delays = await self._retry_delays(manager, self._rate_limited({"retry-after-ms": "600000"}))
+
+        assert delays == [llm_module.LLM_MAX_RETRY_AFTER]
+
+    def test_retry_after_date_ignored(self):
+        """날짜 형식 Retry-After는 무시"""
+        exc = Exception()
+        exc.response = MagicMock(headers={"retry-after": "Wed, 21 Oct 2026 07:28:00 GMT"})
+
+        assert llm_module._retry_after_seconds(exc) is None
+        assert llm_module._retry_after_seconds(None) is None
+
+
+class TestRetryClassification:
+    """예외 타입 기반 재시도 판단 테스트"""
+
+    @staticmethod
+    def _status_error(status):
+        exc = Exception(f"Error code: {status}")
+        exc.status_code = status
+        return exc
+
+    def test_status_codes(self):
+        classify = llm_module._classify_retryable
+
+        assert classify(self._status_error(429)) is True
+        assert classify(self._status_error(503)) is True
+        assert classify(self._status_error(401)) is False
+        assert classify(self._status_error(400)) is False
+
+    def test_connection_and_timeout_errors(self):
+        class APIConnectionError(Exception):
+            pass
+
+        class APITimeoutError(APIConnectionError):
+            pass
+
+        assert llm_module._classify_retryable(APITimeoutError()) is True
+        assert llm_module._classify_retryable(asyncio.TimeoutError()) is True
+
+    def test_unknown_exception_falls_back(self):
+        assert llm_module._classify_retryable(ValueError("x")) is None
+        assert llm_module._classify_retryable(None) is None
+
+    @pytest.mark.asyncio
+    async def test_json_error_not_retried_despite_status_like_text(self, manager):
+        """'column 500' 같은 파싱 에러 메시지는 재시도하지 않음"""
+        import json
+
+        exc = json.JSONDecodeError("Expecting value", "x" * 600, 500)
+        failure = LLMResponse(
+            provider=LLMProvider.OPENAI, content=None, raw_response="",
+            model="gpt-4o", error=f"JSON parse error: {exc}", exception=exc,
+        )
+        manager._call_openai_json = AsyncMock(return_value=failure)
+
+        result = await manager.call_json(LLMProvider.OPENAI, MESSAGES, no_cache=True)
+
+        assert "500" in result.error
+        assert manager._call_openai_json.await_count == 1
+
+
+class TestRateLimit:
+    """프로바이더별 RPM/TPM 한도 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_each_attempt_acquires_estimated_tokens(self, manager):
+        """재시도를 포함한 각 시도마다 (프롬프트 추정 + max_tokens) 예약"""
+        limiter = MagicMock(enabled=True, acquire=AsyncMock())
+        manager._limiters[LLMProvider.OPENAI] = limiter
+        manager._call_openai_json = AsyncMock(side_effect=[
+            LLMResponse(provider=LLMProvider.OPENAI, content=None, raw_response="",
+                        model="gpt-4o", error="Rate limit exceeded (429)"),
+            _ok(),
+        ])
+
+        with patch.object(llm_module, "LLM_BASE_DELAY", 0):
+            result = await manager.call_json(LLMProvider.OPENAI, MESSAGES, max_tokens=100, no_cache=True)
+
+        assert result.success is True
+        prompt_chars = sum(len(m["content"]) for m in MESSAGES)
+        expected = prompt_chars // llm_module.LLM_CHARS_PER_TOKEN + 100
+        assert [c.args for c in limiter.acquire.await_args_list] == [(expected,), (expected,)]
+
+    def test_disabled_by_default(self, manager):
+        """기본값(0)이면 한도 비활성화"""
+        assert not manager._limiters[LLMProvider.OPENAI].enabled
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_response_pauses_provider(self, manager):
+        """429 응답이면 백오프 동안 같은 프로바이더 호출 전체를 멈춤"""
+        exc = Exception("Error code: 429")
+        exc.status_code = 429
+        limiter = MagicMock(enabled=False, acquire=AsyncMock())
+        manager._limiters[LLMProvider.OPENAI] = limiter
+        manager._call_openai_json = AsyncMock(side_effect=[
+            LLMResponse(provider=LLMProvider.OPENAI, content=None, raw_response="",
+                        model="gpt-4o", error=str(exc), exception=exc),
+            _ok(),
+        ])
+
+        with patch.object(llm_module.asyncio, "sleep", new=AsyncMock()) as sleep:
+            result = await manager.call_json(LLMProvider.OPENAI, MESSAGES, no_cache=True)
+
+        assert result.success is True
+        limiter.pause.assert_called_once_with(sleep.await_args.args[0])
+
+
+class TestCallAll:
+    """프로바이더 동시 호출 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_providers_called_concurrently(self, manager):
+        """전체 지연은 합계가 아니라 가장 느린 호출 수준"""
+        async def slow(*args):
+            await asyncio.sleep(0.1)
+            return _ok()
+
+        manager._call_openai_json = slow
+        manager._call_gemini_json = slow
+        manager._call_claude_json = slow
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        responses = await manager.call_all(MESSAGES, providers=list(LLMProvider))
+        elapsed = loop.time() - started
+
+        assert set(responses) == set(LLMProvider)
+        assert all(r.success for r in responses.values())
+        assert elapsed < 0.25
+
+    @pytest.mark.asyncio
+    async def test_exception_converted_to_failed_response(self, manager):
+        """예외가 발생한 프로바이더는 실패 응답으로 반환"""
+        manager._call_openai_json = AsyncMock(return_value=_ok())
+        manager._call_gemini_json = AsyncMock(side_effect=RuntimeError("boom"))
+
+        responses = await manager.call_all(
+            MESSAGES, providers=[LLMProvider.OPENAI, LLMProvider.GEMINI]
+        )
+
+        assert responses[LLMProvider.OPENAI].success is True
+        assert responses[LLMProvider.GEMINI].success is False
+        assert "boom" in responses[LLMProvider.GEMINI].error
+
+    @pytest.mark.asyncio
+    async def test_per_provider_concurrency_limit(self, manager):
+        """프로바이더별 동시 요청 수는 LLM_PROVIDER_CONCURRENCY 이하"""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_call(*args):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _ok()
+
+        manager._call_openai_json = fake_call
+
+        with patch.dict(llm_module.LLM_PROVIDER_CONCURRENCY, {"openai": 2}):
+            await asyncio.gather(*(
+                manager.call_json(LLMProvider.OPENAI, MESSAGES, no_cache=True)
+                for _ in range(6)
+            ))
+
+        assert max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrency_limit_disabled_per_provider(self, manager):
+        """한도 0인 프로바이더는 세마포어 없이 호출"""
+        with patch.dict(llm_module.LLM_PROVIDER_CONCURRENCY, {"gemini": 0, "openai": 3}):
+            assert manager._provider_semaphore(LLMProvider.GEMINI) is None
+            assert manager._provider_semaphore(LLMProvider.OPENAI)._value == 3
+
+
+class TestGeminiCalls:
+    """Gemini 호출 테스트"""
+
+    @pytest.fixture
+    def gemini(self, manager):
+        client = MagicMock()
+        response = MagicMock(text='{"name": "홍길동"}', usage_metadata=None)
+        client.aio.models.generate_content = AsyncMock(return_value=response)
+        manager.gemini_client = client
+        return client
+
+    @pytest.mark.asyncio
+    async def test_json_uses_async_client(self, manager, gemini):
+        """JSON 호출은 aio 클라이언트 사용 (스레드 오프로딩 없음)"""
+        result = await manager._call_gemini_json(MESSAGES, None, None, 0.1, 1024)
+
+        assert result.content == {"name": "홍길동"}
+        gemini.aio.models.generate_content.assert_awaited_once()
+        gemini.models.generate_content.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_json_timeout_is_retried(self, manager, gemini):
+        """타임아웃은 실패 응답으로 반환되고 재시도 대상"""
+        async def hang(**kwargs):
+            await asyncio.sleep(1)
+
+        gemini.aio.models.generate_content = hang
+
+        with patch.object(llm_module, "LLM_TIMEOUT_SECONDS", 0.01):
+            result = await manager._call_gemini_json(MESSAGES, None, None, 0.1, 1024)
+
+        assert result.success is False
+        assert "timeout" in result.error
+        assert isinstance(result.exception, asyncio.TimeoutError)
+        assert llm_module._classify_retryable(result.exception) is True
+
+    @pytest.mark.asyncio
+    async def test_usage_from_metadata(self, manager, gemini):
+        """usage_metadata → 토큰 사용량 (None 필드는 0)"""
+        gemini.aio.models.generate_content.return_value.usage_metadata = MagicMock(
+            prompt_token_count=120, candidates_token_count=None, total_token_count=120
+        )
+
+        result = await manager._call_gemini_json(MESSAGES, None, None, 0.1, 1024)
+
+        assert result.usage == {"prompt_tokens": 120, "completion_tokens": 0, "total_tokens": 120}
+
+    @pytest.mark.asyncio
+    async def test_usage_missing_metadata(self, manager, gemini):
+        """usage_metadata가 없으면 usage None"""
+        result = await manager._call_gemini_text(MESSAGES, None, 0.7, 1024)
+
+        assert result.usage is None
+
+    def test_split_messages(self):
+        """system은 system_instruction, 나머지는 네이티브 Content (알 수 없는 role 제외)"""
+        system, contents = _split_gemini_messages(MESSAGES + [
+            {"role": "tool", "content": "무시"},
+            {"role": "assistant", "content": "네"},
+        ])
+
+        assert system == "이력서에서 정보를 추출하세요."
+        assert contents == [
+            {"role": "user", "parts": [{"text": "홍길동 / Python 5년"}]},
+            {"role": "model", "parts": [{"text": "네"}]},
+        ]
+
+    def test_split_system_only(self):
+        """system만 있으면 사용자 입력으로 전달"""
+        system, contents = _split_gemini_messages([{"role": "system", "content": "요약하세요"}])
+
+        assert system is None
+        assert contents == [{"role": "user", "parts": [{"text": "요약하세요"}]}]
+
+    @pytest.mark.asyncio
+    async def test_system_prompt_sent_as_instruction(self, manager, gemini):
+        """system 프롬프트는 config.system_instruction으로 전달"""
+        await manager._call_gemini_json(MESSAGES, None, None, 0.1, 1024)
+
+        kwargs = gemini.aio.models.generate_content.await_args.kwargs
+        assert kwargs["config"].system_instruction == "이력서에서 정보를 추출하세요."
+        assert [c["role"] for c in kwargs["contents"]] == ["user"]
+
+    def test_config_shared_per_arguments(self):
+        """동일 인자 조합의 설정 객체는 재사용"""
+        json_config = _gemini_config(0.1, 1024, True)
+
+        assert _gemini_config(0.1, 1024, True) is json_config
+        assert json_config.response_mime_type == "application/json"
+        assert _gemini_config(0.1, 1024, False).response_mime_type is None
+
+    @pytest.mark.asyncio
+    async def test_text_uses_async_client(self, manager, gemini):
+        """텍스트 호출도 aio 클라이언트 사용"""
+        result = await manager._call_gemini_text(MESSAGES, None, 0.7, 1024)
+
+        assert result.success is True
+        gemini.aio.models.generate_content.assert_awaited_once()
+        gemini.models.generate_content.assert_not_called()
+
+
+def _openai_stream(pieces):
+    """OpenAI 스트리밍 응답 청크 모의"""
+    async def gen():
+        for piece in pieces:
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = piece
+            yield chunk
+    return gen()
+
+
+class TestJsonMemberStream:
+    """스트리밍 JSON 최상위 필드 파서 테스트"""
+
+    def test_members_emitted_as_completed(self):
+        """멤버가 완성되는 조각에서 바로 반환"""
+        parser = _JsonMemberStream()
+
+        assert parser.feed('{"name": "홍길') == []
+        assert parser.feed('동", "skills": ["Py') == [("name", "홍길동")]
+        assert parser.feed('thon", "Go"], "meta": {"a": [1, 2]}') == [("skills", ["Python", "Go"])]
+        assert parser.feed('}') == [("meta", {"a": [1, 2]})]
+        assert parser.done is True
+
+    def test_delimiters_inside_strings(self):
+        """문자열 안의 쉼표/괄호/이스케이프 따옴표는 멤버 경계가 아님"""
+        parser = _JsonMemberStream()
+        members = parser.feed('{"summary": "A, B } \\"C\\" {", "n": 1}')
+
+        assert members == [("summary", 'A, B } "C" {'), ("n", 1)]
+
+    def test_preamble_ignored(self):
+        """여는 중괄호 전 코드 펜스는 무시"""
+        parser = _JsonMemberStream()
+
+        assert parser.feed('```json\n{"a": 1}\n```') == [("a", 1)]
+        assert parser.done is True
+
+
+class TestStreamJson:
+    """stream_json 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_openai_stream(self, manager):
+        """OpenAI 스트림 조각을 최상위 필드로 변환"""
+        manager.openai_client = MagicMock()
+        manager.openai_client.chat.completions.create = AsyncMock(
+            return_value=_openai_stream(['{"name": "홍', '길동", "age"', ': 30}'])
+        )
+
+        members = [m async for m in manager.stream_json(LLMProvider.OPENAI, MESSAGES)]
+
+        assert members == [("name", "홍길동"), ("age", 30)]
+        kwargs = manager.openai_client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_incomplete_stream_raises(self, manager):
+        """객체가 닫히기 전에 스트림이 끝나면 ValueError"""
+        manager.openai_client = MagicMock()
+        manager.openai_client.chat.completions.create = AsyncMock(
+            return_value=_openai_stream(['{"name": "홍길동", "age": 3'])
+        )
+
+        with pytest.raises(ValueError):
+            async for _ in manager.stream_json(LLMProvider.OPENAI, MESSAGES):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_missing_client_raises(self, manager):
+        """클라이언트 미설정 시 RuntimeError"""
+        manager.anthropic_client = None
+
+        with pytest.raises(RuntimeError):
+            async for _ in manager.stream_json(LLMProvider.CLAUDE, MESSAGES):
+                pass
+
+
+class TestClaudePromptCaching:
+    """Claude system 프롬프트 캐싱 테스트"""
+
+    def test_short_system_prompt_plain_string(self):
+        """짧은 system 프롬프트는 문자열 그대로"""
+        system, messages = _split_claude_messages(MESSAGES)
+
+        assert system == MESSAGES[0]["content"]
+        assert messages == MESSAGES[1:]
+
+    def test_long_system_prompt_cached(self):
+        """긴 system 프롬프트는 cache_control 블록으로 전달"""
+        long_prompt = "규칙" * llm_module.CLAUDE_PROMPT_CACHE_MIN_CHARS
+        system, _ = _split_claude_messages([
+            {"role": "system", "content": long_prompt},
+            {"role": "user", "content": "이력서"},
+        ])
+
+        assert system == [{
+            "type": "text",
+            "text": long_prompt,
+            "cache_control": {"type": "ephemeral"},
+        }]
+
+    def test_no_system_prompt(self):
+        """system 메시지가 없으면 None"""
+        system, messages = _split_claude_messages(MESSAGES[1:])
+
+        assert system is None
+        assert messages == MESSAGES[1:]
+
+
+class TestModelRouting:
+    """적응형 모델 라우팅 테스트"""
+
+    @pytest.fixture
+    def calls(self, manager):
+        models = []
+
+        async def fake_call(messages, json_schema, model, temperature, max_tokens):
+            models.append(model)
+            return _ok()
+
+        manager._call_openai_json = fake_call
+        return models
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, manager, calls):
+        """임계값 0이면 기본 모델 사용"""
+        with patch.object(llm_module, "LLM_ROUTING_MAX_COMPLEXITY", 0):
+            await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+
+        assert calls == [None]
+
+    @pytest.mark.asyncio
+    async def test_simple_request_uses_small_model(self, manager, calls):
+        """복잡도가 임계값 이하이면 소형 모델"""
+        with patch.object(llm_module, "LLM_ROUTING_MAX_COMPLEXITY", 1000):
+            await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+
+        assert calls == [manager.small_models[LLMProvider.OPENAI]]
+
+    @pytest.mark.asyncio
+    async def test_complex_request_uses_default_model(self, manager, calls):
+        """긴 프롬프트/깊은 스키마는 기본 모델"""
+        long_messages = [{"role": "user", "content": "경력 " * 2000}]
+        with patch.object(llm_module, "LLM_ROUTING_MAX_COMPLEXITY", 1000):
+            await manager.call_json(LLMProvider.OPENAI, long_messages)
+
+        assert calls == [None]
+
+    @pytest.mark.asyncio
+    async def test_explicit_model_not_routed(self, manager, calls):
+        """모델을 지정하면 라우팅하지 않음"""
+        with patch.object(llm_module, "LLM_ROUTING_MAX_COMPLEXITY", 1000):
+            await manager.call_json(LLMProvider.OPENAI, MESSAGES, model="gpt-4o")
+
+        assert calls == ["gpt-4o"]
+
+    @pytest.mark.asyncio
+    async def test_small_model_failure_promotes(self, manager):
+        """소형 모델 실패 시 기본 모델로 한 번 재요청"""
+        models = []
+
+        async def fake_call(messages, json_schema, model, temperature, max_tokens):
+            models.append(model)
+            if model is not None:
+                return LLMResponse(
+                    provider=LLMProvider.OPENAI, content=None, raw_response="",
+                    model=model, error="JSON parse error",
+                )
+            return _ok()
+
+        manager._call_openai_json = fake_call
+
+        with patch.object(llm_module, "LLM_ROUTING_MAX_COMPLEXITY", 1000):
+            result = await manager.call_json(LLMProvider.OPENAI, MESSAGES)
+
+        assert result.success is True
+        assert models == [manager.small_models[LLMProvider.OPENAI], None]
+
+    def test_schema_depth(self):
+        """스키마 중첩 깊이 계산"""
+        assert _schema_depth(None) == 0
+        assert _schema_depth({"type": "object"}) == 1
+        assert _schema_depth({"properties": {"a": {"items": [{"type": "string"}]}}}) == 4
+
+
+class TestCallJsonBatch:
+    """같은 스키마 입력 묶음 요청 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_batch_splits_results_in_order(self, manager):
+        """묶음 응답을 입력 순서대로 항목별 응답으로 분리"""
+        call = AsyncMock(return_value=LLMResponse(
+            provider=LLMProvider.OPENAI,
+            content={"results": [{"n": 1}, {"n": 2}, {"n": 3}]},
+            raw_response="", model="gpt-4o",
+            usage={"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        ))
+        manager._call_openai_json = call
+
+        results = await manager.call_json_batch(LLMProvider.OPENAI, "추출", ["a", "b", "c"])
+
+        assert call.await_count == 1
+        assert [r.content for r in results] == [{"n": 1}, {"n": 2}, {"n": 3}]
+        assert results[0].usage["total_tokens"] == 15
+        assert results[1].usage is None
+        assert llm_module._json_loads(results[1].raw_response) == {"n": 2}
+        prompt = call.await_args.args[0][1]["content"]
+        assert "### Input 3\nc" in prompt
+
+    @pytest.mark.asyncio
+    async def test_batch_size_limited_by_output_tokens(self, manager):
+        """항목당 출력 토큰이 크면 묶음 크기 축소"""
+        seen = []
+
+        async def fake_call(messages, json_schema, model, temperature, max_tokens):
+            seen.append(max_tokens)
+            count = messages[1]["content"].count("### Input")
+            return LLMResponse(
+                provider=LLMProvider.OPENAI, content={"results": [{}] * count},
+                raw_response="", model="gpt-4o",
+            )
+
+        manager._call_openai_json = fake_call
+
+        with patch.object(llm_module, "LLM_BATCH_MAX_OUTPUT_TOKENS", 4000):
+            results = await manager.call_json_batch(
+                LLMProvider.OPENAI, "추출", ["a", "b", "c", "d", "e"], max_tokens_per_item=2000
+            )
+
+        assert len(results) == 5
+        assert sorted(seen) == [2000, 4000, 4000]
+
+    @pytest.mark.asyncio
+    async def test_mismatched_batch_falls_back_to_single_calls(self, manager):
+        """결과 수가 맞지 않으면 항목별로 다시 요청"""
+        async def fake_call(messages, json_schema, model, temperature, max_tokens):
+            content = messages[1]["content"]
+            if "### Input" in content:
+                result = {"results": [{"n": 1}]}
+            else:
+                result = {"prompt": content}
+            return LLMResponse(provider=LLMProvider.OPENAI, content=result, raw_response="", model="gpt-4o")
+
+        manager._call_openai_json = fake_call
+
+        results = await manager.call_json_batch(LLMProvider.OPENAI, "추출", ["a", "b"])
+
+        assert [r.content for r in results] == [{"prompt": "a"}, {"prompt": "b"}]
+
+
+class TestCallJsonHedged:
+    """헤지 요청 테스트"""
+
+    @staticmethod
+    def _response(provider, error=None):
+        return LLMResponse(
+            provider=provider,
+            content=None if error else {"provider": provider.value},
+            raw_response="",
+            model="m",
+            error=error,
+        )
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_hedged_and_cancelled(self, manager):
+        """첫 프로바이더가 늦으면 다음 프로바이더 응답 반환, 늦은 요청은 취소"""
+        cancelled = asyncio.Event()
+
+        async def openai_call(*args):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def gemini_call(*args):
+            return self._response(LLMProvider.GEMINI)
+
+        manager._call_openai_json = openai_call
+        manager._call_gemini_json = gemini_call
+
+        result = await manager.call_json_hedged(
+            MESSAGES, providers=[LLMProvider.OPENAI, LLMProvider.GEMINI],
+            hedge_delay=0.01, no_cache=True,
+        )
+        await asyncio.sleep(0)
+
+        assert result.content == {"provider": "gemini"}
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_failure_fails_over_immediately(self, manager):
+        """실패 응답이면 대기 없이 다음 프로바이더 요청"""
+        manager._call_openai_json = AsyncMock(
+            return_value=self._response(LLMProvider.OPENAI, error="Invalid API key (401)")
+        )
+        manager._call_gemini_json = AsyncMock(return_value=self._response(LLMProvider.GEMINI))
+
+        result = await asyncio.wait_for(
+            manager.call_json_hedged(
+                MESSAGES, providers=[LLMProvider.OPENAI, LLMProvider.GEMINI], hedge_delay=60
+            ),
+            timeout=1,
+        )
+
+        assert result.provider == LLMProvider.GEMINI
+
+    @pytest.mark.asyncio
+    async def test_all_fail_returns_last_failure(self, manager):
+        """모두 실패하면 마지막 실패 응답 반환"""
+        manager._call_openai_json = AsyncMock(
+            return_value=self._response(LLMProvider.OPENAI, error="Invalid API key (401)")
+        )
+        manager._call_gemini_json = AsyncMock(
+            return_value=self._response(LLMProvider.GEMINI, error="Invalid API key (403)")
+        )
+
+        result = await manager.call_json_hedged(
+            MESSAGES, providers=[LLMProvider.OPENAI, LLMProvider.GEMINI]
+        )
+
+        assert result.success is False
+        assert result.provider == LLMProvider.GEMINI
+
+    def test_hedge_delay_uses_p95_latency(self, manager):
+        """기록이 충분하면 최근 지연 p95, 부족하면 기본값"""
+        assert manager._hedge_delay(LLMProvider.OPENAI) == llm_module.LLM_HEDGE_DEFAULT_DELAY
+
+        manager._latencies[LLMProvider.OPENAI].extend(float(i) for i in range(1, 101))
+
+        assert 94 < manager._hedge_delay(LLMProvider.OPENAI) < 97
@@ -0,0 +1,132 @@
+"""
+TokenBucketLimiter 테스트
+
+테스트 대상:
+- RPM/TPM 예약 및 대기 시간 계산
+- 시간 경과에 따른 버킷 충전
+- 비활성화 (0 한도)
+- 429 후 일시 정지
+"""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from utils.rate_limiter import TokenBucketLimiter
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+class TestReserve:
+    """reserve 대기 시간 계산"""
+
+    def test_within_capacity_no_wait(self, clock):
+        limiter = TokenBucketLimiter(rpm=60, tpm=6000, clock=clock)
+
+        assert limiter.reserve(100) == 0.0
+
+    def test_rpm_exhausted_waits_for_one_request(self, clock):
+        limiter = TokenBucketLimiter(rpm=60, tpm=0, clock=clock)
+        for _ in range(60):
+            assert limiter.reserve() == 0.0
+
+        # 분당 60건 → 1건 충전에 1초
+        assert limiter.reserve() == pytest.approx(1.0)
+        # 예약이 누적되어 다음 요청은 더 오래 대기
+        assert limiter.reserve() == pytest.approx(2.0)
+
+    def test_tpm_exhausted_waits_for_tokens(self, clock):
+        limiter = TokenBucketLimiter(rpm=0, tpm=600, clock=clock)
+
+        assert limiter.reserve(600) == 0.0
+        # 분당 600토큰 → 초당 10토큰
+        assert limiter.reserve(50) == pytest.approx(5.0)
+
+    def test_refill_over_time(self, clock):
+        limiter = TokenBucketLimiter(rpm=0, tpm=600, clock=clock)
+        limiter.reserve(600)
+
+        clock.now = 30.0
+
+        assert limiter.reserve(300) == 0.0
+
+    def test_request_larger_than_tpm_is_capped(self, clock):
+        limiter = TokenBucketLimiter(rpm=0, tpm=600, clock=clock)
+
+        assert limiter.reserve(10_000) == 0.0
+        assert limiter.reserve(60) == pytest.approx(6.0)
+
+
+class TestAcquire:
+    """acquire 대기 동작"""
+
+    @pytest.mark.asyncio
+    async def test_sleeps_for_reserved_wait(self, clock):
+        limiter = TokenBucketLimiter(rpm=60, tpm=0, clock=clock)
+        for _ in range(60):
+            limiter.reserve()
+
+        with patch("utils.rate_limiter.asyncio.sleep", new=AsyncMock()) as sleep:
+            await limiter.acquire()
+
+        sleep.assert_awaited_once()
+        assert sleep.await_args.args[0] == pytest.approx(1.0)
+
+    @pytest.mark.asyncio
+    async def test_disabled_limiter_never_waits(self, clock):
+        limiter = TokenBucketLimiter(rpm=0, tpm=0, clock=clock)
+
+        with patch("utils.rate_limiter.asyncio.sleep", new=AsyncMock()) as sleep:
+            for _ in range(1000):
+                await limiter.acquire(10_000)
+
+        sleep.assert_not_awaited()
+
+
+class TestPause:
+    """pause 일시 정지"""
+
+    def test_pause_delays_next_reservation(self, clock):
+        limiter = TokenBucketLimiter(rpm=600, tpm=0, clock=clock)
+        limiter.pause(5.0)
+
+        assert limiter.reserve() == pytest.approx(5.0)
+
+        clock.now = 5.0
+        assert limiter.reserve() == 0.0
+
+    def test_pause_not_shortened_by_rpm_wait(self, clock):
+        """RPM 버킷 대기가 더 짧아도 pause 시간만큼 대기"""
+        limiter = TokenBucketLimiter(rpm=60, tpm=0, clock=clock)
+        limiter._requests = 0.5
+        limiter.pause(30.0)
+
+        assert limiter.reserve() == pytest.approx(30.0)
+
+    def test_shorter_pause_does_not_shorten_existing(self, clock):
+        limiter = TokenBucketLimiter(rpm=600, tpm=0, clock=clock)
+        limiter.pause(5.0)
+        limiter.pause(1.0)
+
+        assert limiter.reserve() == pytest.approx(5.0)
+
+    @pytest.mark.asyncio
+    async def test_pause_applies_to_disabled_limiter(self, clock):
+        limiter = TokenBucketLimiter(rpm=0, tpm=0, clock=clock)
+        limiter.pause(3.0)
+
+        with patch("utils.rate_limiter.asyncio.sleep", new=AsyncMock()) as sleep:
+            await limiter.acquire()
+
+        sleep.assert_awaited_once()
+        assert sleep.await_args.args[0] == pytest.approx(3.0)
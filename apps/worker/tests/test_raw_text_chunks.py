@@ -20,10 +20,28 @@ Critical Edge Cases (시니어 QA):
 import pytest
 import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import openai
 from services.embedding_service import EmbeddingService, ChunkType
 from config import chunking_config
 
 
+def _openai_status_error(error_cls, status_code: int, message: str = "error"):
+    """OpenAI SDK의 HTTP 상태 에러 생성"""
+    request = httpx.Request("POST", "https://api.openai.com/v1/embeddings")
+    response = httpx.Response(status_code, request=request)
+    return error_cls(message, response=response, body=None)
+
+
+def _rate_limit_error(message: str = "Rate limit exceeded (429)"):
+    return _openai_status_error(openai.RateLimitError, 429, message)
+
+
+def _server_error(status_code: int = 500, message: str = "Temporary server error"):
+    return _openai_status_error(openai.InternalServerError, status_code, message)
+
+
 class TestBuildRawTextChunks:
     """_build_raw_text_chunks 메서드 테스트"""
 
@@ -280,6 +298,59 @@ class TestTokenCount:
         assert count == 0
 
 
+class TestEncodingCache:
+    """tiktoken 인코더 모듈 레벨 캐시 테스트"""
+
+    @pytest.fixture
+    def fake_tiktoken(self):
+        from services import embedding_service as module
+
+        fake = MagicMock()
+        module._get_encoding.cache_clear()
+        with patch.dict("sys.modules", {"tiktoken": fake}), \
+             patch.object(module, "TIKTOKEN_AVAILABLE", True):
+            yield fake
+        module._get_encoding.cache_clear()
+
+    def test_encoder_shared_across_instances(self, fake_tiktoken):
+        """여러 인스턴스가 하나의 인코더를 공유"""
+        first = EmbeddingService()
+        second = EmbeddingService()
+
+        assert first._encoding is second._encoding
+        fake_tiktoken.encoding_for_model.assert_called_once_with(
+            EmbeddingService.EMBEDDING_MODEL
+        )
+
+    def test_batch_count_uses_encode_ordinary_batch(self, fake_tiktoken):
+        """배치 토큰 카운트는 encode_ordinary_batch 한 번으로 처리"""
+        service = EmbeddingService()
+        service._encoding.encode_ordinary_batch.return_value = [[1, 2], [3], [4, 5, 6]]
+
+        assert service._count_tokens_batch(["a", "b", "c"]) == 6
+        service._encoding.encode_ordinary_batch.assert_called_once()
+        service._encoding.encode_ordinary.assert_not_called()
+
+    def test_count_skips_special_token_check(self, fake_tiktoken):
+        """단일 토큰 카운트는 특수 토큰 검사 없는 encode_ordinary 사용"""
+        service = EmbeddingService()
+        service._encoding.encode_ordinary.return_value = [1, 2, 3]
+
+        assert service._count_tokens("<|endoftext|> 이력서") == 3
+        service._encoding.encode.assert_not_called()
+
+    def test_unknown_model_falls_back_to_cl100k(self, fake_tiktoken):
+        """모르는 모델명은 cl100k_base 인코더 사용"""
+        from services.embedding_service import _get_encoding
+
+        fake_tiktoken.encoding_for_model.side_effect = KeyError("unknown")
+
+        encoding = _get_encoding("unknown-model")
+
+        fake_tiktoken.get_encoding.assert_called_once_with("cl100k_base")
+        assert encoding is fake_tiktoken.get_encoding.return_value
+
+
 class TestChunkWeights:
     """청크 타입별 가중치 테스트"""
 
@@ -461,7 +532,7 @@ class TestCriticalEdgeCase13_RetrySuccess:
             call_count += 1
             if call_count == 1:
                 # 첫 번째 호출: Rate Limit 에러
-                raise Exception("Rate limit exceeded (429)")
+                raise _rate_limit_error()
             # 두 번째 호출: 성공
             return "success_result"
 
@@ -487,7 +558,7 @@ class TestCriticalEdgeCase13_RetrySuccess:
             call_count += 1
             if call_count <= 2:
                 # 1, 2번째 호출: 실패
-                raise Exception("Temporary server error (500)")
+                raise _server_error(500)
             # 3번째 호출: 성공
             return "success_after_retries"
 
@@ -512,7 +583,7 @@ class TestCriticalEdgeCase13_RetrySuccess:
         async def mock_api_call(*args, **kwargs):
             call_times.append(time.time())
             if len(call_times) < 4:
-                raise Exception("Retry me")
+                raise ConnectionError("Retry me")
             return "done"
 
         # jitter를 0으로 고정하여 순수 지수 백오프만 테스트
@@ -565,7 +636,7 @@ class TestCriticalEdgeCase14_RetryExhausted:
         async def mock_api_call(*args, **kwargs):
             nonlocal call_count
             call_count += 1
-            raise Exception(f"Persistent error (attempt {call_count})")
+            raise _server_error(503, f"Persistent error (attempt {call_count})")
 
         with patch.object(chunking_config, 'RETRY_BASE_WAIT_SECONDS', 0.01), \
              patch.object(chunking_config, 'RETRY_MAX_WAIT_SECONDS', 0.05):
@@ -598,13 +669,13 @@ class TestCriticalEdgeCase14_RetryExhausted:
 
     @pytest.mark.asyncio
     async def test_different_exception_types(self, service):
-        """다양한 예외 타입에서도 재시도"""
+        """일시적 오류 타입들에서 재시도"""
         call_count = 0
         exceptions = [
             ConnectionError("Network error"),
             TimeoutError("Request timeout"),
-            ValueError("Invalid response"),
-            Exception("Generic error"),
+            _rate_limit_error(),
+            _server_error(502),
         ]
 
         async def mock_api_call(*args, **kwargs):
@@ -628,13 +699,36 @@ class TestCriticalEdgeCase14_RetryExhausted:
         assert call_count == 4
         assert result is None
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [
+        ValueError("Invalid response"),
+        _openai_status_error(openai.BadRequestError, 400, "Invalid input"),
+        _openai_status_error(openai.AuthenticationError, 401, "Invalid API key"),
+    ])
+    async def test_unrecoverable_error_not_retried(self, service, error):
+        """재시도 불가 오류는 즉시 None 반환"""
+        call_count = 0
+
+        async def mock_api_call(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            raise error
+
+        result = await service._retry_with_exponential_backoff(
+            mock_api_call,
+            max_retries=3
+        )
+
+        assert result is None
+        assert call_count == 1
+
     @pytest.mark.asyncio
     async def test_logging_on_max_retries_exceeded(self, service, caplog):
         """최대 재시도 초과 시 에러 로그 기록"""
         import logging
 
         async def mock_api_call(*args, **kwargs):
-            raise Exception("Always fails")
+            raise ConnectionError("Always fails")
 
         with patch.object(chunking_config, 'RETRY_BASE_WAIT_SECONDS', 0.01), \
              patch.object(chunking_config, 'RETRY_MAX_WAIT_SECONDS', 0.05):
@@ -680,7 +774,7 @@ class TestCriticalEdgeCase_EmbeddingWithRetry:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                raise Exception("Rate limit")
+                raise _rate_limit_error()
             return mock_response
 
         service.client.embeddings.create = mock_create
@@ -1103,7 +1197,7 @@ class TestHighEdgeCase16_PartialBatchFailure:
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                raise Exception("Rate limit")
+                raise _rate_limit_error()
             return mock_response
 
         service.client.embeddings.create = mock_create
@@ -1123,7 +1217,7 @@ class TestHighEdgeCase16_PartialBatchFailure:
         texts = ["텍스트1", "텍스트2"]
 
         async def mock_always_fail(*args, **kwargs):
-            raise Exception("Persistent error")
+            raise ConnectionError("Persistent error")
 
         service.client.embeddings.create = mock_always_fail
 
@@ -1951,3 +2045,270 @@ class TestLowEdgeCase_RealWorldScenarios:
         chunks = service._build_raw_text_chunks(text)
 
         assert len(chunks) >= 1
+
+
+class TestParallelChunkRetry:
+    """배치 실패 청크 개별 재시도 병렬화 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        service = EmbeddingService()
+        service.client = MagicMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_failed_chunks_retried_concurrently(self, service):
+        """실패 청크 재시도가 세마포어 한도 내에서 동시에 실행"""
+        data = {
+            "name": "홍길동",
+            "careers": [{"company": f"회사{i}"} for i in range(8)],
+        }
+        in_flight = 0
+        max_in_flight = 0
+
+        async def fake_create_embedding(text):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [0.1] * 1536
+
+        async def fake_batch(texts):
+            return [None] * len(texts)
+
+        service.create_embeddings_batch = fake_batch
+        service.create_embedding = fake_create_embedding
+
+        with patch.object(chunking_config, 'EMBEDDING_RETRY_CONCURRENCY', 3):
+            result = await service.process_candidate(data)
+
+        assert result.embedded_chunks == result.total_chunks == 9
+        assert result.failed_chunks == 0
+        assert max_in_flight == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_results_mapped_to_original_chunks(self, service):
+        """재시도 결과가 원래 청크 위치에 할당"""
+        data = {"name": "홍길동", "careers": [{"company": "A사"}, {"company": "B사"}]}
+
+        async def fake_batch(texts):
+            return [[0.0] * 1536, None, None]
+
+        async def fake_create_embedding(text):
+            return None if "B사" in text else [0.5] * 1536
+
+        service.create_embeddings_batch = fake_batch
+        service.create_embedding = fake_create_embedding
+
+        result = await service.process_candidate(data)
+
+        assert result.chunks[1].embedding == [0.5] * 1536
+        assert result.chunks[2].embedding is None
+        assert result.failed_chunks == 1
+
+
+class TestDuplicateChunkDedup:
+    """동일 텍스트 청크 중복 제거 후 임베딩 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        service = EmbeddingService()
+        service.client = MagicMock()
+        return service
+
+    @pytest.mark.asyncio
+    async def test_identical_texts_embedded_once(self, service):
+        """동일 텍스트는 한 번만 요청하고 결과를 모든 청크에 분배"""
+        data = {"name": "홍길동", "careers": [{"company": "A사"}, {"company": "A사"}]}
+        requested = []
+
+        async def fake_batch(texts):
+            requested.append(list(texts))
+            return [[float(i)] * 1536 for i in range(len(texts))]
+
+        service.create_embeddings_batch = fake_batch
+
+        result = await service.process_candidate(data)
+
+        assert result.total_chunks == 3
+        assert len(requested[0]) == 2
+        assert len(set(requested[0])) == 2
+        assert result.chunks[1].embedding == result.chunks[2].embedding == [1.0] * 1536
+        assert result.embedded_chunks == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_duplicate_retried_once(self, service):
+        """실패한 중복 텍스트는 한 번만 재시도하고 모든 청크에 반영"""
+        data = {"name": "홍길동", "careers": [{"company": "A사"}, {"company": "A사"}]}
+        retried = []
+
+        async def fake_batch(texts):
+            return [[0.0] * 1536, None]
+
+        async def fake_create_embedding(text):
+            retried.append(text)
+            return None
+
+        service.create_embeddings_batch = fake_batch
+        service.create_embedding = fake_create_embedding
+
+        result = await service.process_candidate(data)
+
+        assert len(retried) == 1
+        assert result.chunks[1].embedding is None
+        assert result.chunks[2].embedding is None
+        assert result.failed_chunks == 2
+        assert result.embedded_chunks == 1
+
+
+class TestBatchSplitting:
+    """배치 임베딩 요청 분할 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        service = EmbeddingService()
+        service.client = MagicMock()
+        return service
+
+    @staticmethod
+    def _response_for(batch):
+        items = []
+        for i, text in enumerate(batch):
+            item = MagicMock()
+            item.index = i
+            item.embedding = [float(text)]
+            items.append(item)
+        response = MagicMock()
+        response.data = items
+        return response
+
+    def test_split_by_input_count(self, service):
+        """입력 수 한도로 분할"""
+        with patch.object(chunking_config, 'EMBEDDING_BATCH_MAX_INPUTS', 2):
+            batches = service._split_batches(["a", "b", "c", "d", "e"])
+
+        assert [(offset, batch) for offset, batch, _ in batches] == [
+            (0, ["a", "b"]), (2, ["c", "d"]), (4, ["e"])
+        ]
+
+    def test_split_by_token_budget(self, service):
+        """토큰 한도로 분할 (한도를 넘는 단일 텍스트도 단독 배치)"""
+        service._count_tokens_each = MagicMock(return_value=[6, 5, 20, 1])
+
+        with patch.object(chunking_config, 'EMBEDDING_BATCH_MAX_TOKENS', 10):
+            batches = service._split_batches(["a", "b", "c", "d"])
+
+        assert batches == [(0, ["a"], 6), (1, ["b"], 5), (2, ["c"], 20), (3, ["d"], 1)]
+
+    @pytest.mark.asyncio
+    async def test_results_reassembled_in_order(self, service):
+        """분할 요청 결과를 원래 순서로 재조립"""
+        async def fake_create(model, input):
+            return self._response_for(input)
+
+        service.client.embeddings.create = AsyncMock(side_effect=fake_create)
+
+        with patch.object(chunking_config, 'EMBEDDING_BATCH_MAX_INPUTS', 2):
+            result = await service.create_embeddings_batch(["0", "1", "2", "3", "4"])
+
+        assert service.client.embeddings.create.call_count == 3
+        assert result == [[0.0], [1.0], [2.0], [3.0], [4.0]]
+
+    @pytest.mark.asyncio
+    async def test_rate_limiter_acquired_per_request(self, service):
+        """분할 요청마다 추정 토큰 수만큼 한도 확보 후 호출"""
+        from services import embedding_service as module
+
+        async def fake_create(model, input):
+            return self._response_for(input)
+
+        service.client.embeddings.create = AsyncMock(side_effect=fake_create)
+        service._count_tokens_each = MagicMock(return_value=[3, 4, 5])
+
+        with patch.object(chunking_config, 'EMBEDDING_BATCH_MAX_INPUTS', 2), \
+             patch.object(module._embedding_limiter, 'acquire', new=AsyncMock()) as acquire:
+            await service.create_embeddings_batch(["0", "1", "2"])
+
+        assert sorted(call.args[0] for call in acquire.await_args_list) == [5, 7]
+
+    @pytest.mark.asyncio
+    async def test_failed_shard_only_affects_its_texts(self, service):
+        """한 분할 요청이 실패해도 나머지 결과는 유지"""
+        async def fake_create(model, input):
+            if "2" in input:
+                raise ConnectionError("shard failed")
+            return self._response_for(input)
+
+        service.client.embeddings.create = AsyncMock(side_effect=fake_create)
+
+        with patch.object(chunking_config, 'EMBEDDING_BATCH_MAX_INPUTS', 2), \
+             patch.object(chunking_config, 'MAX_EMBEDDING_RETRIES', 0):
+            result = await service.create_embeddings_batch(["0", "1", "2", "3", "4"])
+
+        assert result == [[0.0], [1.0], None, None, [4.0]]
+
+
+class TestSkillCategorization:
+    """스킬 카테고리화 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        service = EmbeddingService()
+        service.client = None
+        return service
+
+    def test_exact_keyword_lookup(self, service):
+        """키워드와 정확히 일치하는 스킬 분류"""
+        result = service._categorize_skills(["Python", "Django", "MongoDB", "Docker", "Figma"])
+
+        assert result == {
+            "프로그래밍": ["Python"],
+            "프레임워크": ["Django"],
+            "데이터베이스": ["MongoDB"],
+            "클라우드/인프라": ["Docker"],
+            "기타": ["Figma"],
+        }
+
+    def test_compound_names_use_keyword_scan(self, service):
+        """복합 표기는 포함된 키워드로 분류"""
+        result = service._categorize_skills(["Spring Boot", "Golang", "CI/CD pipeline"])
+
+        assert result["프레임워크"] == ["Spring Boot"]
+        assert result["프로그래밍"] == ["Golang"]
+        assert result["클라우드/인프라"] == ["CI/CD pipeline"]
+
+    def test_category_priority_over_position(self, service):
+        """여러 키워드가 있으면 위치가 아닌 카테고리 우선순위로 분류"""
+        result = service._categorize_skills(["AWS Lambda (Python)"])
+
+        assert result == {"프로그래밍": ["AWS Lambda (Python)"]}
+
+
+class TestBoundedJoin:
+    """_bounded_join 테스트"""
+
+    @pytest.mark.parametrize("parts,limit", [
+        (["abc", None, "", "de"], 100),
+        (["abc", "de"], 4),
+        (["abc", "de"], 3),
+        (["abc", "de"], 5),
+        (["a" * 50, "b" * 50], 60),
+        ([], 10),
+    ])
+    def test_matches_join_then_slice(self, parts, limit):
+        """'\\n'.join(...)[:limit]과 같은 결과"""
+        from services.embedding_service import _bounded_join
+
+        expected = "\n".join(filter(None, parts))[:limit]
+        assert _bounded_join(parts, limit) == expected
+
+    def test_long_description_truncated_to_max_chars(self):
+        """긴 업무 내용은 MAX_CHUNK_CHARS로 잘림"""
+        service = EmbeddingService()
+        data = {"careers": [{"company": "A사", "description": "가" * 10000}]}
+
+        chunks = service._build_career_chunks(data)
+
+        assert len(chunks[0].content) == EmbeddingService.MAX_CHUNK_CHARS
+        assert chunks[0].content.startswith("회사: A사\n\n업무 내용:\n가")
@@ -0,0 +1,131 @@
+"""
+Disk Cache - SQLite 기반 프로세스 간 TTL 캐시
+
+RQ Worker는 작업마다 work-horse 프로세스를 fork하므로 메모리 캐시는 작업이 끝나면 사라짐.
+같은 컨테이너의 작업/재시작 사이에서 결정적(temperature 0 근처) LLM 응답을 재사용.
+
+Usage:
+    aead_key = derive_key(settings.ENCRYPTION_KEY, b"llm-disk-cache")
+    cache = DiskCache("/tmp/llm_cache/responses.sqlite3", ttl=86400, key=aead_key)
+    cache.set(key, b"...")
+    cache.get(key)  # 없거나 만료되었으면 None
+
+주의사항:
+    - 연결은 호출마다 새로 열고 닫음 (fork/스레드 간 sqlite 연결 공유 금지)
+    - 캐시 장애(잠금, 디스크 부족)는 경고만 남기고 미스로 처리 → 호출 흐름을 막지 않음
+    - key를 주면 값을 AES-256-GCM으로 암호화 (이력서 PII는 반드시 암호화해서 저장)
+    - 복호화 실패(키 변경, 손상)도 미스로 처리
+"""
+
+import contextlib
+import logging
+import os
+import sqlite3
+import time
+from typing import Callable, Optional
+
+from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
+
+logger = logging.getLogger(__name__)
+
+NONCE_SIZE = 12
+
+
+def derive_key(secret: str, purpose: bytes) -> bytes:
+    """마스터 키에서 용도별 AES-256 키 유도 (HKDF-SHA256, 용도마다 다른 키)"""
+    return HKDF(algorithm=hashes.SHA256(), length=32, salt=None, info=purpose).derive(
+        secret.encode("utf-8")
+    )
+
+
+class DiskCache:
+    """
+    SQLite 파일 하나에 (key, value bytes, 만료 시각)을 저장하는 TTL 캐시
+
+    - 만료 항목은 조회 시 미스 처리, 저장 시 일괄 삭제
+    - 암호화 시 저장 형식: nonce(12) + ciphertext(tag 포함), 캐시 키를 AAD로 사용
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl: float,
+        clock: Callable[[], float] = time.time,
+        key: Optional[bytes] = None,
+    ):
+        self.path = path
+        self.ttl = ttl
+        self._clock = clock
+        self._aead = AESGCM(key) if key is not None else None
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with contextlib.closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=1.0)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """캐시 조회 (없거나 만료되었으면 None)"""
+        try:
+            conn = self._connect()
+            try:
+                row = conn.execute(
+                    "SELECT value FROM cache WHERE key = ? AND expires_at > ?",
+                    (key, self._clock()),
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("[DiskCache] 조회 실패: %s", e)
+            return None
+        if row is None:
+            return None
+        if self._aead is None:
+            return row[0]
+        data = row[0]
+        try:
+            return self._aead.decrypt(data[:NONCE_SIZE], data[NONCE_SIZE:], key.encode())
+        except (InvalidTag, ValueError):
+            logger.warning("[DiskCache] 복호화 실패 (키 변경 또는 손상)")
+            return None
+
+    def set(self, key: str, value: bytes) -> None:
+        """캐시 저장 (만료 항목 정리 포함)"""
+        if self._aead is not None:
+            nonce = os.urandom(NONCE_SIZE)
+            value = nonce + self._aead.encrypt(nonce, value, key.encode())
+
+        now = self._clock()
+        try:
+            conn = self._connect()
+            try:
+                with conn:
+                    conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,))
+                    conn.execute(
+                        "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, value, now + self.ttl),
+                    )
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning("[DiskCache] 저장 실패: %s", e)
+
+    def clear(self) -> None:
+        """전체 캐시 비우기"""
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM cache")
+        finally:
+            conn.close()
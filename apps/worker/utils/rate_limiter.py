@@ -0,0 +1,93 @@
+"""
+Rate Limiter - 요청 수(RPM) / 토큰 수(TPM) 선제 제한
+
+429 응답 후 백오프하는 대신, 호출 전에 분당 한도를 지켜
+동시 요청(배치 분할, 병렬 재시도)이 서로 충돌하지 않도록 함.
+
+Usage:
+    limiter = TokenBucketLimiter(rpm=3000, tpm=1_000_000)
+    await limiter.acquire(estimated_tokens)
+    response = await client.embeddings.create(...)
+
+주의사항:
+    - RQ Worker는 스레드마다 별도 이벤트 루프를 사용하므로 asyncio.Lock 대신
+      threading.Lock으로 버킷만 갱신하고, 대기는 락 밖에서 asyncio.sleep으로 수행
+    - rpm/tpm이 0 이하면 해당 한도는 비활성화
+    - 그래도 429를 받으면 pause()로 Retry-After 동안 모든 호출을 멈춤 (한도 비활성화여도 적용)
+"""
+
+import asyncio
+import threading
+import time
+from typing import Callable
+
+
+class TokenBucketLimiter:
+    """
+    RPM/TPM 이중 토큰 버킷
+
+    acquire()는 버킷에서 먼저 차감(예약)하고, 잔량이 음수면
+    채워질 때까지 기다림 → 대기 순서대로 한도가 배분됨
+    """
+
+    def __init__(
+        self,
+        rpm: int,
+        tpm: int,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._requests = float(max(rpm, 0))
+        self._tokens = float(max(tpm, 0))
+        self._updated = clock()
+        self._paused_until = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.rpm > 0 or self.tpm > 0
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        if self.rpm > 0:
+            self._requests = min(self.rpm, self._requests + elapsed * self.rpm / 60)
+        if self.tpm > 0:
+            self._tokens = min(self.tpm, self._tokens + elapsed * self.tpm / 60)
+
+    def reserve(self, tokens: int = 0) -> float:
+        """
+        요청 1건 + tokens만큼 예약하고 대기해야 할 시간(초) 반환
+
+        한 번에 TPM보다 큰 요청은 TPM으로 잘라 예약 (영원히 대기하지 않도록)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+
+            wait = max(self._paused_until - now, 0.0)
+            if self.rpm > 0:
+                self._requests -= 1
+                if self._requests < 0:
+                    wait = max(wait, -self._requests * 60 / self.rpm)
+            if self.tpm > 0:
+                self._tokens -= min(tokens, self.tpm)
+                if self._tokens < 0:
+                    wait = max(wait, -self._tokens * 60 / self.tpm)
+            return wait
+
+    def pause(self, seconds: float) -> None:
+        """seconds 동안 이후 요청을 모두 대기시킴 (429 응답 시 같은 프로바이더 호출 전체 감속)"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+    async def acquire(self, tokens: int = 0) -> None:
+        """한도 내에서 요청 가능해질 때까지 대기"""
+        if not self.enabled and self._paused_until <= self._clock():
+            return
+
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
@@ -0,0 +1,74 @@
+-- =====================================================
+-- Migration: Saga 보상 트랜잭션 RPC
+-- 문제: SaveContext.rollback이 액션마다 REST 호출 1회 (N 왕복, 부분 롤백 가능)
+-- 해결: 액션 목록을 JSONB로 받아 단일 트랜잭션에서 일괄 실행
+-- =====================================================
+
+/**
+ * rollback_actions: 보상 트랜잭션 일괄 실행
+ * - 전달된 순서대로 실행 (호출자가 역순 정렬)
+ * - action = 'delete': 해당 레코드 DELETE
+ * - action = 'restore': previous_data의 컬럼으로 UPDATE
+ * - 허용된 테이블 외에는 예외 발생
+ * - service_role 전용 (PUBLIC/anon/authenticated 실행 권한 회수)
+ *
+ * @param actions: [{table, action, record_id, previous_data}, ...]
+ * @returns: 실행된 액션 수
+ */
+CREATE OR REPLACE FUNCTION rollback_actions(actions JSONB)
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+  v_action JSONB;
+  v_table TEXT;
+  v_record_id UUID;
+  v_previous JSONB;
+  v_set_clause TEXT;
+  v_count INT := 0;
+BEGIN
+  FOR v_action IN SELECT * FROM jsonb_array_elements(COALESCE(actions, '[]'::jsonb))
+  LOOP
+    v_table := v_action->>'table';
+    v_record_id := (v_action->>'record_id')::UUID;
+
+    IF v_table NOT IN ('candidates', 'candidate_chunks') THEN
+      RAISE EXCEPTION 'rollback_actions: table not allowed: %', v_table;
+    END IF;
+
+    IF v_action->>'action' = 'delete' THEN
+      EXECUTE format('DELETE FROM %I WHERE id = $1', v_table)
+      USING v_record_id;
+      v_count := v_count + 1;
+
+    ELSIF v_action->>'action' = 'restore' THEN
+      v_previous := v_action->'previous_data';
+      IF v_previous IS NULL OR jsonb_typeof(v_previous) <> 'object' THEN
+        CONTINUE;
+      END IF;
+
+      SELECT string_agg(format('%I = r.%I', key, key), ', ')
+      INTO v_set_clause
+      FROM jsonb_object_keys(v_previous) AS key;
+
+      IF v_set_clause IS NULL THEN
+        CONTINUE;
+      END IF;
+
+      -- jsonb_populate_record로 컬럼 타입에 맞게 변환
+      EXECUTE format(
+        'UPDATE %I AS t SET %s FROM jsonb_populate_record(NULL::%I, $1) AS r WHERE t.id = $2',
+        v_table, v_set_clause, v_table
+      )
+      USING v_previous, v_record_id;
+      v_count := v_count + 1;
+    END IF;
+  END LOOP;
+
+  RETURN v_count;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION rollback_actions(JSONB) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION rollback_actions(JSONB) TO service_role;
@@ -0,0 +1,79 @@
+-- =====================================================
+-- Migration: 크레딧 차감 + 트랜잭션 로깅 단일 RPC
+-- 문제: Worker fallback 경로가 SELECT → UPDATE → SELECT → INSERT (4 왕복)
+-- 해결: 차감과 credit_transactions 기록을 하나의 트랜잭션으로 처리 (1 왕복)
+-- =====================================================
+
+/**
+ * deduct_credit_and_log: 크레딧 차감 후 트랜잭션 기록
+ * - Row-level lock으로 동시성 제어
+ * - 추가 크레딧(credits)이 있으면 우선 차감, 없으면 credits_used_this_month 증가
+ * - 차감 후 잔액을 balance_after로 기록
+ * - service_role 전용 (PUBLIC/anon/authenticated 실행 권한 회수)
+ *
+ * @param p_user_id: public.users의 ID
+ * @param p_amount: 차감할 크레딧 수
+ * @param p_description: 트랜잭션 설명
+ * @param p_candidate_id: 관련 후보자 ID (옵션)
+ * @returns: 차감 후 credits 잔액 (사용자가 없으면 NULL)
+ */
+CREATE OR REPLACE FUNCTION deduct_credit_and_log(
+  p_user_id UUID,
+  p_amount INT DEFAULT 1,
+  p_description TEXT DEFAULT '',
+  p_candidate_id UUID DEFAULT NULL
+)
+RETURNS INT
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+  v_credits INT;
+  v_new_balance INT;
+BEGIN
+  SELECT credits
+  INTO v_credits
+  FROM users
+  WHERE id = p_user_id
+  FOR UPDATE;
+
+  IF NOT FOUND THEN
+    RETURN NULL;
+  END IF;
+
+  IF COALESCE(v_credits, 0) > 0 THEN
+    -- 추가 크레딧에서 차감
+    UPDATE users
+    SET credits = credits - p_amount
+    WHERE id = p_user_id
+    RETURNING credits INTO v_new_balance;
+  ELSE
+    -- 기본 크레딧 사용량 증가
+    UPDATE users
+    SET credits_used_this_month = COALESCE(credits_used_this_month, 0) + p_amount
+    WHERE id = p_user_id
+    RETURNING credits INTO v_new_balance;
+  END IF;
+
+  INSERT INTO credit_transactions (
+    user_id,
+    type,
+    amount,
+    balance_after,
+    description,
+    candidate_id
+  ) VALUES (
+    p_user_id,
+    'usage',
+    -p_amount,
+    COALESCE(v_new_balance, 0),
+    p_description,
+    p_candidate_id
+  );
+
+  RETURN COALESCE(v_new_balance, 0);
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION deduct_credit_and_log(UUID, INT, TEXT, UUID) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION deduct_credit_and_log(UUID, INT, TEXT, UUID) TO service_role;
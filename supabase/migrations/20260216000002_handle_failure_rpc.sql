@@ -0,0 +1,66 @@
+-- =====================================================
+-- Migration: 파이프라인 실패 처리 단일 RPC
+-- 문제: handle_pipeline_failure가 UPDATE 3회 (Soft Delete, 이전 버전 복원, job 상태)
+--       순차 호출 → 3 왕복 + 중간 실패 시 부분 복원 상태
+-- 해결: 하나의 트랜잭션에서 세 UPDATE를 실행
+-- =====================================================
+
+/**
+ * handle_failure: 실패한 후보자 정리
+ * - 현재 후보자 Soft Delete (status='deleted', 에러 코드/메시지 기록)
+ * - parent_id가 있으면 이전 버전 is_latest=TRUE로 복원
+ * - processing_jobs 실패 상태 기록
+ * - service_role 전용 (PUBLIC/anon/authenticated 실행 권한 회수)
+ *
+ * @param p_candidate_id: 실패한 후보자 ID
+ * @param p_parent_id: 복원할 이전 버전 ID (옵션)
+ * @param p_job_id: processing_jobs ID
+ * @param p_error_code: 에러 코드 (PARSE_FAILED 등)
+ * @param p_error_message: 사용자용 에러 메시지
+ * @returns: {deleted, restored}
+ */
+CREATE OR REPLACE FUNCTION handle_failure(
+  p_candidate_id UUID,
+  p_parent_id UUID,
+  p_job_id UUID,
+  p_error_code TEXT,
+  p_error_message TEXT
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+  v_deleted BOOLEAN := FALSE;
+  v_restored BOOLEAN := FALSE;
+BEGIN
+  UPDATE candidates
+  SET status = 'deleted',
+      error_code = p_error_code,
+      error_message = p_error_message,
+      deleted_at = NOW()
+  WHERE id = p_candidate_id;
+  v_deleted := FOUND;
+
+  IF p_parent_id IS NOT NULL THEN
+    UPDATE candidates
+    SET is_latest = TRUE
+    WHERE id = p_parent_id;
+    v_restored := FOUND;
+  END IF;
+
+  UPDATE processing_jobs
+  SET status = 'failed',
+      error_code = p_error_code,
+      error_message = p_error_message
+  WHERE id = p_job_id;
+
+  RETURN jsonb_build_object(
+    'deleted', v_deleted,
+    'restored', v_restored
+  );
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION handle_failure(UUID, UUID, UUID, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION handle_failure(UUID, UUID, UUID, TEXT, TEXT) TO service_role;
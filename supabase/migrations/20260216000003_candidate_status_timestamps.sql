@@ -0,0 +1,34 @@
+-- =====================================================
+-- Migration: 후보자 상태 전이 타임스탬프를 DB에서 기록
+-- 문제: Worker가 datetime.utcnow()로 타임스탬프를 만들어 전송 (DB 시계와 불일치)
+-- 해결: status 변경 시 BEFORE UPDATE 트리거가 NOW()로 기록
+-- =====================================================
+
+/**
+ * stamp_candidate_status_timestamps: status 전이 시 단계별 타임스탬프 기록
+ * - parsed             → parsing_completed_at
+ * - analyzed/completed → analysis_completed_at
+ * - deleted            → deleted_at
+ */
+CREATE OR REPLACE FUNCTION stamp_candidate_status_timestamps()
+RETURNS TRIGGER AS $$
+BEGIN
+  IF NEW.status IS DISTINCT FROM OLD.status THEN
+    IF NEW.status = 'parsed' THEN
+      NEW.parsing_completed_at := NOW();
+    ELSIF NEW.status IN ('analyzed', 'completed') THEN
+      NEW.analysis_completed_at := NOW();
+    ELSIF NEW.status = 'deleted' THEN
+      NEW.deleted_at := NOW();
+    END IF;
+  END IF;
+
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS candidates_status_timestamps ON candidates;
+
+CREATE TRIGGER candidates_status_timestamps
+  BEFORE UPDATE OF status ON candidates
+  FOR EACH ROW EXECUTE FUNCTION stamp_candidate_status_timestamps();
@@ -0,0 +1,83 @@
+-- =====================================================
+-- Migration: Soft Delete + 이전 버전 복원을 단일 UPDATE로 처리
+-- 문제: 업데이트 실패 복구 시 candidates UPDATE 2회 (현재 삭제, 이전 버전 복원)
+-- 해결: WHERE id IN (current, parent) + CASE 식으로 한 번에 갱신
+-- =====================================================
+
+/**
+ * restore_and_delete: 현재 후보자 Soft Delete + 이전 버전 is_latest 복원
+ *
+ * - service_role 전용 (PUBLIC/anon/authenticated 실행 권한 회수)
+ *
+ * @param p_current_id: 실패한 후보자 ID (삭제 대상)
+ * @param p_parent_id: 이전 버전 후보자 ID (복원 대상, 옵션)
+ * @param p_error_code: 에러 코드
+ * @param p_error_message: 사용자용 에러 메시지
+ * @returns: {deleted, restored}
+ */
+CREATE OR REPLACE FUNCTION restore_and_delete(
+  p_current_id UUID,
+  p_parent_id UUID,
+  p_error_code TEXT,
+  p_error_message TEXT
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+  v_updated UUID[];
+BEGIN
+  WITH updated AS (
+    UPDATE candidates
+    SET is_latest = CASE WHEN id = p_parent_id THEN TRUE ELSE is_latest END,
+        status = CASE WHEN id = p_current_id THEN 'deleted'::candidate_status ELSE status END,
+        error_code = CASE WHEN id = p_current_id THEN p_error_code ELSE error_code END,
+        error_message = CASE WHEN id = p_current_id THEN p_error_message ELSE error_message END,
+        deleted_at = CASE WHEN id = p_current_id THEN NOW() ELSE deleted_at END
+    WHERE id IN (p_current_id, p_parent_id)
+    RETURNING id
+  )
+  SELECT array_agg(id) INTO v_updated FROM updated;
+
+  RETURN jsonb_build_object(
+    'deleted', p_current_id = ANY(COALESCE(v_updated, '{}')),
+    'restored', p_parent_id IS NOT NULL AND p_parent_id = ANY(COALESCE(v_updated, '{}'))
+  );
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION restore_and_delete(UUID, UUID, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION restore_and_delete(UUID, UUID, TEXT, TEXT) TO service_role;
+
+/**
+ * handle_failure: candidates 갱신을 restore_and_delete 단일 UPDATE로 교체
+ */
+CREATE OR REPLACE FUNCTION handle_failure(
+  p_candidate_id UUID,
+  p_parent_id UUID,
+  p_job_id UUID,
+  p_error_code TEXT,
+  p_error_message TEXT
+)
+RETURNS JSONB
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+  v_result JSONB;
+BEGIN
+  v_result := restore_and_delete(p_candidate_id, p_parent_id, p_error_code, p_error_message);
+
+  UPDATE processing_jobs
+  SET status = 'failed',
+      error_code = p_error_code,
+      error_message = p_error_message
+  WHERE id = p_job_id;
+
+  RETURN v_result;
+END;
+$$;
+
+REVOKE EXECUTE ON FUNCTION handle_failure(UUID, UUID, UUID, TEXT, TEXT) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION handle_failure(UUID, UUID, UUID, TEXT, TEXT) TO service_role;